@@ -0,0 +1,59 @@
+"""Benchmark messages/second through MarketDataStream from a local FakeFeed.
+
+Measures decoding, sequence checking, queueing and orderbook updates on the
+consumer side with no network involved.
+
+    python -m benchmarks.bench_market_data_stream --messages 50000 --tickers 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.kalshi_client import KalshiClient
+from kalshi_tracker.kalshi.client.market_data_stream import (
+    MarketDataStream,
+    apply_orderbook_message,
+)
+from kalshi_tracker.kalshi.testing.fake_feed import FakeFeed
+
+if TYPE_CHECKING:
+    from kalshi_tracker.kalshi.orderbook import OrderBook
+
+
+async def consume(stream: MarketDataStream, n_messages: int) -> float:
+    """Apply ``n_messages`` to orderbooks and return the throughput."""
+    books: dict[str, OrderBook] = {}
+    async with stream:
+        start = time.perf_counter()
+        for _ in range(n_messages):
+            apply_orderbook_message(books, await stream.get())
+        return n_messages / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--tickers", type=int, default=500)
+    args = parser.parse_args()
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    signer = KalshiClient("https://localhost/trade-api/v2", "bench", private_key)
+    tickers = [f"FAKE-EVENT-{i:05d}" for i in range(args.tickers)]
+
+    with FakeFeed() as feed:
+        stream = MarketDataStream(signer, tickers, url=feed.url)
+        rate = asyncio.run(consume(stream, args.messages))
+
+    print(f"{rate:10.0f} msg/s over {args.tickers} tickers")
+    print(f"{stream.stats.sequence_gaps} sequence gaps, {stream.stats.dropped} dropped")
+
+
+if __name__ == "__main__":
+    main()
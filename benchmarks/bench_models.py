@@ -0,0 +1,81 @@
+"""Benchmark decoding a large page into dicts versus typed records.
+
+Builds a recorded ``get_trades`` or ``get_markets`` page and compares decode
+time and the memory the decoded records keep alive for the standard library's
+``json.loads``, the clients' JSON backend, and that backend followed by the
+typed records of ``kalshi_tracker.kalshi.models``.
+
+    python -m benchmarks.bench_models --records 200000 --key trades
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from kalshi_tracker.kalshi.client.json_codec import BACKEND, loads
+from kalshi_tracker.kalshi.models import decode_page
+from kalshi_tracker.kalshi.testing.fake_exchange import make_market, make_trade
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def record_page(key: str, n_records: int) -> bytes:
+    """Encode a page of ``n_records`` records as the exchange would send it."""
+    if key == "trades":
+        records = [
+            make_trade(i, f"FAKE-EVENT-{i % 1000:05d}") for i in range(n_records)
+        ]
+    else:
+        records = [make_market(f"FAKE-EVENT-{i:05d}") for i in range(n_records)]
+    return json.dumps({key: records, "cursor": ""}).encode()
+
+
+def measure(decode: Callable[[], Any]) -> tuple[float, int]:
+    """Return the seconds ``decode`` takes and the bytes its result retains."""
+    gc.collect()
+    start = time.perf_counter()
+    decode()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    result = decode()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--key", choices=["trades", "markets"], default="trades")
+    args = parser.parse_args()
+
+    raw = record_page(args.key, args.records)
+    baseline = measure(lambda: json.loads(raw)[args.key])
+    results = {
+        "json dicts": baseline,
+        f"{BACKEND} dicts": measure(lambda: loads(raw)[args.key]),
+        f"{BACKEND} records": measure(lambda: decode_page(raw, args.key)),
+    }
+
+    print(f"page of {args.records} {args.key}: {len(raw) / 1e6:.1f} MB of JSON")
+    for name, (seconds, retained) in results.items():
+        print(
+            f"{name:16} {seconds * 1000:8.1f} ms {retained / 1e6:8.1f} MB"
+            f"  saves {1 - seconds / baseline[0]:6.1%} time"
+            f" {1 - retained / baseline[1]:6.1%} memory",
+        )
+
+
+if __name__ == "__main__":
+    main()
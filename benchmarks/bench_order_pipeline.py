@@ -0,0 +1,82 @@
+"""Benchmark order throughput of single orders against the batched pipeline.
+
+Runs against a local ``FakeExchange`` that adds ``--latency`` seconds to every
+response, standing in for the round trip to the real exchange. Sending orders
+one ``create_order`` call at a time pays that round trip per order; the
+pipeline pays it per batch of 20 and keeps several batches in flight.
+
+    python -m benchmarks.bench_order_pipeline --orders 2000 --latency 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.order_pipeline import OrderPipeline
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def make_orders(n: int, prefix: str) -> list[dict]:
+    """Build ``n`` limit orders with distinct client order ids."""
+    return [
+        {
+            "ticker": f"FAKE-EVENT-{i % 100:05d}",
+            "client_order_id": f"{prefix}-{i}",
+            "side": "yes",
+            "action": "buy",
+            "count": 1,
+            "type": "limit",
+            "yes_price": 40,
+        }
+        for i in range(n)
+    ]
+
+
+def single_orders_per_second(client: ExchangeClient, n_orders: int) -> float:
+    """Time ``n_orders`` sequential ``create_order`` calls."""
+    start = time.perf_counter()
+    for order in make_orders(n_orders, "single"):
+        client.create_order(
+            ticker=order["ticker"],
+            client_order_id=order["client_order_id"],
+            side=order["side"],
+            action=order["action"],
+            count=order["count"],
+            order_type=order["type"],
+            yes_price=order["yes_price"],
+        )
+    return n_orders / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    with FakeExchange(n_markets=100, latency=args.latency) as exchange:
+        client = ExchangeClient(exchange.url, "bench", private_key)
+        client.rate_limiter = None
+
+        # single orders are slow, so time a slice of them
+        n_single = min(args.orders, 200)
+        rate = single_orders_per_second(client, n_single)
+        print(f"{'single orders':>20}: {rate:8.1f} orders/s")
+
+        pipeline = OrderPipeline(client, max_workers=args.workers)
+        report = pipeline.create_orders(make_orders(args.orders, "batched"))
+        print(f"{'batched pipeline':>20}: {report.throughput:8.1f} orders/s")
+        print(json.dumps(report.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
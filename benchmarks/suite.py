@@ -0,0 +1,322 @@
+"""Run the benchmark suite and write the results as JSON.
+
+Every client benchmark runs against a local ``FakeExchange``, optionally with
+added ``--latency`` per response, so results depend only on this machine and
+this commit. Results are written to ``--output`` with the commit they were
+measured at; ``--compare`` prints the change against an earlier results file.
+
+    python -m benchmarks.suite --output bench.json
+    git checkout other-branch
+    python -m benchmarks.suite --output other.json --compare bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi import factory, scanner
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.rate_limiter import RateLimiter
+from kalshi_tracker.kalshi.testing import FakeExchange
+from kalshi_tracker.v1.expected_value import compute_wager_expectations
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WAGER_SIZES = (5, 50, 500, 5000)
+HIGHER = "higher"
+LOWER = "lower"
+
+
+def best_of(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the fastest of ``repeat`` timed calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def result(value: float, unit: str, better: str, **extra: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Build one result entry."""
+    return {"value": value, "unit": unit, "better": better, **extra}
+
+
+def make_client(
+    exchange: FakeExchange,
+    private_key: rsa.RSAPrivateKey,
+) -> ExchangeClient:
+    """Create a client of ``exchange`` without a rate limit."""
+    client = ExchangeClient(exchange.url, "bench", private_key)
+    client.rate_limiter = None
+    return client
+
+
+# benchmarks
+
+
+def bench_signing(private_key: rsa.RSAPrivateKey, n: int) -> dict[str, Any]:
+    """Time signing the headers of one request."""
+    client = ExchangeClient("http://localhost", "bench", private_key)
+    seconds = best_of(
+        lambda: [client.request_headers("GET", "/markets") for _ in range(n)],
+    )
+    return {"signing": result(seconds / n * 1e6, "us/request", LOWER)}
+
+
+def bench_throughput(
+    private_key: rsa.RSAPrivateKey,
+    n: int,
+    latency: float,
+) -> dict[str, Any]:
+    """Measure sequential and concurrent end-to-end requests per second."""
+    with FakeExchange(n_markets=n, latency=latency) as exchange:
+        client = make_client(exchange, private_key)
+        seconds = best_of(
+            lambda: [client.get_exchange_status() for _ in range(n // 10)],
+        )
+        sequential = n // 10 / seconds
+
+        tickers = [m["ticker"] for m in exchange.markets]
+        requests_before = exchange.requests
+        seconds = best_of(lambda: client.get_markets_by_tickers(tickers), repeat=1)
+        lookups = len(tickers) / seconds
+        lookup_requests = exchange.requests - requests_before
+    return {
+        "throughput.sequential": result(sequential, "requests/s", HIGHER),
+        "throughput.market_lookup": result(
+            lookups,
+            "markets/s",
+            HIGHER,
+            requests=lookup_requests,
+        ),
+    }
+
+
+def bench_throttled(private_key: rsa.RSAPrivateKey, n: int) -> dict[str, Any]:
+    """Measure requests per second against an exchange that answers 429.
+
+    The exchange allows 20 requests a second while the client's limiter
+    starts at 100, so the client has to back off.
+    """
+    with FakeExchange(n_markets=10, rate_limit=20, retry_after=1) as exchange:
+        client = ExchangeClient(
+            exchange.url,
+            "bench",
+            private_key,
+            rate_limiter=RateLimiter(read_rate=100),
+        )
+        start = time.perf_counter()
+        for _ in range(n):
+            client.get_exchange_status()
+        seconds = time.perf_counter() - start
+    return {
+        "throttled.throughput": result(
+            n / seconds,
+            "requests/s",
+            HIGHER,
+            throttled=exchange.throttled,
+            retries=client.retry_metrics.total_retries,
+        ),
+    }
+
+
+def bench_pagination(
+    private_key: rsa.RSAPrivateKey,
+    n: int,
+    latency: float,
+) -> dict[str, Any]:
+    """Measure sweeping every market page by page, with and without prefetch."""
+    results = {}
+    with FakeExchange(n_markets=n, n_trades=0, latency=latency) as exchange:
+        client = make_client(exchange, private_key)
+
+        def sweep(*, prefetch: bool) -> int:
+            return sum(1 for _ in client.iter_markets(page_size=100, prefetch=prefetch))
+
+        for prefetch in (False, True):
+            seconds = best_of(partial(sweep, prefetch=prefetch), repeat=1)
+            name = "prefetch" if prefetch else "sequential"
+            results[f"pagination.{name}"] = result(n / seconds, "records/s", HIGHER)
+    return results
+
+
+def bench_scanner(
+    private_key: rsa.RSAPrivateKey,
+    n: int,
+    latency: float,
+) -> dict[str, Any]:
+    """Time scanning every market against a prediction for each.
+
+    About one market in ten has an edge and has its orderbook fetched.
+    """
+    rng = np.random.default_rng(0)
+    with FakeExchange(n_markets=n, n_trades=0, latency=latency) as exchange:
+        client = make_client(exchange, private_key)
+        predictions = pd.DataFrame(
+            {
+                "symbol": [m["ticker"] for m in exchange.markets],
+                "myBet": rng.uniform(0.36, 0.47, n),
+            },
+        )
+        found = []
+        seconds = best_of(
+            lambda: found.append(len(scanner.scan(client, predictions))),
+            repeat=1,
+        )
+    return {
+        "scanner.universe": result(seconds, "s", LOWER, markets=n, edges=found[0]),
+    }
+
+
+def bench_wager_expectations(sizes: tuple[int, ...]) -> dict[str, Any]:
+    """Time ``compute_wager_expectations`` over growing books of bets."""
+    rng = np.random.default_rng(0)
+    results = {}
+    for n in sizes:
+        probabilities = rng.uniform(0.05, 0.95, n)
+        prices = rng.uniform(0.05, 0.95, n)
+        qtys = rng.integers(1, 10, n)
+        seconds = best_of(
+            partial(compute_wager_expectations, probabilities, prices, qtys),
+        )
+        results[f"wager_expectations.n{n}"] = result(seconds * 1000, "ms", LOWER)
+    return results
+
+
+def bench_cold_start(private_key: rsa.RSAPrivateKey) -> dict[str, Any]:
+    """Time importing the package and loading the API key, cold and cached.
+
+    The import is timed in a fresh interpreter, start-up included.
+    """
+    import_seconds = best_of(
+        # the interpreter running the suite, with a fixed argument list
+        lambda: subprocess.run(  # noqa: S603
+            [sys.executable, "-c", "import kalshi_tracker.kalshi"],
+            check=True,
+        ),
+        repeat=5,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        key_file = Path(tmp) / "key.pem"
+        key_file.write_bytes(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ),
+        )
+        parse = best_of(lambda: factory.load_private_key_from_file(key_file))
+        factory.get_private_key(key_file)
+        cached = best_of(lambda: factory.get_private_key(key_file))
+        factory.clear_cache()
+    return {
+        "cold_start.import": result(import_seconds * 1000, "ms", LOWER),
+        "cold_start.key_parse": result(parse * 1000, "ms", LOWER),
+        "cold_start.key_cached": result(cached * 1e6, "us", LOWER),
+    }
+
+
+# running and comparing
+
+
+def git_commit() -> str | None:
+    """Get the checked out commit, if this is a git checkout."""
+    try:
+        # a fixed argument list, nothing comes from the user
+        out = subprocess.run(  # noqa: S603
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run(*, quick: bool = False, latency: float = 0.0) -> dict[str, Any]:
+    """Run every benchmark and return the results with their context."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    scale = 1 if quick else 5
+    results: dict[str, Any] = {}
+    results.update(bench_cold_start(private_key))
+    results.update(bench_signing(private_key, 50 * scale))
+    results.update(bench_throughput(private_key, 200 * scale, latency))
+    results.update(bench_throttled(private_key, 40 * scale))
+    results.update(bench_pagination(private_key, 1000 * scale, latency))
+    results.update(bench_scanner(private_key, 2000 * scale, latency))
+    results.update(
+        bench_wager_expectations(WAGER_SIZES[:-1] if quick else WAGER_SIZES),
+    )
+    return {
+        "commit": git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "latency": latency,
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Describe each result's change against a baseline run.
+
+    A positive change is an improvement, whichever direction is better.
+    """
+    lines = []
+    for name, new in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None or not old["value"]:
+            continue
+        change = new["value"] / old["value"] - 1
+        if new["better"] == LOWER:
+            change = old["value"] / new["value"] - 1
+        lines.append(
+            f"{name:36} {old['value']:12.2f} -> {new['value']:12.2f}"
+            f" {new['unit']:12} {change:+7.1%}",
+        )
+    return lines
+
+
+def main() -> None:
+    """Run the suite, write the results and print them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("bench.json"))
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--quick", action="store_true")
+    args = parser.parse_args()
+
+    report = run(quick=args.quick, latency=args.latency)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"commit {report['commit']}, results in {args.output}")
+    for name, entry in report["results"].items():
+        print(f"{name:36} {entry['value']:12.2f} {entry['unit']}")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\nagainst commit {baseline['commit']}:")
+        print("\n".join(compare(report, baseline)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,35 @@
-"""Kalshi module for the Kalshi API."""
+"""Kalshi module for the Kalshi API.
 
-from .factory import get_kalshi
+Submodules and the factory functions are imported on first use, so that
+importing this package, e.g. for its settings, does not load ``requests``
+and ``cryptography``.
+"""
 
-__all__ = ["get_kalshi"]
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# lazily imported attributes and the module defining each
+_LAZY = {
+    "get_kalshi": ".factory",
+    "clear_cache": ".factory",
+}
+
+__all__ = ["clear_cache", "get_kalshi"]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a lazily loaded attribute on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including the lazy ones."""
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,237 @@
+"""Incremental OHLCV candles built from trades as they arrive."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from kalshi_tracker.storage.records import trade_ts
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    Sink = Callable[[str, str, np.ndarray], None]
+
+# bar length in seconds by interval name
+INTERVALS = {"1s": 1, "1m": 60, "1h": 3600, "1d": 86_400}
+DEFAULT_INTERVALS = tuple(INTERVALS)
+# finished bars kept per ticker and interval
+DEFAULT_CAPACITY = 1440
+
+CANDLE_DTYPE = np.dtype(
+    [
+        ("start", "<i8"),
+        ("open", "<i2"),
+        ("high", "<i2"),
+        ("low", "<i2"),
+        ("close", "<i2"),
+        ("volume", "<i8"),
+        ("vwap", "<f8"),
+    ],
+)
+
+
+class _Series:
+    """The open bar and a ring of finished bars for one ticker and interval."""
+
+    __slots__ = (
+        "bars",
+        "close",
+        "count",
+        "floor",
+        "high",
+        "lost",
+        "low",
+        "notional",
+        "open",
+        "pending",
+        "seconds",
+        "start",
+        "volume",
+    )
+
+    def __init__(self, seconds: int, capacity: int) -> None:
+        self.seconds = seconds
+        self.bars = np.zeros(capacity, dtype=CANDLE_DTYPE)
+        # finished bars ever written, and how many of the newest are unflushed
+        self.count = 0
+        self.pending = 0
+        self.lost = 0
+        self.start: int | None = None
+        # trades before this time belong to a bar that is already finished
+        self.floor = 0
+        self.open = self.high = self.low = self.close = 0
+        self.volume = self.notional = 0
+
+    def accepts(self, ts: int) -> bool:
+        """Whether a trade at ``ts`` is not older than the open bar."""
+        return ts >= self.floor
+
+    def add(self, ts: int, price: int, size: int) -> None:
+        """Add a trade that the series accepts."""
+        start = ts - ts % self.seconds
+        if self.start is None or start > self.start:
+            self.finish()
+            self.start = self.floor = start
+            self.open = self.high = self.low = price
+            self.volume = self.notional = 0
+
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        self.close = price
+        self.volume += size
+        self.notional += price * size
+
+    def finish(self) -> None:
+        """Move the open bar into the ring."""
+        if self.start is None:
+            return
+        self.bars[self.count % len(self.bars)] = self._record()
+        self.floor = self.start + self.seconds
+        self.start = None
+        self.count += 1
+        self.pending += 1
+        if self.pending > len(self.bars):
+            # the oldest unflushed bar was overwritten
+            self.pending = len(self.bars)
+            self.lost += 1
+
+    def last(self, n: int) -> np.ndarray:
+        """Copy the newest ``n`` finished bars, oldest first."""
+        capacity = len(self.bars)
+        n = min(n, self.count, capacity)
+        end = self.count % capacity
+        if n <= end:
+            return self.bars[end - n : end].copy()
+        return np.concatenate((self.bars[capacity - (n - end) :], self.bars[:end]))
+
+    def current(self) -> np.ndarray:
+        """Return the open bar as a one-record array, empty when there is none."""
+        if self.start is None:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        return np.array([self._record()], dtype=CANDLE_DTYPE)
+
+    def _record(self) -> tuple:
+        vwap = self.notional / self.volume if self.volume else self.close
+        return (
+            self.start,
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            vwap,
+        )
+
+
+class CandleAggregator:
+    """OHLCV and VWAP bars for many tickers, updated one trade at a time.
+
+    Each trade costs a few scalar updates per interval. A bar is finished by
+    the first trade of a later bar (or by ``advance``) and stored in a ring
+    of ``capacity`` bars, so memory per ticker stays bounded. Intervals with
+    no trades produce no bar. ``flush`` hands the bars finished since the
+    previous flush to a sink, e.g. one writing them to disk.
+
+    Trades must arrive oldest first per ticker; a trade that belongs to an
+    already finished bar is counted in ``late`` and ignored. ``get_trades``
+    pages list the newest trades first, so reverse them before adding.
+    """
+
+    def __init__(
+        self,
+        intervals: Iterable[str] = DEFAULT_INTERVALS,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """Initialize an aggregator for the given interval names."""
+        self.intervals = list(intervals)
+        unknown = set(self.intervals) - set(INTERVALS)
+        if unknown:
+            msg = f"Unknown intervals {sorted(unknown)}."
+            raise ValueError(msg)
+        self.capacity = capacity
+        self.late = 0
+        self._series: dict[str, list[_Series]] = {}
+
+    @property
+    def lost(self) -> int:
+        """Finished bars overwritten in their ring before they were flushed."""
+        return sum(s.lost for series in self._series.values() for s in series)
+
+    @property
+    def tickers(self) -> list[str]:
+        """Tickers that have seen a trade."""
+        return list(self._series)
+
+    # updates
+
+    def update(self, ticker: str, ts: int, price: int, count: int = 1) -> None:
+        """Add one trade of ``count`` contracts at ``price`` cents."""
+        series = self._series.get(ticker)
+        if series is None:
+            series = self._series[ticker] = [
+                _Series(INTERVALS[i], self.capacity) for i in self.intervals
+            ]
+        if not all(s.accepts(ts) for s in series):
+            self.late += 1
+            return
+        for s in series:
+            s.add(ts, price, count)
+
+    def add_trade(self, trade: dict[str, Any]) -> None:
+        """Add a ``get_trades`` record or the ``msg`` of a stream trade message."""
+        ticker = trade.get("ticker") or trade["market_ticker"]
+        self.update(ticker, trade_ts(trade), trade["yes_price"], trade["count"])
+
+    def add_trades(self, trades: Iterable[dict[str, Any]]) -> None:
+        """Add trade records, oldest first."""
+        for trade in trades:
+            self.add_trade(trade)
+
+    def advance(self, ts: int) -> None:
+        """Finish every open bar that ended before ``ts``.
+
+        Call it on a clock tick so quiet tickers still emit their bars.
+        """
+        for series in self._series.values():
+            for s in series:
+                if s.start is not None and s.start + s.seconds <= ts:
+                    s.finish()
+
+    # reading
+
+    def bars(
+        self,
+        ticker: str,
+        interval: str,
+        *,
+        include_current: bool = False,
+    ) -> np.ndarray:
+        """Get the retained finished bars of a ticker, oldest first."""
+        series = self._series.get(ticker)
+        if series is None:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        s = series[self.intervals.index(interval)]
+        bars = s.last(self.capacity)
+        if include_current:
+            bars = np.concatenate((bars, s.current()))
+        return bars
+
+    def flush(self, sink: Sink, *, finish: bool = False) -> int:
+        """Pass the bars finished since the last flush to ``sink``.
+
+        ``sink`` is called as ``sink(ticker, interval, bars)``. With
+        ``finish`` the open bars are finished first, which is only right once
+        no more trades will arrive for them. Returns the number of bars.
+        """
+        flushed = 0
+        for ticker, series in self._series.items():
+            for interval, s in zip(self.intervals, series, strict=True):
+                if finish:
+                    s.finish()
+                if s.pending:
+                    sink(ticker, interval, s.last(s.pending))
+                    flushed += s.pending
+                    s.pending = 0
+        return flushed
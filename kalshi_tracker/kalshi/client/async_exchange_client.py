@@ -0,0 +1,268 @@
+"""An asyncio client for the authenticated Kalshi Exchange API endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+from .async_kalshi_client import AsyncKalshiClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def _params(params: dict[str, Any]) -> dict[str, Any]:
+    """Drop the parameters that were not given."""
+    return {k: v for k, v in params.items() if v is not None}
+
+
+class AsyncExchangeClient(AsyncKalshiClient):
+    """An asyncio client for the authenticated Kalshi Exchange API endpoints.
+
+    Mirrors ``ExchangeClient``; every endpoint method is a coroutine, so many
+    requests can be in flight at once.
+    """
+
+    exchange_url = "/exchange"
+    markets_url = "/markets"
+    events_url = "/events"
+    series_url = "/series"
+    portfolio_url = "/portfolio"
+
+    async def get_exchange_status(self) -> Any:  # noqa: ANN401
+        """Get the status of the exchange."""
+        return await self.get(self.exchange_url + "/status")
+
+    # market endpoints!
+
+    async def get_markets(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        event_ticker: str | None = None,
+        series_ticker: str | None = None,
+        max_close_ts: int | None = None,
+        min_close_ts: int | None = None,
+        status: str | None = None,
+        tickers: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get a list of markets."""
+        params = _params(
+            {
+                "limit": limit,
+                "cursor": cursor,
+                "event_ticker": event_ticker,
+                "series_ticker": series_ticker,
+                "max_close_ts": max_close_ts,
+                "min_close_ts": min_close_ts,
+                "status": status,
+                "tickers": tickers,
+            },
+        )
+        return await self.get(self.markets_url, params=params)
+
+    async def get_market(self, ticker: str) -> Any:  # noqa: ANN401
+        """Get a specific market."""
+        return await self.get(self.markets_url + "/" + ticker)
+
+    async def get_event(self, event_ticker: str) -> Any:  # noqa: ANN401
+        """Get a specific event."""
+        return await self.get(self.events_url + "/" + event_ticker)
+
+    async def get_series(self, series_ticker: str) -> Any:  # noqa: ANN401
+        """Get a specific series."""
+        return await self.get(self.series_url + "/" + series_ticker)
+
+    async def get_market_history(
+        self,
+        ticker: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        max_ts: int | None = None,
+        min_ts: int | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get the history of a specific market."""
+        params = _params(
+            {"limit": limit, "cursor": cursor, "max_ts": max_ts, "min_ts": min_ts},
+        )
+        return await self.get(
+            self.markets_url + "/" + ticker + "/history",
+            params=params,
+        )
+
+    async def get_orderbook(
+        self,
+        ticker: str,
+        depth: int | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get the orderbook of a specific market."""
+        return await self.get(
+            self.markets_url + "/" + ticker + "/orderbook",
+            params=_params({"depth": depth}),
+        )
+
+    async def get_orderbooks(
+        self,
+        tickers: Iterable[str],
+        depth: int | None = None,
+    ) -> dict[str, Any]:
+        """Get the orderbooks of many markets concurrently, keyed by ticker."""
+        tickers = list(tickers)
+        books = await asyncio.gather(
+            *(self.get_orderbook(ticker, depth=depth) for ticker in tickers),
+        )
+        return dict(zip(tickers, books, strict=True))
+
+    async def get_trades(
+        self,
+        ticker: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        max_ts: int | None = None,
+        min_ts: int | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get the trades of a specific market."""
+        params = _params(
+            {
+                "ticker": ticker,
+                "limit": limit,
+                "cursor": cursor,
+                "max_ts": max_ts,
+                "min_ts": min_ts,
+            },
+        )
+        return await self.get(self.markets_url + "/trades", params=params)
+
+    # portfolio endpoints!
+
+    async def get_balance(self) -> Any:  # noqa: ANN401
+        """Get the balance of the user."""
+        return await self.get(self.portfolio_url + "/balance")
+
+    async def create_order(
+        self,
+        ticker: str,
+        client_order_id: str,
+        side: str,
+        action: str,
+        count: int,
+        order_type: str,
+        yes_price: int | None = None,
+        no_price: int | None = None,
+        expiration_ts: int | None = None,
+        sell_position_floor: int | None = None,
+        buy_max_cost: int | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Create an order."""
+        relevant_params = {
+            k: v for k, v in locals().items() if k != "self" and v is not None
+        }
+        return await self.post(
+            path=self.portfolio_url + "/orders",
+            body=json.dumps(relevant_params),
+        )
+
+    async def batch_create_orders(self, orders: list) -> Any:  # noqa: ANN401
+        """Create a list of orders."""
+        return await self.post(
+            path=self.portfolio_url + "/orders/batched",
+            body=json.dumps({"orders": orders}),
+        )
+
+    async def decrease_order(self, order_id: str, reduce_by: int) -> Any:  # noqa: ANN401
+        """Decrease the size of a specific order."""
+        return await self.post(
+            path=self.portfolio_url + "/orders/" + order_id + "/decrease",
+            body=json.dumps({"reduce_by": reduce_by}),
+        )
+
+    async def cancel_order(self, order_id: str) -> Any:  # noqa: ANN401
+        """Cancel a specific order."""
+        return await self.delete(
+            path=self.portfolio_url + "/orders/" + order_id + "/cancel",
+        )
+
+    async def batch_cancel_orders(self, order_ids: list) -> Any:  # noqa: ANN401
+        """Cancel a list of orders."""
+        return await self.delete(
+            path=self.portfolio_url + "/orders/batched",
+            body=json.dumps({"ids": order_ids}),
+        )
+
+    async def get_fills(
+        self,
+        ticker: str | None = None,
+        order_id: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get a list of fills for the user."""
+        params = _params(
+            {
+                "ticker": ticker,
+                "order_id": order_id,
+                "min_ts": min_ts,
+                "max_ts": max_ts,
+                "limit": limit,
+                "cursor": cursor,
+            },
+        )
+        return await self.get(self.portfolio_url + "/fills", params=params)
+
+    async def get_orders(
+        self,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get a list of orders for the user."""
+        params = _params(
+            {
+                "ticker": ticker,
+                "event_ticker": event_ticker,
+                "min_ts": min_ts,
+                "max_ts": max_ts,
+                "limit": limit,
+                "cursor": cursor,
+            },
+        )
+        return await self.get(self.portfolio_url + "/orders", params=params)
+
+    async def get_order(self, order_id: str) -> Any:  # noqa: ANN401
+        """Get a specific order."""
+        return await self.get(self.portfolio_url + "/orders/" + order_id)
+
+    async def get_positions(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        settlement_status: str | None = None,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get a list of positions for the user."""
+        params = _params(
+            {
+                "limit": limit,
+                "cursor": cursor,
+                "settlement_status": settlement_status,
+                "ticker": ticker,
+                "event_ticker": event_ticker,
+            },
+        )
+        return await self.get(self.portfolio_url + "/positions", params=params)
+
+    async def get_portfolio_settlements(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Get a list of settlements for the user."""
+        params = _params({"limit": limit, "cursor": cursor})
+        return await self.get(self.portfolio_url + "/settlements", params=params)
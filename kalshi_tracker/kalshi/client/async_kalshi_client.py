@@ -0,0 +1,164 @@
+"""An asyncio client that allows utils to call authenticated Kalshi API endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import TYPE_CHECKING, Any, Self
+
+import httpx
+
+from .http_error import HttpError
+from .json_codec import loads
+from .kalshi_client import THRESHOLD_IN_MILLISECONDS, TOO_MANY_REQUESTS
+from .rate_limiter import RateLimiter, parse_retry_after
+from .session import DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT
+from .signing import RequestSigner
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+DEFAULT_MAX_CONCURRENCY = DEFAULT_POOL_MAXSIZE
+
+
+def http2_available() -> bool:
+    """Check whether httpx can speak HTTP/2 (needs the ``h2`` package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncKalshiClient(RequestSigner):
+    """An asyncio client that allows utils to call authenticated Kalshi API endpoints.
+
+    Requests share one ``httpx.AsyncClient``, multiplexed over HTTP/2 when it is
+    available, and at most ``max_concurrency`` of them are in flight at once.
+    Requests are signed exactly like ``KalshiClient`` signs them.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        key_id: str,
+        private_key: rsa.RSAPrivateKey,
+        *,
+        user_id: str | None = None,
+        rate_limit_threshold: int = THRESHOLD_IN_MILLISECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        http2: bool | None = None,
+        timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        ``http2`` defaults to whether HTTP/2 support is installed. ``client`` is
+        an ``httpx.AsyncClient`` to share between several clients; one is
+        created when it is not given. ``rate_limiter`` works as it does for
+        ``KalshiClient`` and can be shared with synchronous clients.
+        """
+        self.host = host
+        self.key_id = key_id
+        self.private_key = private_key
+        self.user_id = user_id
+        self.rate_limit_threshold = rate_limit_threshold
+        if rate_limiter is None and rate_limit_threshold > 0:
+            rate_limiter = RateLimiter.from_threshold(rate_limit_threshold)
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+
+        if client is None:
+            connect_timeout, read_timeout = timeout
+            client = httpx.AsyncClient(
+                http2=http2_available() if http2 is None else http2,
+                limits=httpx.Limits(
+                    max_connections=max_concurrency,
+                    max_keepalive_connections=max_concurrency,
+                ),
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                headers={"Content-Type": "application/json"},
+            )
+        self.client = client
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def rate_limit(self, method: str = "GET") -> float:
+        """Wait until the rate limit allows a ``method`` request."""
+        if self.rate_limiter is None:
+            return 0.0
+        return await self.rate_limiter.acquire_async(method)
+
+    def record_rate_limit(self, method: str, response: httpx.Response) -> None:
+        """Feed the outcome of a request back into the rate limiter."""
+        if self.rate_limiter is None:
+            return
+        if response.status_code == TOO_MANY_REQUESTS:
+            self.rate_limiter.throttled(
+                method,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        else:
+            self.rate_limiter.succeeded(method)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Send an authenticated request.
+
+        Returns the response body. Raises an HttpError on non-2XX results.
+        """
+        async with self._semaphore:
+            await self.rate_limit(method)
+            response = await self.client.request(
+                method,
+                self.host + path,
+                headers=self.request_headers(method, path),
+                params=params,
+                content=body,
+            )
+        self.record_rate_limit(method, response)
+        self.raise_if_bad_response(response)
+        return loads(response.content)
+
+    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:  # noqa: ANN401
+        """GET from an authenticated Kalshi HTTP endpoint."""
+        return await self.request("GET", path, params=params)
+
+    async def post(self, path: str, body: str | None = None) -> Any:  # noqa: ANN401
+        """POST to an authenticated Kalshi HTTP endpoint."""
+        return await self.request("POST", path, body=body)
+
+    async def delete(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: str | None = None,
+    ) -> Any:  # noqa: ANN401
+        """DELETE from an authenticated Kalshi HTTP endpoint."""
+        return await self.request("DELETE", path, params=params, body=body)
+
+    def raise_if_bad_response(self, response: httpx.Response) -> None:
+        """Raise an HttpError if the response is not 2XX."""
+        if not response.is_success:
+            raise HttpError(response.reason_phrase, response.status_code)
+
+    async def aclose(self) -> None:
+        """Close the underlying connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter the client's context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the client on exit."""
+        await self.aclose()
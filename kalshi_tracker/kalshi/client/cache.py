@@ -0,0 +1,200 @@
+"""TTL/LRU response cache with request coalescing for reference endpoints."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# seconds a response stays fresh, by endpoint
+DEFAULT_TTLS = {
+    "market": 10.0,
+    "event": 60.0,
+    "series": 3600.0,
+}
+DEFAULT_TTL = 30.0
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class CacheStats:
+    """Counters describing how well the cache is doing."""
+
+    def __init__(self) -> None:
+        """Initialize all counters at zero."""
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered without a request of their own."""
+        lookups = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class _Entry:
+    __slots__ = ("endpoint", "expires_at", "size", "value")
+
+    def __init__(self, endpoint: str, value: Any, expires_at: float, size: int) -> None:  # noqa: ANN401
+        self.endpoint = endpoint
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class _InFlight:
+    __slots__ = ("done", "endpoint", "error", "stale", "value")
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        # set when the key is invalidated while it is being fetched
+        self.stale = False
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class ResponseCache:
+    """A thread-safe response cache with per-endpoint TTLs and LRU eviction.
+
+    Entries are evicted least recently used first once there are more than
+    ``max_entries`` of them or, when ``max_bytes`` is set, once their JSON
+    encoded size adds up to more than that. Concurrent lookups of the same key
+    that miss share a single fetch.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache. ``ttls`` override ``DEFAULT_TTLS``."""
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.size = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._in_flight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get_or_fetch(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[[], Any],
+    ) -> Any:  # noqa: ANN401
+        """Return the cached response for ``key`` or fetch and cache it."""
+        leader = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return entry.value
+                self._remove(key)
+                self.stats.expirations += 1
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self.stats.coalesced += 1
+            else:
+                self.stats.misses += 1
+                in_flight = self._in_flight[key] = _InFlight(endpoint)
+                leader = True
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        try:
+            value = fetch()
+        except BaseException as error:
+            in_flight.error = error
+            raise
+        else:
+            in_flight.value = value
+            if not in_flight.stale:
+                self.put(endpoint, key, value)
+            return value
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def put(self, endpoint: str, key: str, value: Any) -> None:  # noqa: ANN401
+        """Cache ``value`` under ``key`` with the TTL of ``endpoint``."""
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        size = len(json.dumps(value)) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(endpoint, value, self._clock() + ttl, size)
+            self.size += size
+            self._evict()
+
+    def invalidate(self, key: str | None = None, endpoint: str | None = None) -> int:
+        """Drop one key, every key of an endpoint, or with neither everything.
+
+        Keys are request paths, e.g. ``/markets/<ticker>``. Fetches of dropped
+        keys that are still in flight are not cached when they finish.
+        Returns the number of entries dropped.
+        """
+
+        def matches(k: str, entry_endpoint: str) -> bool:
+            if key is not None:
+                return k == key
+            return endpoint is None or entry_endpoint == endpoint
+
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if matches(k, e.endpoint)]
+            for k in keys:
+                self._remove(k)
+            for k, in_flight in self._in_flight.items():
+                if matches(k, in_flight.endpoint):
+                    in_flight.stale = True
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.invalidate()
+
+    def _remove(self, key: str) -> None:
+        self.size -= self._entries.pop(key).size
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.size > self.max_bytes and self._entries
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
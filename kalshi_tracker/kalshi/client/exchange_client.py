@@ -3,13 +3,49 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from .kalshi_client import KalshiClient
+from .pagination import iter_records
+from .session import DEFAULT_TIMEOUT
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import requests
     from cryptography.hazmat.primitives.asymmetric import rsa
-    from requests.models import Response
+
+    from .cache import ResponseCache
+    from .instrumentation import Sink
+    from .kalshi_client import Response
+    from .rate_limiter import RateLimiter
+    from .retry import CircuitBreaker, RetryPolicy
+
+# bounds on one ``get_markets(tickers=...)`` request
+MAX_TICKERS_PER_REQUEST = 100
+MAX_TICKERS_QUERY_LENGTH = 2000
+DEFAULT_LOOKUP_WORKERS = 4
+
+
+def chunk_tickers(
+    tickers: Iterable[str],
+    max_count: int = MAX_TICKERS_PER_REQUEST,
+    max_length: int = MAX_TICKERS_QUERY_LENGTH,
+) -> list[list[str]]:
+    """Split unique tickers into chunks that fit one comma-joined filter."""
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    length = 0
+    for ticker in dict.fromkeys(tickers):
+        if chunk and (len(chunk) >= max_count or length + 1 + len(ticker) > max_length):
+            chunks.append(chunk)
+            chunk, length = [], 0
+        length += len(ticker) + (1 if chunk else 0)
+        chunk.append(ticker)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
 
 
 class ExchangeClient(KalshiClient):
@@ -20,12 +56,29 @@ class ExchangeClient(KalshiClient):
         exchange_api_base: str,
         key_id: str,
         private_key: rsa.RSAPrivateKey,
+        session: requests.Session | None = None,
+        timeout: tuple[float, float] | None = DEFAULT_TIMEOUT,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        instrumentation: Sink | None = None,
     ) -> None:
-        """Initialize the client."""
+        """Initialize the client.
+
+        ``cache`` opts in to caching the market, event and series lookups.
+        The other arguments are those of ``KalshiClient``.
+        """
         super().__init__(
             exchange_api_base,
             key_id,
             private_key,
+            session=session,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            instrumentation=instrumentation,
         )
         self.key_id = key_id
         self.private_key = private_key
@@ -34,6 +87,13 @@ class ExchangeClient(KalshiClient):
         self.events_url = "/events"
         self.series_url = "/series"
         self.portfolio_url = "/portfolio"
+        self.cache = cache
+
+    def cached_get(self, endpoint: str, path: str) -> Response:
+        """GET through the response cache when the client has one."""
+        if self.cache is None:
+            return self.get(path)
+        return self.cache.get_or_fetch(endpoint, path, lambda: self.get(path))
 
     def logout(self) -> Response:
         """Logout the user."""
@@ -67,15 +127,53 @@ class ExchangeClient(KalshiClient):
     def get_market(self, ticker: str) -> Response:
         """Get a specific market."""
         market_url = self.get_market_url(ticker=ticker)
-        return self.get(market_url)
+        return self.cached_get("market", market_url)
+
+    def get_markets_by_tickers(
+        self,
+        tickers: Iterable[str],
+        max_workers: int = DEFAULT_LOOKUP_WORKERS,
+    ) -> dict[str, dict[str, Any]]:
+        """Get many markets by ticker with a handful of requests.
+
+        The tickers are split into chunks for the ``tickers`` filter of
+        ``get_markets`` and the chunks are fetched concurrently. Returns the
+        markets keyed by ticker; unknown tickers are left out. Fetched markets
+        also warm the response cache, if the client has one.
+        """
+        chunks = chunk_tickers(tickers)
+        if not chunks:
+            return {}
+
+        def fetch(chunk: list[str]) -> list[dict[str, Any]]:
+            return list(
+                self.iter_markets(
+                    page_size=len(chunk),
+                    tickers=",".join(chunk),
+                    prefetch=False,
+                ),
+            )
+
+        markets: dict[str, dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            for page in pool.map(fetch, chunks):
+                for market in page:
+                    markets[market["ticker"]] = market
+                    if self.cache is not None:
+                        self.cache.put(
+                            "market",
+                            self.get_market_url(market["ticker"]),
+                            {"market": market},
+                        )
+        return markets
 
     def get_event(self, event_ticker: str) -> Response:
         """Get a specific event."""
-        return self.get(self.events_url + "/" + event_ticker)
+        return self.cached_get("event", self.events_url + "/" + event_ticker)
 
     def get_series(self, series_ticker: str) -> Response:
         """Get a specific series."""
-        return self.get(self.series_url + "/" + series_ticker)
+        return self.cached_get("series", self.series_url + "/" + series_ticker)
 
     def get_market_history(
         self,
@@ -112,13 +210,6 @@ class ExchangeClient(KalshiClient):
     ) -> Response:
         """Get the trades of a specific market."""
         query_string = self.query_generation(params=dict(locals().items()))
-        if ticker is not None:
-            if len(query_string):
-                query_string += "&"
-            else:
-                query_string += "?"
-            query_string += "ticker=" + str(ticker)
-
         trades_url = self.markets_url + "/trades"
         return self.get(trades_url + query_string)
 
@@ -233,3 +324,167 @@ class ExchangeClient(KalshiClient):
         positions_url = self.portfolio_url + "/settlements"
         query_string = self.query_generation(params=dict(locals().items()))
         return self.get(positions_url + query_string)
+
+    # streaming iterators!
+    #
+    # These walk every page of a cursor-paginated endpoint, re-sending the
+    # filters with each cursor, and yield one record at a time. The next page
+    # is fetched in the background while the current one is consumed.
+
+    def iter_markets(
+        self,
+        page_size: int | None = None,
+        event_ticker: str | None = None,
+        series_ticker: str | None = None,
+        max_close_ts: int | None = None,
+        min_close_ts: int | None = None,
+        status: str | None = None,
+        tickers: str | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every market matching the filters."""
+        return iter_records(
+            lambda cursor: self.get_markets(
+                limit=page_size,
+                cursor=cursor,
+                event_ticker=event_ticker,
+                series_ticker=series_ticker,
+                max_close_ts=max_close_ts,
+                min_close_ts=min_close_ts,
+                status=status,
+                tickers=tickers,
+            ),
+            "markets",
+            prefetch=prefetch,
+        )
+
+    def iter_market_history(
+        self,
+        ticker: str,
+        page_size: int | None = None,
+        max_ts: int | None = None,
+        min_ts: int | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the whole history of a specific market."""
+        return iter_records(
+            lambda cursor: self.get_market_history(
+                ticker,
+                limit=page_size,
+                cursor=cursor,
+                max_ts=max_ts,
+                min_ts=min_ts,
+            ),
+            "history",
+            prefetch=prefetch,
+        )
+
+    def iter_trades(
+        self,
+        ticker: str | None = None,
+        page_size: int | None = None,
+        max_ts: int | None = None,
+        min_ts: int | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every trade matching the filters."""
+        return iter_records(
+            lambda cursor: self.get_trades(
+                ticker=ticker,
+                limit=page_size,
+                cursor=cursor,
+                max_ts=max_ts,
+                min_ts=min_ts,
+            ),
+            "trades",
+            prefetch=prefetch,
+        )
+
+    def iter_fills(
+        self,
+        ticker: str | None = None,
+        order_id: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        page_size: int | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every fill of the user matching the filters."""
+        return iter_records(
+            lambda cursor: self.get_fills(
+                ticker=ticker,
+                order_id=order_id,
+                min_ts=min_ts,
+                max_ts=max_ts,
+                limit=page_size,
+                cursor=cursor,
+            ),
+            "fills",
+            prefetch=prefetch,
+        )
+
+    def iter_orders(
+        self,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        page_size: int | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every order of the user matching the filters."""
+        return iter_records(
+            lambda cursor: self.get_orders(
+                ticker=ticker,
+                event_ticker=event_ticker,
+                min_ts=min_ts,
+                max_ts=max_ts,
+                limit=page_size,
+                cursor=cursor,
+            ),
+            "orders",
+            prefetch=prefetch,
+        )
+
+    def iter_positions(
+        self,
+        page_size: int | None = None,
+        settlement_status: str | None = None,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every market position of the user matching the filters."""
+        return iter_records(
+            lambda cursor: self.get_positions(
+                limit=page_size,
+                cursor=cursor,
+                settlement_status=settlement_status,
+                ticker=ticker,
+                event_ticker=event_ticker,
+            ),
+            "market_positions",
+            prefetch=prefetch,
+        )
+
+    def iter_portfolio_settlements(
+        self,
+        page_size: int | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every settlement of the user."""
+        return iter_records(
+            lambda cursor: self.get_portfolio_settlements(
+                limit=page_size,
+                cursor=cursor,
+            ),
+            "settlements",
+            prefetch=prefetch,
+        )
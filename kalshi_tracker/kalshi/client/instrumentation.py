@@ -0,0 +1,276 @@
+"""Per-endpoint timing and traffic of the client's requests.
+
+Every request attempt is split into phases:
+
+- ``rate_limit``: waiting for the rate limiter,
+- ``sign``: building the signed headers,
+- ``network``: sending the request and reading the response,
+- ``decode``: parsing the JSON body.
+
+A client given ``instrumentation`` passes one ``RequestSample`` per attempt
+to it. ``MemorySink`` aggregates samples into per-endpoint histograms and
+counters, ``PrometheusSink`` renders those in the Prometheus text format and
+``LogSink`` writes one JSON line per sample. Without instrumentation the
+client only takes a few clock readings per request.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    Sink = Callable[["RequestSample"], None]
+
+PHASES = ("rate_limit", "sign", "network", "decode")
+
+# histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_PREFIX = "kalshi_client"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RequestSample:
+    """The phases, traffic and outcome of one request attempt.
+
+    ``status`` is ``None`` when no response arrived. Times are in seconds.
+    """
+
+    endpoint: str
+    status: int | None
+    rate_limit: float
+    sign: float
+    network: float
+    decode: float
+    bytes_out: int
+    bytes_in: int
+
+    @property
+    def total(self) -> float:
+        """Time spent across every phase."""
+        return self.rate_limit + self.sign + self.network + self.decode
+
+
+class Histogram:
+    """Counts of observations per bucket, with their sum."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty histogram; the last bucket is unbounded."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile as the upper bound of its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the count, sum, mean and median and 99th percentile bounds."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class EndpointStats:
+    """What ``MemorySink`` keeps for one endpoint."""
+
+    __slots__ = ("bytes_in", "bytes_out", "phases", "requests", "statuses", "total")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize empty counters and histograms."""
+        self.requests = 0
+        self.statuses: Counter[str] = Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.phases = {phase: Histogram(buckets) for phase in PHASES}
+        self.total = Histogram(buckets)
+
+    def add(self, sample: RequestSample) -> None:
+        """Add one sample."""
+        self.requests += 1
+        self.statuses[str(sample.status) if sample.status else "error"] += 1
+        self.bytes_in += sample.bytes_in
+        self.bytes_out += sample.bytes_out
+        for phase, histogram in self.phases.items():
+            histogram.observe(getattr(sample, phase))
+        self.total.observe(sample.total)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and histogram summaries."""
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "total": self.total.as_dict(),
+            **{phase: h.as_dict() for phase, h in self.phases.items()},
+        }
+
+
+class MemorySink:
+    """Aggregate samples in memory, per endpoint."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty sink."""
+        self.buckets = buckets
+        self.endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, sample: RequestSample) -> None:
+        """Add one sample."""
+        with self._lock:
+            stats = self.endpoints.get(sample.endpoint)
+            if stats is None:
+                stats = self.endpoints[sample.endpoint] = EndpointStats(self.buckets)
+            stats.add(sample)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the stats of every endpoint as plain values."""
+        with self._lock:
+            return {name: s.as_dict() for name, s in self.endpoints.items()}
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        with self._lock:
+            self.endpoints.clear()
+
+
+class PrometheusSink(MemorySink):
+    """Aggregate samples and render them for a Prometheus scrape."""
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        prefix: str = PROMETHEUS_PREFIX,
+    ) -> None:
+        """Initialize an empty sink naming its metrics ``<prefix>_...``."""
+        super().__init__(buckets)
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_request_phase_seconds Time per request phase.",
+            f"# TYPE {p}_request_phase_seconds histogram",
+        ]
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            for endpoint, stats in endpoints:
+                for phase, histogram in stats.phases.items():
+                    labels = f'endpoint="{_escape(endpoint)}",phase="{phase}"'
+                    lines.extend(_histogram_lines(p, labels, histogram))
+
+            lines += [
+                f"# HELP {p}_responses_total Responses by status code.",
+                f"# TYPE {p}_responses_total counter",
+            ]
+            for endpoint, stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    labels = f'endpoint="{_escape(endpoint)}",status="{status}"'
+                    lines.append(f"{p}_responses_total{{{labels}}} {count}")
+
+            for direction in ("in", "out"):
+                lines += [
+                    f"# HELP {p}_bytes_{direction}_total Body bytes {direction}.",
+                    f"# TYPE {p}_bytes_{direction}_total counter",
+                ]
+                for endpoint, stats in endpoints:
+                    value = getattr(stats, f"bytes_{direction}")
+                    labels = f'endpoint="{_escape(endpoint)}"'
+                    lines.append(f"{p}_bytes_{direction}_total{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"")
+
+
+def _histogram_lines(prefix: str, labels: str, histogram: Histogram) -> list[str]:
+    name = f"{prefix}_request_phase_seconds"
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+class LogSink:
+    """Write each sample as one JSON log line."""
+
+    def __init__(
+        self,
+        log: logging.Logger = logger,
+        level: int = logging.INFO,
+    ) -> None:
+        """Initialize a sink logging to ``log`` at ``level``."""
+        self.log = log
+        self.level = level
+
+    def __call__(self, sample: RequestSample) -> None:
+        """Log one sample."""
+        if self.log.isEnabledFor(self.level):
+            self.log.log(self.level, json.dumps(asdict(sample)))
+
+
+class Instrumentation:
+    """Pass each sample on to several sinks."""
+
+    def __init__(self, *sinks: Sink) -> None:
+        """Initialize with the sinks to feed."""
+        self.sinks = list(sinks)
+
+    def __call__(self, sample: RequestSample) -> None:
+        """Pass one sample to every sink."""
+        for sink in self.sinks:
+            sink(sample)
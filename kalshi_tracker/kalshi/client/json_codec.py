@@ -0,0 +1,20 @@
+"""JSON decoding with the fastest backend that is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+BACKEND = "json" if orjson is None else "orjson"
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode a JSON document, with ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
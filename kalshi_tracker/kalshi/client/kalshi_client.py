@@ -2,27 +2,52 @@
 
 from __future__ import annotations
 
-import base64
 import time
-from datetime import timedelta
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 import requests
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
-
-from kalshi_tracker.dateutil import now_utc
 
 from .http_error import HttpError
+from .instrumentation import RequestSample
+from .json_codec import loads
+from .rate_limiter import RateLimiter, parse_retry_after
+from .retry import CircuitBreaker, RetryMetrics, RetryPolicy, endpoint_key
+from .session import DEFAULT_TIMEOUT, make_session
+from .signing import RequestSigner
 
 if TYPE_CHECKING:
-    from requests.models import Response
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    from .instrumentation import Sink
+
+    # the decoded JSON body of an endpoint's answer
+    Response = dict[str, Any]
 
 THRESHOLD_IN_MILLISECONDS = 100
+HTTP_OK = 200
+# the first status past the 2XX successes
+HTTP_REDIRECT = 300
+TOO_MANY_REQUESTS = 429
+HTTP_SERVER_ERROR = 500
+
+
+@dataclass(slots=True)
+class _Attempt:
+    """How one attempt of a request went."""
+
+    # when the request was sent, from ``time.perf_counter``
+    sent: float
+    status: int | None = None
+    data: Any = None
+    error: Exception | None = None
+    retry_after: float | None = None
+    # what a retry is counted under: the status or the exception's name
+    reason: str = ""
 
 
-class KalshiClient:
+class KalshiClient(RequestSigner):
     """A simple client that allows utils to call authenticated Kalshi API endpoints."""
 
     def __init__(
@@ -32,9 +57,32 @@ class KalshiClient:
         private_key: rsa.RSAPrivateKey,
         user_id: str | None = None,
         rate_limit_threshold: int = THRESHOLD_IN_MILLISECONDS,
+        session: requests.Session | None = None,
+        timeout: tuple[float, float] | None = DEFAULT_TIMEOUT,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        instrumentation: Sink | None = None,
     ) -> None:
         """Initialize the client and logs in the specified user.
 
+        ``session`` is a pooled keep-alive session to send requests through; a
+        private one is created when it is not given. Pass the same session to
+        several clients to share its connection pool. ``timeout`` is the
+        ``(connect, read)`` timeout in seconds for every request.
+
+        ``rate_limiter`` budgets the client's requests; share one between
+        clients using the same key. Without one, the client allows one request
+        per ``rate_limit_threshold`` milliseconds (no limit when it is 0).
+
+        ``retry_policy`` decides which failed requests are sent again; the
+        default ``RetryPolicy()`` retries reads and orders with a client order
+        id, and ``RetryPolicy(max_attempts=1)`` turns retries off. With a
+        ``circuit_breaker``, requests to an endpoint that keeps failing are
+        refused without being sent. Retries are counted in ``retry_metrics``.
+        ``instrumentation`` receives the phase timings of every request
+        attempt, see ``kalshi_tracker.kalshi.client.instrumentation``.
+
         Raises an HttpError if the user could not be authenticated.
         """
 
@@ -42,56 +90,187 @@ class KalshiClient:
         self.key_id = key_id
         self.private_key = private_key
         self.user_id = user_id
-        self.last_api_call = now_utc()
         self.rate_limit_threshold = rate_limit_threshold
-
-    def rate_limit(self) -> None:
-        """Block the thread until the rate limit is satisfied.
+        if rate_limiter is None and rate_limit_threshold > 0:
+            rate_limiter = RateLimiter.from_threshold(rate_limit_threshold)
+        self.rate_limiter = rate_limiter
+        self.session = session if session is not None else make_session()
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker
+        self.retry_metrics = RetryMetrics()
+        self.instrumentation = instrumentation
+
+    def rate_limit(self, method: str = "GET") -> float:
+        """Block the thread until the rate limit allows a ``method`` request.
 
         Built in rate-limiter. We STRONGLY encourage you to keep
         some sort of rate limiting, just in case there is a bug in your
-        code. Feel free to adjust the threshold
+        code. Returns the time waited in seconds.
         """
-        # Adjust time between each api call
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.acquire(method)
+
+    def record_rate_limit(self, method: str, response: requests.Response) -> None:
+        """Feed the outcome of a request back into the rate limiter."""
+        if self.rate_limiter is None:
+            return
+        if response.status_code == TOO_MANY_REQUESTS:
+            self.rate_limiter.throttled(
+                method,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+        else:
+            self.rate_limiter.succeeded(method)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        body: str | None = None,
+    ) -> Response:
+        """Send an authenticated request through the client's session.
+
+        Transient failures are retried as the client's ``retry_policy``
+        allows. Returns the response body. Raises an HttpError on non-2XX
+        results, or the last connection error when every attempt failed.
+        """
+        policy = self.retry_policy
+        endpoint = endpoint_key(method, path)
+        retryable = policy.is_safe(method, body)
+        attempt = 0
+        while True:
+            attempt += 1
+            trial = self.check_circuit(endpoint)
+            try:
+                outcome = self._send(method, path, endpoint, params, body)
+            finally:
+                # an attempt that raised recorded no outcome; let another trial go
+                if trial and self.circuit_breaker is not None:
+                    self.circuit_breaker.release(endpoint)
+            if outcome.error is None:
+                return outcome.data
+
+            if not (retryable and policy.should_retry(attempt, outcome.status)):
+                if retryable and attempt > 1:
+                    self.retry_metrics.record_exhausted()
+                raise outcome.error
+
+            delay = policy.delay(attempt, outcome.retry_after)
+            self.retry_metrics.record_retry(
+                outcome.reason,
+                time.perf_counter() - outcome.sent + delay,
+            )
+            time.sleep(delay)
 
-        now = now_utc()
-        threshold_in_microseconds = 1000 * THRESHOLD_IN_MILLISECONDS
-        threshold_in_seconds = THRESHOLD_IN_MILLISECONDS / 1000
-        if now - self.last_api_call < timedelta(microseconds=threshold_in_microseconds):
-            time.sleep(threshold_in_seconds)
-        self.last_api_call = now_utc()
+    def _send(
+        self,
+        method: str,
+        path: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        body: str | None,
+    ) -> _Attempt:
+        """Send one attempt of a request and record how it went."""
+        # phase boundaries, cheap enough to take on every request
+        started = time.perf_counter()
+        self.rate_limit(method)
+        signing = time.perf_counter()
+        headers = self.request_headers(method, path)
+        sending = time.perf_counter()
+        attempt = _Attempt(sent=sending)
+        response = None
+        try:
+            response = self.session.request(
+                method,
+                self.host + path,
+                headers=headers,
+                params=params,
+                data=body,
+                timeout=self.timeout,
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            attempt.error = e
+            attempt.reason = type(e).__name__
+        answered = time.perf_counter()
+
+        if response is None:
+            self.record_circuit(endpoint, succeeded=False)
+        else:
+            self._read_response(method, endpoint, response, attempt)
+
+        if self.instrumentation is not None:
+            self.instrumentation(
+                RequestSample(
+                    endpoint=endpoint,
+                    status=attempt.status,
+                    rate_limit=signing - started,
+                    sign=sending - signing,
+                    network=answered - sending,
+                    decode=(
+                        time.perf_counter() - answered if attempt.error is None else 0.0
+                    ),
+                    bytes_out=len(body.encode()) if body else 0,
+                    bytes_in=len(response.content) if response is not None else 0,
+                ),
+            )
+        return attempt
+
+    def _read_response(
+        self,
+        method: str,
+        endpoint: str,
+        response: requests.Response,
+        attempt: _Attempt,
+    ) -> None:
+        """Decode a 2XX response into ``attempt``, or record why it failed."""
+        self.record_rate_limit(method, response)
+        attempt.status = status = response.status_code
+        self.record_circuit(endpoint, succeeded=status < HTTP_SERVER_ERROR)
+        if HTTP_OK <= status < HTTP_REDIRECT:
+            attempt.data = loads(response.content)
+        else:
+            attempt.error = HttpError(response.reason, status)
+            attempt.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            attempt.reason = str(status)
+
+    def check_circuit(self, endpoint: str) -> bool:
+        """Raise ``CircuitOpenError`` unless a request to ``endpoint`` may go.
+
+        Returns whether the request is the trial of an open circuit.
+        """
+        if self.circuit_breaker is None:
+            return False
+        try:
+            return self.circuit_breaker.check(endpoint)
+        except HttpError:
+            self.retry_metrics.record_rejected()
+            raise
+
+    def record_circuit(self, endpoint: str, *, succeeded: bool) -> None:
+        """Feed the outcome of a request to ``endpoint`` into the breaker."""
+        if self.circuit_breaker is None:
+            return
+        if succeeded:
+            self.circuit_breaker.succeeded(endpoint)
+        else:
+            self.circuit_breaker.failed(endpoint)
 
     def post(self, path: str, body: str | None = None) -> Response:
         """POST to an authenticated Kalshi HTTP endpoint.
 
         Returns the response body. Raises an HttpError on non-2XX results.
         """
-        self.rate_limit()
-
-        response = requests.post(
-            self.host + path,
-            data=body,
-            headers=self.request_headers("POST", path),
-        )
-        self.raise_if_bad_response(response)
-        return response.json()
+        return self.request("POST", path, body=body)
 
     def get(self, path: str, params: dict[str, Any] | None = None) -> Response:
         """GET from an authenticated Kalshi HTTP endpoint.
 
         Returns the response body. Raises an HttpError on non-2XX results.
         """
-        if params is None:
-            params = {}
-        self.rate_limit()
-
-        response = requests.get(
-            self.host + path,
-            headers=self.request_headers("GET", path),
-            params=params,
-        )
-        self.raise_if_bad_response(response)
-        return response.json()
+        return self.request("GET", path, params=params)
 
     def delete(
         self,
@@ -103,77 +282,24 @@ class KalshiClient:
 
         Returns the response body. Raises an HttpError on non-2XX results.
         """
-        if params is None:
-            params = {}
-        self.rate_limit()
-
-        response = requests.delete(
-            self.host + path,
-            headers=self.request_headers("DELETE", path),
-            params=params,
-            data=body,
-        )
-        self.raise_if_bad_response(response)
-        return response.json()
-
-    def request_headers(self, method: str, path: str) -> dict[str, Any]:
-        """Generate the headers for an authenticated request."""
-
-        # Get the current time
-        current_time = now_utc()
-
-        # Convert the time to a timestamp (seconds since the epoch)
-        timestamp = current_time.timestamp()
-
-        # Convert the timestamp to milliseconds
-        current_time_milliseconds = int(timestamp * 1000)
-        timestampt_str = str(current_time_milliseconds)
-
-        # remove query params
-        path_parts = path.split("?")
-
-        msg_string = timestampt_str + method + "/trade-api/v2" + path_parts[0]
-        signature = self.sign_pss_text(msg_string)
-
-        headers = {"Content-Type": "application/json"}
-
-        headers["KALSHI-ACCESS-KEY"] = self.key_id
-        headers["KALSHI-ACCESS-SIGNATURE"] = signature
-        headers["KALSHI-ACCESS-TIMESTAMP"] = timestampt_str
-        return headers
-
-    def sign_pss_text(self, text: str) -> str:
-        """Sign a message using RSA-PSS."""
-        # Before signing, we need to hash our message.
-        # The hash is what we actually sign.
-        # Convert the text to bytes
-        message = text.encode("utf-8")
-        try:
-            signature = self.private_key.sign(
-                message,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.DIGEST_LENGTH,
-                ),
-                hashes.SHA256(),
-            )
-            return base64.b64encode(signature).decode("utf-8")
-        except InvalidSignature as e:
-            raise ValueError("RSA sign PSS failed") from e
+        return self.request("DELETE", path, params=params, body=body)
 
     def raise_if_bad_response(self, response: requests.Response) -> None:
         """Raise an HttpError if the response is not 2XX."""
-        if response.status_code not in range(200, 299):
+        if not HTTP_OK <= response.status_code < HTTP_REDIRECT:
             raise HttpError(response.reason, response.status_code)
 
     def query_generation(self, params: dict) -> str:
         """Generate a query string from a dictionary of parameters."""
-        relevant_params = {k: v for k, v in params.items() if v is not None}
+        relevant_params = {
+            k: v for k, v in params.items() if v is not None and k != "self"
+        }
         if len(relevant_params):
             query = (
                 "?"
                 + "".join(
-                    "&" + str(k) + "=" + str(v) for k, v in relevant_params.items()
+                    "&" + str(k) + "=" + quote(str(v), safe=",")
+                    for k, v in relevant_params.items()
                 )[1:]
             )
         else:
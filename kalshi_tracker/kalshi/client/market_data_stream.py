@@ -0,0 +1,241 @@
+"""Streaming consumer for the Kalshi websocket market-data channels."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import random
+from typing import TYPE_CHECKING, Any, Self
+
+from websockets.asyncio.client import connect
+from websockets.exceptions import InvalidStatus, WebSocketException
+
+from kalshi_tracker.kalshi.orderbook import OrderBook
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+    from types import TracebackType
+
+    from .kalshi_client import KalshiClient
+
+logger = logging.getLogger(__name__)
+
+WS_API_PREFIX = "/trade-api/ws/v2"
+DEFAULT_CHANNELS = ("orderbook_delta", "trade")
+DEFAULT_MAX_QUEUE = 10_000
+# tickers per subscribe command
+SUBSCRIBE_CHUNK = 250
+MIN_RECONNECT_DELAY = 0.1
+MAX_RECONNECT_DELAY = 30.0
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+
+
+def websocket_url(host: str) -> str:
+    """Derive the websocket URL from a REST API base like ``KalshiKeySettings.host``."""
+    scheme, rest = host.split("://", 1)
+    netloc = rest.split("/", 1)[0]
+    ws_scheme = "wss" if scheme == "https" else "ws"
+    return f"{ws_scheme}://{netloc}{WS_API_PREFIX}"
+
+
+class StreamStats:
+    """Counters describing the stream's health."""
+
+    def __init__(self) -> None:
+        """Initialize all counters at zero."""
+        self.messages = 0
+        self.dropped = 0
+        self.connects = 0
+        self.reconnects = 0
+        self.sequence_gaps = 0
+
+
+class MarketDataStream:
+    """Subscribe to market-data channels for many tickers over one websocket.
+
+    The handshake is signed with the key of ``signer`` the same way its REST
+    requests are. Data messages are decoded and put on a bounded queue that
+    callers drain with ``get`` or ``async for``. When the queue is full the
+    reader either waits (``overflow="block"``, backpressure) or discards the
+    oldest message (``overflow="drop_oldest"``).
+
+    Dropped connections are retried with jittered exponential backoff and
+    every subscription is sent again. A gap in a subscription's sequence
+    numbers also forces a reconnect, since fresh snapshots are the only way to
+    repair an orderbook that missed a delta.
+    """
+
+    def __init__(
+        self,
+        signer: KalshiClient,
+        tickers: Iterable[str] = (),
+        channels: Iterable[str] = DEFAULT_CHANNELS,
+        url: str | None = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        overflow: str = OVERFLOW_BLOCK,
+        min_reconnect_delay: float = MIN_RECONNECT_DELAY,
+        max_reconnect_delay: float = MAX_RECONNECT_DELAY,
+    ) -> None:
+        """Initialize the stream without connecting.
+
+        ``url`` defaults from the signer's host.
+        """
+        if overflow not in (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST):
+            msg = f"Unknown overflow policy {overflow!r}."
+            raise ValueError(msg)
+        self.signer = signer
+        self.url = url or websocket_url(signer.host)
+        self.channels = list(channels)
+        self.tickers: dict[str, None] = dict.fromkeys(tickers)
+        self.overflow = overflow
+        self.min_reconnect_delay = min_reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.stats = StreamStats()
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(max_queue)
+        self._ids = itertools.count(1)
+        self._seqs: dict[int, int] = {}
+        self._ws: Any = None
+        self._task: asyncio.Task | None = None
+
+    # lifecycle
+
+    async def start(self) -> None:
+        """Connect in the background and start filling the queue."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Disconnect and stop reconnecting."""
+        if self._task is not None:
+            if self._ws is not None:
+                # nothing drains the socket once the reader is cancelled, so a
+                # close handshake would only wait out its timeout
+                self._ws.transport.abort()
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def __aenter__(self) -> Self:
+        """Start the stream."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop the stream."""
+        await self.stop()
+
+    # consuming
+
+    async def get(self) -> dict[str, Any]:
+        """Wait for the next message."""
+        return await self.queue.get()
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield messages as they arrive."""
+        while True:
+            yield await self.queue.get()
+
+    # subscriptions
+
+    async def subscribe(self, tickers: Iterable[str]) -> None:
+        """Add tickers to the subscriptions, now and after every reconnect."""
+        new = [t for t in tickers if t not in self.tickers]
+        self.tickers.update(dict.fromkeys(new))
+        if self._ws is not None and new:
+            await self._send_subscribe(self._ws, new)
+
+    async def _send_subscribe(self, ws: Any, tickers: list[str]) -> None:  # noqa: ANN401
+        for start in range(0, len(tickers), SUBSCRIBE_CHUNK):
+            command = {
+                "id": next(self._ids),
+                "cmd": "subscribe",
+                "params": {
+                    "channels": self.channels,
+                    "market_tickers": tickers[start : start + SUBSCRIBE_CHUNK],
+                },
+            }
+            await ws.send(json.dumps(command))
+
+    # reading
+
+    async def _run(self) -> None:
+        delay = self.min_reconnect_delay
+        while True:
+            headers = self.signer.request_headers("GET", "", api_prefix=WS_API_PREFIX)
+            try:
+                async with connect(self.url, additional_headers=headers) as ws:
+                    self._ws = ws
+                    self._seqs.clear()
+                    self.stats.connects += 1
+                    delay = self.min_reconnect_delay
+                    await self._send_subscribe(ws, list(self.tickers))
+                    async for raw in ws:
+                        if not await self._receive(json.loads(raw)):
+                            break
+            except InvalidStatus as error:
+                logger.warning("Stream handshake rejected: %s", error)
+            except (OSError, WebSocketException) as error:
+                logger.info("Stream disconnected: %s", error)
+            finally:
+                self._ws = None
+
+            self.stats.reconnects += 1
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))  # noqa: S311
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _receive(self, message: dict[str, Any]) -> bool:
+        """Queue a data message. Returns False when the stream must resync."""
+        sid, seq = message.get("sid"), message.get("seq")
+        if sid is not None and seq is not None:
+            last = self._seqs.get(sid)
+            self._seqs[sid] = seq
+            if last is not None and seq != last + 1:
+                self.stats.sequence_gaps += 1
+                logger.warning("Sequence gap on sid %s: %s -> %s", sid, last, seq)
+                return False
+
+        self.stats.messages += 1
+        if self.overflow == OVERFLOW_DROP_OLDEST and self.queue.full():
+            self.queue.get_nowait()
+            self.stats.dropped += 1
+        # blocks while the queue is full, pushing back on the socket
+        await self.queue.put(message)
+        return True
+
+
+def apply_orderbook_message(
+    books: dict[str, OrderBook],
+    message: dict[str, Any],
+) -> str | None:
+    """Apply an orderbook snapshot or delta message to a book.
+
+    Books are created on their first snapshot. Returns the ticker of the book
+    that changed, or ``None`` when the message was not orderbook data or names
+    no market.
+    """
+    kind = message.get("type")
+    msg = message.get("msg") or {}
+    ticker = msg.get("market_ticker")
+    if ticker is None:
+        return None
+    if kind == "orderbook_snapshot":
+        book = books.get(ticker)
+        if book is None:
+            book = books[ticker] = OrderBook(ticker)
+        book.apply_snapshot(msg.get("yes"), msg.get("no"))
+        return ticker
+    if kind == "orderbook_delta" and ticker in books:
+        books[ticker].apply_delta(msg["side"], msg["price"], msg["delta"])
+        return ticker
+    return None
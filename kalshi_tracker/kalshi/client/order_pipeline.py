@@ -0,0 +1,349 @@
+"""Submit and cancel many orders through the batched order endpoints."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from .http_error import HttpError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .exchange_client import ExchangeClient
+
+    SendBatch = Callable[[list[Any]], list[dict[str, Any]]]
+    FindOrders = Callable[[list[str]], dict[str, dict[str, Any]]]
+
+# most orders one batched create or cancel request may carry
+MAX_BATCH_ORDERS = 20
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 0.1
+
+# write budget spent per order in a batch; a cancel costs a fifth of an order
+CREATE_COST = 1.0
+CANCEL_COST = 0.2
+
+# answers worth sending a batch or a leg again for
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_ERRORS = frozenset(
+    {"internal_server_error", "service_unavailable", "too_many_requests", "timeout"},
+)
+# the answer to an order whose ``client_order_id`` the exchange already has
+ORDER_EXISTS = "order_already_exists"
+# the answer to a cancel of an order that is not resting, e.g. canceled already
+ORDER_NOT_FOUND = "not_found"
+
+
+@dataclass
+class OrderResult:
+    """The final answer for one order or cancel.
+
+    ``key`` is the order's ``client_order_id``, or the order id of a cancel.
+    ``latency`` is the time from this leg's first submission until it was
+    answered for the last time, retries included.
+    """
+
+    key: str
+    order: dict[str, Any] | None = None
+    error: dict[str, Any] | None = None
+    attempts: int = 0
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the exchange accepted the leg."""
+        return self.error is None
+
+
+@dataclass
+class LatencyStats:
+    """Latency samples in seconds and their summary."""
+
+    samples: list[float] = field(default_factory=list)
+
+    def add(self, seconds: float) -> None:
+        """Record one sample."""
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """Get the nearest-rank ``q`` percentile, 0 without samples."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+    def summary(self) -> dict[str, float]:
+        """Get the count, mean, median, tail percentiles and maximum."""
+        count = len(self.samples)
+        return {
+            "count": count,
+            "mean": sum(self.samples) / count if count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self.samples, default=0.0),
+        }
+
+
+@dataclass
+class PipelineReport:
+    """Per-order results of a pipeline run and how the run went."""
+
+    results: list[OrderResult]
+    requests: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    # round trip time of each batch request
+    latency: LatencyStats = field(default_factory=LatencyStats)
+
+    @property
+    def failed(self) -> list[OrderResult]:
+        """Results the exchange did not accept."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def throughput(self) -> float:
+        """Orders answered per second."""
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Get the run's counts, throughput and latencies."""
+        return {
+            "orders": len(self.results),
+            "failed": len(self.failed),
+            "requests": self.requests,
+            "retries": self.retries,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "batch_latency": self.latency.summary(),
+            "order_latency": LatencyStats(
+                [result.latency for result in self.results],
+            ).summary(),
+        }
+
+
+class OrderPipeline:
+    """Split large sets of orders into batches and send them concurrently.
+
+    Orders are packed into batches of ``batch_size`` and up to
+    ``max_workers`` batches are in flight at once. Every batch first takes
+    its cost from the client's write budget, one token per order created or a
+    fifth per cancel, so the pipeline runs as fast as the rate limiter allows
+    and no faster.
+
+    Legs that fail with a transient error, and every leg of a batch request
+    that failed as a whole with a 429, a 5xx or a connection error, are
+    repacked into new batches and sent again, up to ``max_attempts`` times in
+    total. Other failures are final. Retried orders keep their
+    ``client_order_id``, so the exchange rejects a retried order that already
+    reached it with ``order_already_exists`` rather than placing it twice.
+    Such an order is looked up by its ``client_order_id`` on its market and
+    counts as created; one that is not found there keeps the error. In the
+    same way a cancel answered ``not_found``, e.g. a retry of one whose answer
+    was lost, counts as done when the order turns out to be canceled. The
+    client's own ``retry_policy`` retries each batch request first.
+    """
+
+    def __init__(
+        self,
+        client: ExchangeClient,
+        batch_size: int = MAX_BATCH_ORDERS,
+        max_workers: int = DEFAULT_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        """Initialize a pipeline sending through ``client``."""
+        if not 0 < batch_size <= MAX_BATCH_ORDERS:
+            msg = f"Batch size must be from 1 to {MAX_BATCH_ORDERS}."
+            raise ValueError(msg)
+        self.client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def create_orders(self, orders: Iterable[dict[str, Any]]) -> PipelineReport:
+        """Create orders shaped like the ``create_order`` parameters.
+
+        Orders without a ``client_order_id`` are given one. An order that
+        repeats the ``client_order_id`` of an earlier one is dropped, so the
+        results hold one entry per distinct id, in the order first seen.
+        """
+        legs: dict[str, dict[str, Any]] = {}
+        for order in orders:
+            key = order.get("client_order_id")
+            if key is None:
+                key = str(uuid.uuid4())
+                legs.setdefault(key, {**order, "client_order_id": key})
+            else:
+                legs.setdefault(key, order)
+
+        def send(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return self.client.batch_create_orders(batch)["orders"]
+
+        def find(keys: list[str]) -> dict[str, dict[str, Any]]:
+            found = {}
+            for ticker in dict.fromkeys(legs[key]["ticker"] for key in keys):
+                for order in self.client.iter_orders(ticker=ticker, prefetch=False):
+                    if order.get("client_order_id") in keys:
+                        found[order["client_order_id"]] = order
+            return found
+
+        recover = (ORDER_EXISTS, find)
+        return self._run(legs, send, "client_order_id", CREATE_COST, recover)
+
+    def cancel_orders(self, order_ids: Iterable[str]) -> PipelineReport:
+        """Cancel orders by id, each id once."""
+        legs = {order_id: order_id for order_id in order_ids}
+
+        def send(batch: list[str]) -> list[dict[str, Any]]:
+            return self.client.batch_cancel_orders(batch)["orders"]
+
+        def find(keys: list[str]) -> dict[str, dict[str, Any]]:
+            found = {}
+            for order_id in keys:
+                try:
+                    order = self.client.get_order(order_id)["order"]
+                except HttpError:
+                    continue
+                if order.get("status") == "canceled":
+                    found[order_id] = order
+            return found
+
+        recover = (ORDER_NOT_FOUND, find)
+        return self._run(legs, send, "order_id", CANCEL_COST, recover)
+
+    def _run(
+        self,
+        legs: dict[str, Any],
+        send: SendBatch,
+        key_field: str,
+        cost: float,
+        recover: tuple[str, FindOrders],
+    ) -> PipelineReport:
+        run = _Run(self.client, legs, send, key_field, cost)
+        run.recover = recover
+        pending = list(legs)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for attempt in range(1, self.max_attempts + 1):
+                if attempt > 1:
+                    run.report.retries += len(pending)
+                    time.sleep(self.retry_delay * 2 ** (attempt - 2))
+                batches = [
+                    pending[i : i + self.batch_size]
+                    for i in range(0, len(pending), self.batch_size)
+                ]
+                pending = [
+                    key for retry in pool.map(run.send_batch, batches) for key in retry
+                ]
+                if not pending:
+                    break
+
+        run.report.elapsed = time.perf_counter() - run.start
+        return run.report
+
+
+class _Run:
+    """The state of one pipeline run, shared by its worker threads."""
+
+    def __init__(
+        self,
+        client: ExchangeClient,
+        legs: dict[str, Any],
+        send: SendBatch,
+        key_field: str,
+        cost: float,
+    ) -> None:
+        self.client = client
+        self.legs = legs
+        self.send = send
+        # the error answered to a leg that may have been done by an earlier
+        # send, and how to look up the orders of such legs by their keys
+        self.recover: tuple[str, FindOrders] | None = None
+        self.key_field = key_field
+        self.cost = cost
+        self.results = {key: OrderResult(key) for key in legs}
+        self.report = PipelineReport(list(self.results.values()))
+        self.start = time.perf_counter()
+        # when each leg was first sent
+        self._submitted: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def send_batch(self, keys: list[str]) -> list[str]:
+        """Send one batch, record its answers and return the keys to retry."""
+        # the request itself takes one token
+        extra = self.cost * len(keys) - 1
+        if self.client.rate_limiter is not None and extra > 0:
+            self.client.rate_limiter.write.acquire(extra)
+
+        answers: list[dict[str, Any]] = []
+        error = None
+        # legs the exchange did not answer are safe to send again
+        retryable = True
+        sent = time.perf_counter()
+        for key in keys:
+            self._submitted.setdefault(key, sent)
+        try:
+            answers = self.send([self.legs[key] for key in keys])
+        except HttpError as e:
+            error = {"code": "http_error", "status": e.status, "message": e.reason}
+            retryable = e.status in RETRYABLE_STATUSES
+        except requests.RequestException as e:
+            error = {"code": "connection_error", "message": str(e)}
+        answered = time.perf_counter()
+        with self._lock:
+            self.report.requests += 1
+            self.report.latency.add(answered - sent)
+
+        retry = []
+        by_key = {answer.get(self.key_field): answer for answer in answers}
+        for key in keys:
+            result = self.results[key]
+            result.attempts += 1
+            result.latency = answered - self._submitted[key]
+            answer = by_key.get(key)
+            if answer is None:
+                result.order = None
+                result.error = error or {"code": "missing", "message": key}
+                retry_leg = retryable
+            else:
+                result.order = answer.get("order")
+                result.error = answer.get("error")
+                retry_leg = (result.error or {}).get("code") in RETRYABLE_ERRORS
+            if result.error is not None and retry_leg:
+                retry.append(key)
+        self._recover_done(keys)
+        return retry
+
+    def _recover_done(self, keys: list[str]) -> None:
+        """Take legs the exchange says are done already as succeeded.
+
+        An earlier send whose answer was lost, e.g. to a timeout or a 503,
+        may have placed the order or canceled it; the retry is then answered
+        ``order_already_exists`` or ``not_found``. The order found on the
+        exchange in the wanted state is the leg's.
+        """
+        if self.recover is None:
+            return
+        code, find = self.recover
+        done = [
+            key for key in keys if (self.results[key].error or {}).get("code") == code
+        ]
+        if not done:
+            return
+        try:
+            found = find(done)
+        except (HttpError, requests.RequestException):
+            return
+        for key, order in found.items():
+            self.results[key].order = order
+            self.results[key].error = None
@@ -0,0 +1,57 @@
+"""Streaming iteration over the cursor-paginated Kalshi endpoints."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
+
+    FetchPage = Callable[[str | None], dict[str, Any]]
+
+
+def iter_pages(
+    fetch_page: FetchPage,
+    *,
+    prefetch: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield every page of a cursor-paginated endpoint.
+
+    ``fetch_page`` is called with the cursor of the page to fetch (``None`` for
+    the first one) and must re-send the query's filters, which the cursor does
+    not carry. With ``prefetch`` the next page is requested in a background
+    thread while the caller works through the current one. At most two pages
+    are held at a time.
+    """
+    if not prefetch:
+        cursor = None
+        while True:
+            page = fetch_page(cursor)
+            yield page
+            cursor = page.get("cursor")
+            if not cursor:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kalshi-page")
+    try:
+        pending: Future[dict[str, Any]] | None = executor.submit(fetch_page, None)
+        while pending is not None:
+            page = pending.result()
+            cursor = page.get("cursor")
+            pending = executor.submit(fetch_page, cursor) if cursor else None
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_records(
+    fetch_page: FetchPage,
+    key: str,
+    *,
+    prefetch: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield the records listed under ``key`` on every page."""
+    for page in iter_pages(fetch_page, prefetch=prefetch):
+        yield from page.get(key) or []
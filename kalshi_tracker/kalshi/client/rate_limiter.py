@@ -0,0 +1,197 @@
+"""Token-bucket rate limiting shared across threads and clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from kalshi_tracker.dateutil import now_utc
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Kalshi basic tier budgets, in requests per second
+DEFAULT_READ_RATE = 20.0
+DEFAULT_WRITE_RATE = 10.0
+
+# adaptive (AIMD) adjustment of the refill rate
+THROTTLED_RATE_FACTOR = 0.5
+RECOVERY_RATE_FRACTION = 0.02
+MIN_RATE_FRACTION = 0.05
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - now_utc()).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Tokens refill at ``rate`` per second up to ``capacity``, which is the burst
+    allowed after a quiet period. Callers reserve tokens first and then wait
+    out their reservation, so concurrent callers queue up fairly instead of
+    racing. The rate backs off multiplicatively when the server throttles us
+    and recovers additively on success, never exceeding the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket. ``capacity`` defaults to one second of rate."""
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        refilled = self.tokens + (now - self._updated) * self.rate
+        self.tokens = min(self.capacity, refilled)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` and return the seconds to wait before using them."""
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available and return the time waited."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Wait without blocking the event loop until ``tokens`` are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """Back off after the server answered 429.
+
+        Halves the rate and, when the server said how long to wait, holds every
+        caller back until then.
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(
+                self.rate * THROTTLED_RATE_FACTOR,
+                self.max_rate * MIN_RATE_FRACTION,
+            )
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.tokens -= retry_after * self.rate
+
+    def succeeded(self) -> None:
+        """Recover some of the rate after a request was accepted."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill()
+            self.rate = min(
+                self.max_rate,
+                self.rate + self.max_rate * RECOVERY_RATE_FRACTION,
+            )
+
+
+class RateLimiter:
+    """Separate read and write token buckets for one API key."""
+
+    def __init__(
+        self,
+        read_rate: float = DEFAULT_READ_RATE,
+        write_rate: float = DEFAULT_WRITE_RATE,
+        read_burst: float | None = None,
+        write_burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the buckets. Bursts default to one second of rate."""
+        self.read = TokenBucket(read_rate, read_burst, clock=clock)
+        self.write = TokenBucket(write_rate, write_burst, clock=clock)
+
+    @classmethod
+    def from_threshold(cls, threshold_in_milliseconds: float) -> RateLimiter:
+        """Allow one read and one write per ``threshold_in_milliseconds``.
+
+        Reads and writes keep separate buckets, so a read and a write may
+        still go out together.
+        """
+        rate = 1000 / threshold_in_milliseconds
+        return cls(read_rate=rate, write_rate=rate, read_burst=1, write_burst=1)
+
+    def bucket(self, method: str) -> TokenBucket:
+        """Get the bucket that budgets requests of ``method``."""
+        return self.read if method.upper() in READ_METHODS else self.write
+
+    def acquire(self, method: str) -> float:
+        """Block until a ``method`` request is allowed and return the time waited."""
+        return self.bucket(method).acquire()
+
+    async def acquire_async(self, method: str) -> float:
+        """Wait until a ``method`` request is allowed and return the time waited."""
+        return await self.bucket(method).acquire_async()
+
+    def throttled(self, method: str, retry_after: float | None = None) -> None:
+        """Back off after a ``method`` request was answered with 429."""
+        self.bucket(method).throttled(retry_after)
+
+    def succeeded(self, method: str) -> None:
+        """Record that a ``method`` request was accepted."""
+        self.bucket(method).succeeded()
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key_id: str,
+    read_rate: float = DEFAULT_READ_RATE,
+    write_rate: float = DEFAULT_WRITE_RATE,
+    read_burst: float | None = None,
+    write_burst: float | None = None,
+) -> RateLimiter:
+    """Get the process-wide rate limiter for an API key.
+
+    Every client using the same key shares its budget. The rates only apply
+    when the limiter for the key is first created.
+    """
+    with _limiters_lock:
+        if key_id not in _limiters:
+            _limiters[key_id] = RateLimiter(
+                read_rate=read_rate,
+                write_rate=write_rate,
+                read_burst=read_burst,
+                write_burst=write_burst,
+            )
+        return _limiters[key_id]
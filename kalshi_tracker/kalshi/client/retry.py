@@ -0,0 +1,245 @@
+"""Retrying transient failures and cutting off failing endpoints."""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .http_error import HttpError
+from .json_codec import loads
+from .rate_limiter import READ_METHODS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 0.25
+DEFAULT_MAX_DELAY = 30.0
+
+# answers that say "try again later" rather than "this request is wrong"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+SERVICE_UNAVAILABLE = 503
+
+# path segments that are names rather than tickers or ids
+_NAME_SEGMENT = re.compile(r"[a-z_]+")
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """Group a request by endpoint, e.g. ``GET /markets/{id}/orderbook``."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    template = "/".join(
+        s if _NAME_SEGMENT.fullmatch(s) else "{id}" for s in segments if s
+    )
+    return f"{method.upper()} /{template}"
+
+
+def has_client_order_ids(body: str | bytes | None) -> bool:
+    """Whether a request body creates only orders with a ``client_order_id``.
+
+    The exchange refuses a second order with the same id, which makes sending
+    such a request again safe.
+    """
+    if not body:
+        return False
+    try:
+        data = loads(body)
+    except ValueError:
+        return False
+    if not isinstance(data, dict):
+        return False
+    orders = data.get("orders", [data])
+    return bool(orders) and all(
+        isinstance(order, dict) and order.get("client_order_id") for order in orders
+    )
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before sending a request again.
+
+    A request is retried when it is safe to send twice: reads, and orders
+    carrying a ``client_order_id``. It is retried after a connection error,
+    a timeout or one of ``retry_statuses``, up to ``max_attempts`` attempts in
+    total. The wait before attempt ``n + 1`` is drawn uniformly from zero to
+    ``base_delay * 2 ** (n - 1)`` capped at ``max_delay`` ("full jitter"),
+    so clients that failed together do not retry together, but never shorter
+    than the server's Retry-After.
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    base_delay: float = DEFAULT_BASE_DELAY
+    max_delay: float = DEFAULT_MAX_DELAY
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def is_safe(self, method: str, body: str | bytes | None = None) -> bool:
+        """Whether a request may be sent again without side effects."""
+        method = method.upper()
+        return method in READ_METHODS or (
+            method == "POST" and has_client_order_ids(body)
+        )
+
+    def should_retry(self, attempt: int, status: int | None) -> bool:
+        """Whether to retry after ``attempt`` failed, ``None`` for no answer."""
+        if attempt >= self.max_attempts:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Get the seconds to wait after ``attempt`` failed."""
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        wait = self.rng.uniform(0, backoff)
+        if retry_after is not None:
+            wait = max(wait, min(retry_after, self.max_delay))
+        return wait
+
+
+class RetryMetrics:
+    """Thread-safe counts of retries and the time they cost."""
+
+    def __init__(self) -> None:
+        """Start from zero."""
+        # retries by the status that caused them, or the exception's name
+        self.retries: Counter[str] = Counter()
+        # failed attempts plus the waits after them, in seconds
+        self.time_lost = 0.0
+        # requests that failed after their last allowed attempt
+        self.exhausted = 0
+        # requests refused without being sent because a circuit was open
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def record_retry(self, reason: str, seconds: float) -> None:
+        """Count one retry and the time it cost."""
+        with self._lock:
+            self.retries[reason] += 1
+            self.time_lost += seconds
+
+    def record_exhausted(self) -> None:
+        """Count a request that ran out of attempts."""
+        with self._lock:
+            self.exhausted += 1
+
+    def record_rejected(self) -> None:
+        """Count a request refused by the circuit breaker."""
+        with self._lock:
+            self.rejected += 1
+
+    @property
+    def total_retries(self) -> int:
+        """Retries for any reason."""
+        return sum(self.retries.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as plain values."""
+        with self._lock:
+            return {
+                "retries": dict(self.retries),
+                "total_retries": sum(self.retries.values()),
+                "time_lost": self.time_lost,
+                "exhausted": self.exhausted,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitOpenError(HttpError):
+    """Raised instead of sending a request to an endpoint that keeps failing."""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        """Initialize the error for ``endpoint``, open ``retry_in`` seconds more."""
+        super().__init__(f"Circuit open for {endpoint}", SERVICE_UNAVAILABLE)
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "trial")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: float | None = None
+        # a request is probing whether the endpoint recovered
+        self.trial = False
+
+
+class CircuitBreaker:
+    """Stop sending requests to endpoints that keep failing.
+
+    After ``failure_threshold`` consecutive server errors or connection
+    failures the endpoint's circuit opens and requests to it fail fast with
+    ``CircuitOpenError``. After ``reset_timeout`` seconds one request is let
+    through as a trial: its success closes the circuit, its failure opens it
+    again. Endpoints are grouped by ``endpoint_key``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a breaker with every circuit closed."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, endpoint: str) -> bool:
+        """Whether requests to ``endpoint`` are currently refused."""
+        circuit = self._circuits.get(endpoint)
+        return circuit is not None and circuit.opened_at is not None
+
+    def check(self, endpoint: str) -> bool:
+        """Raise ``CircuitOpenError`` unless a request to ``endpoint`` may go.
+
+        Returns whether the request is the circuit's trial. Its outcome must
+        be recorded with ``succeeded`` or ``failed``, or the trial ended with
+        ``release``, or the circuit stays open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return False
+            retry_in = circuit.opened_at + self.reset_timeout - self._clock()
+            if retry_in > 0 or circuit.trial:
+                raise CircuitOpenError(endpoint, max(retry_in, 0.0))
+            circuit.trial = True
+            return True
+
+    def release(self, endpoint: str) -> None:
+        """End a trial of ``endpoint`` that recorded no outcome.
+
+        The circuit stays open and the next request after it is a new trial.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None:
+                circuit.trial = False
+
+    def succeeded(self, endpoint: str) -> None:
+        """Record that ``endpoint`` answered, closing its circuit."""
+        circuit = self._circuits.get(endpoint)
+        if circuit is None or (not circuit.failures and circuit.opened_at is None):
+            return
+        with self._lock:
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.trial = False
+
+    def failed(self, endpoint: str) -> None:
+        """Record a server error or connection failure of ``endpoint``."""
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            if circuit.trial or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = self._clock()
+                circuit.trial = False
@@ -0,0 +1,33 @@
+"""Pooled keep-alive HTTP sessions for the Kalshi clients."""
+
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 30.0)
+
+
+def make_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> requests.Session:
+    """Create a session that keeps connections alive and pools them.
+
+    ``pool_connections`` is the number of hosts to keep pools for and
+    ``pool_maxsize`` the number of connections kept open per host, which should
+    be at least the number of threads sharing the session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
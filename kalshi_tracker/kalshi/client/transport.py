@@ -0,0 +1,267 @@
+"""Record API responses to disk and replay them without the network.
+
+``RecordReplayAdapter`` is a ``requests`` transport adapter mounted on a
+client's session, below signing, rate limiting and retries:
+
+- ``record`` sends every request and saves the response,
+- ``replay`` answers from the saved responses only, never touching the
+  network, and raises ``ReplayMissError`` for a request it has not seen,
+- ``passthrough`` sends every request and saves nothing.
+
+Responses are stored in one SQLite file, bodies zlib-compressed, keyed by
+the method, the URL path, the sorted query parameters and a digest of the
+request body. The host is left out of the key, so a store recorded against
+the exchange can be replayed against any base URL, e.g. a ``FakeExchange``.
+Signatures and other headers are not stored; they carry a timestamp and
+would never match again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from http.client import responses as reasons
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from requests import PreparedRequest
+
+RECORD = "record"
+REPLAY = "replay"
+PASSTHROUGH = "passthrough"
+MODES = (RECORD, REPLAY, PASSTHROUGH)
+
+# response headers worth keeping
+STORED_HEADERS = ("Content-Type", "Retry-After")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    recorded_at REAL NOT NULL
+)
+"""
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def request_key(method: str, url: str, body: bytes | str | None = None) -> str:
+    """Normalize a request to its store key.
+
+    The key is the method, the path and the query parameters sorted by name,
+    plus a digest of the body when there is one.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{method.upper()} {parts.path}"
+    if query:
+        key += f"?{query}"
+    if body:
+        data = body.encode() if isinstance(body, str) else body
+        key += f" #{hashlib.sha256(data).hexdigest()[:16]}"
+    return key
+
+
+class ResponseStore:
+    """Recorded responses in a SQLite file, with an in-memory index.
+
+    The whole store is read into memory when it is opened, so replayed
+    lookups are a dictionary lookup and a decompression.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open, or create, the store at ``path``."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(_SCHEMA)
+        self._lock = threading.Lock()
+        self._rows: dict[str, tuple[int, str, bytes]] = {
+            key: (status, headers, body)
+            for key, status, headers, body in self._db.execute(
+                "SELECT key, status, headers, body FROM responses",
+            )
+        }
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a response is stored under ``key``."""
+        return key in self._rows
+
+    def get(self, key: str) -> tuple[int, dict[str, str], bytes] | None:
+        """Get the status, headers and body stored under ``key``."""
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        status, headers, body = row
+        return status, json.loads(headers), zlib.decompress(body)
+
+    def put(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> None:
+        """Store a response under ``key``, replacing an older one."""
+        row = (status, json.dumps(headers), zlib.compress(body))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, method, url, *row, time.time()),
+            )
+            self._db.commit()
+            self._rows[key] = row
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+class RecordReplayAdapter(BaseAdapter):
+    """A transport adapter that records, replays or passes requests through.
+
+    ``adapter`` sends the requests that go to the network; it defaults to a
+    plain ``HTTPAdapter``. ``hits``, ``misses`` and ``recorded`` count what
+    the adapter did.
+    """
+
+    def __init__(
+        self,
+        store: ResponseStore,
+        mode: str = REPLAY,
+        adapter: BaseAdapter | None = None,
+    ) -> None:
+        """Initialize the adapter over ``store`` in ``mode``."""
+        if mode not in MODES:
+            msg = f"Mode must be one of {MODES}, got {mode!r}."
+            raise ValueError(msg)
+        super().__init__()
+        self.store = store
+        self.mode = mode
+        self.adapter = adapter if adapter is not None else HTTPAdapter()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    def send(  # noqa: PLR0913
+        self,
+        request: PreparedRequest,
+        stream: bool = False,  # noqa: FBT001, FBT002
+        timeout: float | tuple[float | None, float | None] | None = None,
+        verify: bool | str = True,  # noqa: FBT002
+        cert: str | tuple[str, str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """Answer ``request`` according to the mode.
+
+        The other arguments are those of ``BaseAdapter.send``, passed on to the
+        wrapped adapter.
+        """
+        options: dict[str, Any] = {
+            "stream": stream,
+            "timeout": timeout,
+            "verify": verify,
+            "cert": cert,
+            "proxies": proxies,
+        }
+        if self.mode == PASSTHROUGH:
+            return self.adapter.send(request, **options)
+
+        key = request_key(request.method or "GET", request.url or "", _body(request))
+        if self.mode == REPLAY:
+            stored = self.store.get(key)
+            if stored is None:
+                self.misses += 1
+                raise ReplayMissError(key)
+            self.hits += 1
+            return _build_response(request, *stored)
+
+        response = self.adapter.send(request, **options)
+        headers = {
+            name: response.headers[name]
+            for name in STORED_HEADERS
+            if name in response.headers
+        }
+        self.store.put(
+            key,
+            request.method or "GET",
+            request.url or "",
+            response.status_code,
+            headers,
+            response.content,
+        )
+        self.recorded += 1
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.adapter.close()
+
+
+def _body(request: PreparedRequest) -> bytes | str | None:
+    """Get the body of ``request`` to key it by."""
+    body = request.body
+    if body is None or isinstance(body, bytes | str):
+        return body
+    msg = "Streamed request bodies cannot be recorded or replayed."
+    raise TypeError(msg)
+
+
+def _build_response(
+    request: PreparedRequest,
+    status: int,
+    headers: dict[str, str],
+    body: bytes,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reasons.get(status, "")
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body  # noqa: SLF001
+    response.url = request.url or ""
+    response.request = request
+    response.encoding = "utf-8"
+    return response
+
+
+def mount_store(
+    session: requests.Session,
+    store: ResponseStore | str | Path,
+    mode: str = REPLAY,
+) -> RecordReplayAdapter:
+    """Route a session's requests through a ``RecordReplayAdapter``.
+
+    The session's current adapter, with its connection pool, sends whatever
+    goes to the network.
+    """
+    if not isinstance(store, ResponseStore):
+        store = ResponseStore(store)
+    adapter = RecordReplayAdapter(store, mode, session.get_adapter("https://"))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
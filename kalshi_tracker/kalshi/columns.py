@@ -0,0 +1,247 @@
+"""Build typed columns straight from paginated API responses.
+
+``pd.DataFrame.from_records`` followed by per-column cleanup walks every
+record and every column several times and has to infer each column's type
+and date format. ``ColumnBuilder`` instead knows the columns of each record
+type up front: pages are appended to one buffer per column, and on build
+every column is converted once, with all price columns scaled from cents to
+dollars in a single vectorized pass and timestamps parsed as ISO 8601.
+"""
+
+from __future__ import annotations
+
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pyarrow as pa
+
+# column kinds
+STR = "str"
+INT = "int"
+BOOL = "bool"
+TIME = "time"
+# integer cents, built as float dollars
+CENTS = "cents"
+
+MARKET_COLUMNS = {
+    "ticker": STR,
+    "event_ticker": STR,
+    "status": STR,
+    "yes_bid": CENTS,
+    "yes_ask": CENTS,
+    "no_bid": CENTS,
+    "no_ask": CENTS,
+    "last_price": CENTS,
+    "previous_yes_bid": CENTS,
+    "previous_yes_ask": CENTS,
+    "previous_price": CENTS,
+    "liquidity": CENTS,
+    "volume": INT,
+    "volume_24h": INT,
+    "open_interest": INT,
+    "open_time": TIME,
+    "close_time": TIME,
+    "expiration_time": TIME,
+    "result": STR,
+}
+POSITION_COLUMNS = {
+    "ticker": STR,
+    "position": INT,
+    "market_exposure": CENTS,
+    "realized_pnl": CENTS,
+    "total_traded": CENTS,
+    "fees_paid": CENTS,
+    "resting_orders_count": INT,
+}
+TRADE_COLUMNS = {
+    "trade_id": STR,
+    "ticker": STR,
+    "count": INT,
+    "yes_price": CENTS,
+    "no_price": CENTS,
+    "taker_side": STR,
+    "created_time": TIME,
+}
+FILL_COLUMNS = {
+    "trade_id": STR,
+    "order_id": STR,
+    "ticker": STR,
+    "side": STR,
+    "action": STR,
+    "count": INT,
+    "yes_price": CENTS,
+    "no_price": CENTS,
+    "is_taker": BOOL,
+    "created_time": TIME,
+}
+
+# columns by the key that holds the records in a response page
+SCHEMAS = {
+    "markets": MARKET_COLUMNS,
+    "market_positions": POSITION_COLUMNS,
+    "trades": TRADE_COLUMNS,
+    "fills": FILL_COLUMNS,
+}
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class ColumnBuilder:
+    """Accumulate API records column by column and build typed arrays.
+
+    ``columns`` is one of ``SCHEMAS`` or the key of one, e.g. ``"markets"``.
+    Records missing a column get a missing value; other keys are ignored.
+    When a page has no cents field but its ``_dollars`` string, the dollars
+    are used as they are.
+    """
+
+    def __init__(self, columns: str | dict[str, str]) -> None:
+        """Initialize empty buffers for the columns."""
+        self.key = columns if isinstance(columns, str) else None
+        self.columns = SCHEMAS[columns] if isinstance(columns, str) else columns
+        self._buffers: dict[str, list[Any]] = {name: [] for name in self.columns}
+        # row ranges of each price column read from ``_dollars`` fields,
+        # which are not scaled
+        self._dollars: dict[str, list[tuple[int, int]]] = {
+            name: [] for name, kind in self.columns.items() if kind == CENTS
+        }
+
+    def __len__(self) -> int:
+        """Return the number of records added."""
+        return len(next(iter(self._buffers.values()), ()))
+
+    def add_page(self, page: dict[str, Any], key: str | None = None) -> None:
+        """Add the records listed under ``key`` of a response page.
+
+        ``key`` defaults to the schema's key; a builder made from a columns
+        dict needs it.
+        """
+        key = key or self.key
+        if key is None:
+            msg = "The page key is needed for columns given as a dict."
+            raise ValueError(msg)
+        self.extend(page[key])
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> None:
+        """Add records, e.g. from one of the ``ExchangeClient.iter_*`` methods."""
+        records = iter(records)
+        while chunk := list(islice(records, DEFAULT_CHUNK_SIZE)):
+            self._add_chunk(chunk)
+
+    def _add_chunk(self, records: list[dict[str, Any]]) -> None:
+        first = records[0]
+        for name, buffer in self._buffers.items():
+            field = name
+            if name in self._dollars and name not in first:
+                field = f"{name}_dollars"
+                if field in first:
+                    rows = (len(buffer), len(buffer) + len(records))
+                    self._dollars[name].append(rows)
+            # one pass in C over the chunk per column
+            buffer.extend(map(dict.get, records, repeat(field)))
+
+    # building
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """Build one array per column.
+
+        Strings are object arrays, times ``datetime64[ns]`` in UTC and prices
+        float dollars. Integer columns are ``int64``, or ``float64`` with NaN
+        when values are missing.
+        """
+        arrays: dict[str, np.ndarray] = {}
+        for name, kind in self.columns.items():
+            values = self._buffers[name]
+            if kind == STR:
+                arrays[name] = np.array(values, dtype=object)
+            elif kind == INT:
+                arrays[name] = _int_array(values)
+            elif kind == BOOL:
+                arrays[name] = _bool_array(values)
+            elif kind == TIME:
+                arrays[name] = _time_array(values)
+        arrays.update(self._prices())
+        return {name: arrays[name] for name in self.columns}
+
+    def _prices(self) -> dict[str, np.ndarray]:
+        """Scale every price column to dollars in one pass over one block."""
+        names = list(self._dollars)
+        if not names:
+            return {}
+        block = np.empty((len(names), len(self)), dtype=np.float64)
+        for row, name in zip(block, names, strict=True):
+            values = self._buffers[name]
+            if values.count(None) == len(values):
+                row[:] = np.nan
+            else:
+                row[:] = values
+        if any(self._dollars.values()):
+            divisor = np.full(block.shape, 100.0)
+            for i, name in enumerate(names):
+                for start, stop in self._dollars[name]:
+                    divisor[i, start:stop] = 1.0
+            block /= divisor
+        else:
+            block /= 100
+        return dict(zip(names, block, strict=True))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build a DataFrame over the column arrays without copying them."""
+        frame = pd.DataFrame(self.to_numpy(), copy=False)
+        for name, kind in self.columns.items():
+            if kind == TIME:
+                frame[name] = frame[name].dt.tz_localize("UTC")
+        return frame
+
+    def to_arrow(self) -> pa.Table:
+        """Build an Arrow table; numeric columns share the NumPy buffers."""
+        import pyarrow as pa
+
+        types = {STR: pa.string(), TIME: pa.timestamp("ns", tz="UTC")}
+        arrays = self.to_numpy()
+        return pa.table(
+            {
+                name: pa.array(arrays[name], type=types.get(kind), from_pandas=True)
+                for name, kind in self.columns.items()
+            },
+        )
+
+
+def _int_array(values: list[Any]) -> np.ndarray:
+    try:
+        return np.fromiter(values, dtype=np.int64, count=len(values))
+    except TypeError:
+        # None among the values
+        return np.array(values, dtype=np.float64)
+
+
+def _time_array(values: list[str | None]) -> np.ndarray:
+    """Parse UTC ISO 8601 times like ``2024-01-01T00:00:00Z`` to ``datetime64[ns]``."""
+    missing = values.count(None)
+    if missing == len(values):
+        return np.full(len(values), np.datetime64("NaT", "ns"))
+    if sum(v.endswith("Z") for v in values if v is not None) == len(values) - missing:
+        # NumPy parses plain ISO 8601 much faster than pandas parses offsets
+        plain = [v[:-1] if v is not None else "NaT" for v in values]
+        return np.array(plain, dtype="datetime64[ns]")
+    times = pd.to_datetime(values, format="ISO8601", utc=True)
+    return times.tz_localize(None).as_unit("ns").to_numpy()
+
+
+def _bool_array(values: list[Any]) -> np.ndarray:
+    if None in values:
+        return np.array(values, dtype=object)
+    return np.array(values, dtype=bool)
+
+
+def build_frame(records: Iterable[dict[str, Any]], key: str) -> pd.DataFrame:
+    """Build a typed DataFrame of ``key`` records, e.g. ``"markets"``."""
+    builder = ColumnBuilder(key)
+    builder.extend(records)
+    return builder.to_frame()
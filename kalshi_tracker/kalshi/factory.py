@@ -1,31 +1,130 @@
-"""Factory Methods for kalshi API."""
+"""Factory Methods for kalshi API.
+
+The settings, private keys and the ``get_kalshi`` client are built once per
+process and reused, so short-lived jobs pay for reading ``.env`` and parsing
+the PEM key once. ``clear_cache`` forgets them, e.g. after the settings or the
+key file changed.
+"""
 
 from __future__ import annotations
 
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 from .client.exchange_client import ExchangeClient
+from .client.rate_limiter import get_rate_limiter
+from .client.session import make_session
+from .client.transport import mount_store
 from .keys import load_private_key_from_file
-from .settings.key_settings import KalshiKeySettings
+
+if TYPE_CHECKING:
+    import requests
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+    from kalshi_tracker.config import Settings
+
+    from .settings.key_settings import KalshiKeySettings
+
+_cache_lock = threading.RLock()
+_settings: Settings | None = None
+_client: ExchangeClient | None = None
+# the modification time and parsed key of each key file, by path
+_keys: dict[str, tuple[int, RSAPrivateKey]] = {}
+
+
+def get_settings() -> Settings:
+    """Get the project settings, read from the environment once per process."""
+    global _settings  # noqa: PLW0603
+    with _cache_lock:
+        if _settings is None:
+            from kalshi_tracker import config
+
+            _settings = config.Settings()
+        return _settings
+
+
+def get_private_key(key_file: str | Path) -> RSAPrivateKey:
+    """Load a private key, parsing each version of the file only once.
+
+    A key file that is replaced or edited is read again, replacing the key
+    parsed from its earlier version.
+    """
+    path = Path(key_file)
+    try:
+        resolved, mtime = str(path.resolve()), path.stat().st_mtime_ns
+    except OSError:
+        return load_private_key_from_file(path)
+    with _cache_lock:
+        cached = _keys.get(resolved)
+        if cached is None or cached[0] != mtime:
+            cached = _keys[resolved] = (mtime, load_private_key_from_file(path))
+        return cached[1]
 
 
 def get_kalshi() -> ExchangeClient:
-    """Get kalshi API key from environment vairables."""
-    from kalshi_tracker import config
+    """Get the kalshi API client configured by the environment variables.
+
+    The client is created on the first call and shared by later ones.
+    """
+    global _client  # noqa: PLW0603
+    with _cache_lock:
+        if _client is None:
+            settings = get_settings()
+            if settings.kalshi_keys is None:
+                raise ValueError("Kalshi keys are not set")
+            _client = get_kalshi_from_settings(settings.kalshi_keys)
+        return _client
+
 
-    settings = config.Settings()
+def clear_cache() -> None:
+    """Forget the cached settings, keys and client."""
+    global _settings, _client  # noqa: PLW0603
+    with _cache_lock:
+        _settings = None
+        _client = None
+        _keys.clear()
+
+
+def get_session_from_settings(settings: KalshiKeySettings) -> requests.Session:
+    """Get a pooled HTTP session sized by the key settings.
+
+    With a ``transport_store`` the session records to or replays from it.
+    """
+    session = make_session(
+        pool_connections=settings.pool_connections,
+        pool_maxsize=settings.pool_maxsize,
+    )
+    if settings.transport_store is not None:
+        mount_store(session, settings.transport_store, settings.transport_mode)
+    return session
 
-    if settings.kalshi_keys is None:
-        raise ValueError("Kalshi keys are not set")
 
-    return get_kalshi_from_settings(settings.kalshi_keys)
+def get_kalshi_from_settings(
+    settings: KalshiKeySettings,
+    session: requests.Session | None = None,
+) -> ExchangeClient:
+    """Get kalshi API client from key settings.
 
+    Pass ``session`` to share one connection pool between several clients.
+    """
 
-def get_kalshi_from_settings(settings: KalshiKeySettings) -> ExchangeClient:
-    """Get kalshi API client from key settings."""
+    private_key = get_private_key(settings.key_file)
 
-    private_key = load_private_key_from_file(settings.key_file)
+    if session is None:
+        session = get_session_from_settings(settings)
 
     return ExchangeClient(
         exchange_api_base=settings.host,
         key_id=settings.key,
         private_key=private_key,
+        session=session,
+        timeout=(settings.connect_timeout, settings.read_timeout),
+        rate_limiter=get_rate_limiter(
+            settings.key,
+            read_rate=settings.read_rate,
+            write_rate=settings.write_rate,
+            read_burst=settings.read_burst,
+            write_burst=settings.write_burst,
+        ),
     )
@@ -0,0 +1,228 @@
+"""Compact typed records for the Kalshi API responses.
+
+The clients return plain dicts. For large pages, ``decode_page`` and
+``iter_models`` turn them into slotted dataclass records instead, which hold
+the same fields in about two thirds of the memory since the keys are not
+repeated in every record. Prices are converted to integer cents once, when a record is
+built: the exchange sends cents as integers and, in newer fields, dollars as
+strings such as ``"0.4200"`` under a ``_dollars`` suffix.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from decimal import ROUND_HALF_EVEN, Decimal
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar
+
+from kalshi_tracker.kalshi.client.json_codec import loads
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+R = TypeVar("R", bound="Record")
+
+
+def to_cents(value: float | str | None) -> int | None:
+    """Convert integer cents, or dollars as a string or float, to integer cents.
+
+    Fractions of a cent are rounded half to even.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    # a float's repr is the shortest decimal that round-trips, e.g. 0.29
+    cents = Decimal(str(value)) * 100
+    return int(cents.quantize(Decimal(1), ROUND_HALF_EVEN))
+
+
+class Record:
+    """Base of the typed records; subclasses are slotted dataclasses."""
+
+    __slots__ = ()
+    # fields holding prices or amounts in cents
+    prices: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Build a record from an API response dict, ignoring unknown keys."""
+        return _builder(cls)(data)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record's fields as a dictionary."""
+        names = (f.name for f in fields(self))  # type: ignore[arg-type]
+        return {name: getattr(self, name) for name in names}
+
+
+# record builders by record type, made on first use
+_builders: dict[type[Record], Callable[[dict[str, Any]], Record]] = {}
+
+
+def _builder(model: type[R]) -> Callable[[dict[str, Any]], R]:
+    """Get the function building ``model`` records from response dicts."""
+    build = _builders.get(model)
+    if build is None:
+        build = _builders.setdefault(model, _make_builder(model))
+    return build  # type: ignore[return-value]
+
+
+def _make_builder(model: type[R]) -> Callable[[dict[str, Any]], R]:
+    """Make a function building ``model`` records from response dicts."""
+    names = tuple(f.name for f in fields(model))  # type: ignore[arg-type]
+    prices = [
+        (i, f"{name}_dollars") for i, name in enumerate(names) if name in model.prices
+    ]
+    # one C call per record while pages carry every field
+    getter = itemgetter(*names)
+    complete = True
+
+    def build(data: dict[str, Any]) -> R:
+        nonlocal complete
+        values: Sequence[Any]
+        if complete:
+            try:
+                values = getter(data)
+            except KeyError:
+                complete = False
+        if not complete:
+            values = tuple(map(data.get, names))
+
+        converted = None
+        for i, dollars in prices:
+            value = values[i]
+            if type(value) is not int:
+                if converted is None:
+                    converted = list(values)
+                converted[i] = to_cents(data.get(dollars) if value is None else value)
+        return model(*(values if converted is None else converted))
+
+    return build
+
+
+@dataclass(slots=True)
+class Market(Record):
+    """A market from ``get_markets`` or ``get_market``."""
+
+    close_time: str | None
+    event_ticker: str | None
+    last_price: int | None
+    liquidity: int | None
+    no_ask: int | None
+    no_bid: int | None
+    open_interest: int | None
+    open_time: str | None
+    previous_price: int | None
+    previous_yes_ask: int | None
+    previous_yes_bid: int | None
+    result: str | None
+    status: str | None
+    subtitle: str | None
+    ticker: str | None
+    title: str | None
+    volume: int | None
+    volume_24h: int | None
+    yes_ask: int | None
+    yes_bid: int | None
+
+    prices = (
+        "last_price",
+        "liquidity",
+        "no_ask",
+        "no_bid",
+        "previous_price",
+        "previous_yes_ask",
+        "previous_yes_bid",
+        "yes_ask",
+        "yes_bid",
+    )
+
+
+@dataclass(slots=True)
+class Trade(Record):
+    """A public trade from ``get_trades``."""
+
+    count: int | None
+    created_time: str | None
+    no_price: int | None
+    taker_side: str | None
+    ticker: str | None
+    trade_id: str | None
+    yes_price: int | None
+
+    prices = ("no_price", "yes_price")
+
+
+@dataclass(slots=True)
+class Fill(Record):
+    """One of the user's fills from ``get_fills``."""
+
+    action: str | None
+    count: int | None
+    created_time: str | None
+    is_taker: bool | None
+    no_price: int | None
+    order_id: str | None
+    side: str | None
+    ticker: str | None
+    trade_id: str | None
+    yes_price: int | None
+
+    prices = ("no_price", "yes_price")
+
+
+@dataclass(slots=True)
+class Order(Record):
+    """One of the user's orders from ``get_orders``."""
+
+    action: str | None
+    client_order_id: str | None
+    created_time: str | None
+    expiration_time: str | None
+    no_price: int | None
+    order_id: str | None
+    remaining_count: int | None
+    side: str | None
+    status: str | None
+    ticker: str | None
+    type: str | None
+    yes_price: int | None
+
+    prices = ("no_price", "yes_price")
+
+
+@dataclass(slots=True)
+class Position(Record):
+    """One of the user's market positions from ``get_positions``."""
+
+    fees_paid: int | None
+    market_exposure: int | None
+    position: int | None
+    realized_pnl: int | None
+    resting_orders_count: int | None
+    ticker: str | None
+    total_traded: int | None
+
+    prices = ("fees_paid", "market_exposure", "realized_pnl", "total_traded")
+
+
+# record type by the key that holds the records in a response page
+MODELS: dict[str, type[Record]] = {
+    "markets": Market,
+    "trades": Trade,
+    "fills": Fill,
+    "orders": Order,
+    "market_positions": Position,
+}
+
+
+def iter_models(
+    records: Iterable[dict[str, Any]],
+    model: type[R],
+) -> Iterator[R]:
+    """Build typed records lazily, e.g. from ``ExchangeClient.iter_markets``."""
+    return map(_builder(model), records)
+
+
+def decode_page(data: bytes | str | dict[str, Any], key: str) -> list[Record]:
+    """Decode the records under ``key`` of a raw or parsed response page."""
+    page = loads(data) if isinstance(data, bytes | str) else data
+    return list(map(_builder(MODELS[key]), page[key]))
@@ -0,0 +1,174 @@
+"""Array-backed in-memory orderbook for a Kalshi market."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# prices are whole cents from 1 to 99; index 0 and 100 stay empty
+N_PRICES = 101
+MAX_PRICE = 99
+SIDES = ("yes", "no")
+
+
+class OrderBook:
+    """Resting yes and no bids of one market, indexed by price in cents.
+
+    Kalshi books only hold bids: a no bid at ``p`` is a yes ask at ``100 - p``
+    and vice versa. Quantities live in two fixed-size integer arrays so
+    snapshots, deltas and the best prices cost O(1) and walking the book for
+    fill simulation is a short vectorized pass over at most 99 levels.
+    """
+
+    __slots__ = ("_best", "levels", "ticker")
+
+    def __init__(self, ticker: str | None = None) -> None:
+        """Initialize an empty book."""
+        self.ticker = ticker
+        self.levels = {side: np.zeros(N_PRICES, dtype=np.int64) for side in SIDES}
+        # best bid price per side, 0 when the side is empty
+        self._best = {side: 0 for side in SIDES}
+
+    @classmethod
+    def from_response(
+        cls,
+        response: dict[str, Any],
+        ticker: str | None = None,
+    ) -> OrderBook:
+        """Build a book from a ``get_orderbook`` response."""
+        book = cls(ticker)
+        orderbook = response.get("orderbook", response)
+        book.apply_snapshot(orderbook.get("yes"), orderbook.get("no"))
+        return book
+
+    # updates
+
+    def apply_snapshot(
+        self,
+        yes: Iterable[Iterable[int]] | None,
+        no: Iterable[Iterable[int]] | None,
+    ) -> None:
+        """Replace the book with ``[price, quantity]`` levels for each side."""
+        for side, side_levels in zip(SIDES, (yes, no), strict=True):
+            levels = self.levels[side]
+            levels[:] = 0
+            for price, quantity in side_levels or ():
+                levels[_check_price(price)] = quantity
+            self._best[side] = _best_price(levels)
+
+    def apply_delta(self, side: str, price: int, delta: int) -> None:
+        """Change the resting quantity of ``side`` bids at ``price`` by ``delta``."""
+        levels = self.levels[side]
+        quantity = levels[_check_price(price)] + delta
+        if quantity < 0:
+            msg = f"Delta {delta} leaves {side} {price} with negative quantity."
+            raise ValueError(msg)
+        levels[price] = quantity
+
+        best = self._best[side]
+        if quantity and price > best:
+            self._best[side] = price
+        elif not quantity and price == best:
+            self._best[side] = _best_price(levels[:price])
+
+    # top of book
+
+    def best_bid(self, side: str = "yes") -> int | None:
+        """Highest resting bid for ``side`` in cents."""
+        return self._best[side] or None
+
+    def best_ask(self, side: str = "yes") -> int | None:
+        """Lowest price ``side`` can be bought at in cents."""
+        other = self._best[_other(side)]
+        return 100 - other if other else None
+
+    @property
+    def spread(self) -> int | None:
+        """Yes ask minus yes bid in cents."""
+        bid, ask = self.best_bid("yes"), self.best_ask("yes")
+        return None if bid is None or ask is None else ask - bid
+
+    @property
+    def mid(self) -> float | None:
+        """Midpoint of the yes bid and ask in cents."""
+        bid, ask = self.best_bid("yes"), self.best_ask("yes")
+        return None if bid is None or ask is None else (bid + ask) / 2
+
+    # depth and fill simulation
+
+    def depth(self, side: str) -> np.ndarray:
+        """Cumulative bid quantity of ``side`` at each price or better.
+
+        ``depth(side)[p]`` is how many contracts can be sold into ``side``
+        bids at a price of at least ``p``.
+        """
+        return np.cumsum(self.levels[side][::-1])[::-1]
+
+    def fillable(self, side: str, limit_price: int) -> int:
+        """Contracts of ``side`` that can be bought at ``limit_price`` or better."""
+        floor = 100 - limit_price
+        if floor > MAX_PRICE:
+            return 0
+        return int(self.levels[_other(side)][max(floor, 1) :].sum())
+
+    def buy_vwap(self, side: str, size: int) -> tuple[float | None, int]:
+        """Average price in cents to buy ``size`` contracts of ``side``.
+
+        Walks the other side's bids from the best price. Returns the average
+        price and the quantity actually filled, which is less than ``size``
+        when the book is too thin.
+        """
+        # other side bids from best (highest) down, i.e. our ask ascending
+        quantities = self.levels[_other(side)][MAX_PRICE:0:-1]
+        prices = 100 - np.arange(MAX_PRICE, 0, -1)
+        return _vwap(quantities, prices, size)
+
+    def sell_vwap(self, side: str, size: int) -> tuple[float | None, int]:
+        """Average price in cents to sell ``size`` contracts of ``side``."""
+        quantities = self.levels[side][MAX_PRICE:0:-1]
+        prices = np.arange(MAX_PRICE, 0, -1)
+        return _vwap(quantities, prices, size)
+
+    def to_dict(self) -> dict[str, list[list[int]]]:
+        """Return the book as ``get_orderbook`` style price levels."""
+        return {
+            side: [
+                [int(price), int(self.levels[side][price])]
+                for price in np.flatnonzero(self.levels[side])
+            ]
+            for side in SIDES
+        }
+
+
+def _check_price(price: int) -> int:
+    if not 1 <= price <= MAX_PRICE:
+        msg = f"Price {price} is outside 1-{MAX_PRICE} cents."
+        raise ValueError(msg)
+    return price
+
+
+def _best_price(levels: np.ndarray) -> int:
+    nonzero = np.flatnonzero(levels)
+    return int(nonzero[-1]) if len(nonzero) else 0
+
+
+def _other(side: str) -> str:
+    return "no" if side == "yes" else "yes"
+
+
+def _vwap(
+    quantities: np.ndarray,
+    prices: np.ndarray,
+    size: int,
+) -> tuple[float | None, int]:
+    """Average price of taking ``size`` from levels in priority order."""
+    before = np.cumsum(quantities) - quantities
+    taken = np.clip(size - before, 0, quantities)
+    filled = int(taken.sum())
+    if not filled:
+        return None, 0
+    return float(taken @ prices) / filled, filled
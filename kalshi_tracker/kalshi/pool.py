@@ -0,0 +1,146 @@
+"""Clients for several Kalshi accounts, queried together."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .factory import get_kalshi_from_settings, get_session_from_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+    import requests
+
+    from .client.exchange_client import ExchangeClient
+    from .settings.key_settings import KalshiKeySettings
+
+T = TypeVar("T")
+
+DEFAULT_POOL_WORKERS = 8
+
+# the field naming a record's account in merged results
+ACCOUNT_FIELD = "account"
+
+
+class ClientPool:
+    """One client per account, with calls fanned out across all of them.
+
+    Each account is named by its settings' ``name``, or its key id. The
+    ``get_*`` methods run for every account concurrently, up to
+    ``max_workers`` at once, and merge the answers: records are tagged with
+    their ``account``, scalars are keyed by it. A call that fails for any
+    account raises once every account has finished.
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[str, ExchangeClient],
+        max_workers: int = DEFAULT_POOL_WORKERS,
+    ) -> None:
+        """Initialize a pool of clients keyed by account name."""
+        self.clients = dict(clients)
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Iterable[KalshiKeySettings],
+        session: requests.Session | None = None,
+        max_workers: int = DEFAULT_POOL_WORKERS,
+    ) -> ClientPool:
+        """Create a client per key, all sharing one connection pool.
+
+        Each key keeps its own rate budget. Without ``session`` one is made
+        from the first key's settings, with as many connections per host as
+        the largest ``pool_maxsize`` of any key.
+        """
+        settings = list(settings)
+        if not settings:
+            raise ValueError("At least one account is required.")
+        names = [s.name or s.key for s in settings]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            msg = f"Duplicate account names: {duplicates}."
+            raise ValueError(msg)
+
+        if session is None:
+            session = get_session_from_settings(
+                settings[0].model_copy(
+                    update={
+                        "pool_connections": max(s.pool_connections for s in settings),
+                        "pool_maxsize": max(s.pool_maxsize for s in settings),
+                    },
+                ),
+            )
+        clients = {
+            name: get_kalshi_from_settings(s, session=session)
+            for name, s in zip(names, settings, strict=True)
+        }
+        return cls(clients, max_workers=max_workers)
+
+    def __len__(self) -> int:
+        """Return the number of accounts."""
+        return len(self.clients)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the account names."""
+        return iter(self.clients)
+
+    def __getitem__(self, account: str) -> ExchangeClient:
+        """Get the client of ``account``."""
+        return self.clients[account]
+
+    def map(self, func: Callable[[ExchangeClient], T]) -> dict[str, T]:
+        """Call ``func`` with every account's client concurrently.
+
+        Returns the answers keyed by account, in the pool's order.
+        """
+        if not self.clients:
+            return {}
+        workers = min(self.max_workers, len(self.clients))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            answers = list(executor.map(func, self.clients.values()))
+        return dict(zip(self.clients, answers, strict=True))
+
+    def _gather(
+        self,
+        func: Callable[[ExchangeClient], Iterable[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        merged: list[dict[str, Any]] = []
+        for account, records in self.map(lambda c: list(func(c))).items():
+            merged.extend({**record, ACCOUNT_FIELD: account} for record in records)
+        return merged
+
+    def get_balance(self) -> dict[str, int]:
+        """Get every account's balance in cents."""
+        return {
+            account: answer["balance"]
+            for account, answer in self.map(lambda c: c.get_balance()).items()
+        }
+
+    def get_positions(
+        self,
+        settlement_status: str | None = None,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get every account's market positions matching the filters."""
+        return self._gather(
+            lambda c: c.iter_positions(
+                settlement_status=settlement_status,
+                ticker=ticker,
+                event_ticker=event_ticker,
+            ),
+        )
+
+    def get_fills(
+        self,
+        ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get every account's fills matching the filters."""
+        return self._gather(
+            lambda c: c.iter_fills(ticker=ticker, min_ts=min_ts, max_ts=max_ts),
+        )
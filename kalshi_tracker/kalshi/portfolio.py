@@ -0,0 +1,257 @@
+"""Long-lived mark-to-market valuation of a Kalshi portfolio."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .client.exchange_client import ExchangeClient
+
+DEFAULT_CAPACITY = 1024
+
+
+class PortfolioValuator:
+    """Positions and prices in arrays aligned by ticker, revalued per update.
+
+    Positions follow the exchange's sign convention: positive counts are yes
+    contracts, negative counts no contracts. Amounts are kept in cents. Each
+    ticker owns one slot of the arrays; a price, probability or fill update
+    recomputes that slot only and moves the portfolio totals by its change, so
+    a tick costs the same for a book of ten positions or ten thousand.
+
+    Positions without a price are marked at cost.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize an empty portfolio."""
+        self.slots: dict[str, int] = {}
+        self.tickers: list[str] = []
+        self.position = np.zeros(capacity, dtype=np.int64)
+        # cost of the open contracts and P&L locked in by closing them
+        self.exposure = np.zeros(capacity, dtype=np.int64)
+        self.realized = np.zeros(capacity, dtype=np.int64)
+        # yes price and our own yes probability, NaN when unknown
+        self.yes_price = np.full(capacity, np.nan)
+        self.my_prob = np.full(capacity, np.nan)
+        # per slot results, kept current by ``_revalue_slot``
+        self.value = np.zeros(capacity)
+        self.market_payout = np.zeros(capacity)
+        self.my_payout = np.zeros(capacity)
+
+        self.total_value = 0.0
+        self.total_exposure = 0
+        self.total_realized = 0
+        self.total_market_payout = 0.0
+        self.total_my_payout = 0.0
+
+    @classmethod
+    def from_client(cls, client: ExchangeClient) -> PortfolioValuator:
+        """Load the user's open positions and mark them at their markets."""
+        valuator = cls()
+        valuator.load_positions(client.iter_positions())
+        markets = client.get_markets_by_tickers(valuator.tickers)
+        for ticker, market in markets.items():
+            valuator.update_price(ticker, _mark_price(market))
+        return valuator
+
+    def __len__(self) -> int:
+        """Return the number of tickers tracked."""
+        return len(self.tickers)
+
+    def slot(self, ticker: str) -> int:
+        """Get the array index of a ticker, adding it when it is new."""
+        slot = self.slots.get(ticker)
+        if slot is None:
+            slot = self.slots[ticker] = len(self.tickers)
+            self.tickers.append(ticker)
+            if slot == len(self.position):
+                self._grow()
+        return slot
+
+    def _grow(self) -> None:
+        # double the capacity, starting from a single slot when it is 0
+        extra = max(1, len(self.position))
+        for name in (
+            "position",
+            "exposure",
+            "realized",
+            "value",
+            "market_payout",
+            "my_payout",
+        ):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros(extra, array.dtype)]))
+        for name in ("yes_price", "my_prob"):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.full(extra, np.nan)]))
+
+    # updates
+
+    def load_positions(self, positions: Iterable[dict[str, Any]]) -> None:
+        """Set positions from ``get_positions`` market position records."""
+        for record in positions:
+            slot = self.slot(record["ticker"])
+            self.position[slot] = record["position"]
+            self.exposure[slot] = record.get("market_exposure") or 0
+            self.realized[slot] = record.get("realized_pnl") or 0
+        self.revalue()
+
+    def update_price(self, ticker: str, yes_price: float | None) -> None:
+        """Mark a ticker at a yes price in cents, e.g. a trade or the mid."""
+        slot = self.slot(ticker)
+        self.yes_price[slot] = np.nan if yes_price is None else yes_price
+        self._revalue_slot(slot)
+
+    def update_probability(self, ticker: str, yes_probability: float | None) -> None:
+        """Set our own probability that a ticker resolves yes."""
+        slot = self.slot(ticker)
+        self.my_prob[slot] = np.nan if yes_probability is None else yes_probability
+        self._revalue_slot(slot)
+
+    def apply_fill(self, fill: dict[str, Any]) -> None:
+        """Apply one of the user's fills, from ``get_fills`` or the fill channel.
+
+        Contracts of the side already held are bought at and sold back against
+        their average cost; selling more than is held opens the other side.
+        """
+        slot = self.slot(fill["ticker"])
+        count = fill["count"]
+        side, action = fill["side"], fill["action"]
+        yes_price = fill["yes_price"] if side == "yes" else 100 - fill["no_price"]
+        # signed change in yes contracts
+        delta = count if (side == "yes") == (action == "buy") else -count
+
+        position = int(self.position[slot])
+        exposure = int(self.exposure[slot])
+        if position and (position > 0) != (delta > 0):
+            closed = min(abs(delta), abs(position))
+            held_price = yes_price if position > 0 else 100 - yes_price
+            cost = exposure * closed // abs(position)
+            self.realized[slot] += held_price * closed - cost
+            self.total_realized += held_price * closed - cost
+            exposure -= cost
+            position += closed if delta > 0 else -closed
+            delta += -closed if delta > 0 else closed
+        if delta:
+            exposure += abs(delta) * (yes_price if delta > 0 else 100 - yes_price)
+            position += delta
+
+        self.total_exposure += exposure - int(self.exposure[slot])
+        self.position[slot] = position
+        self.exposure[slot] = exposure
+        self._revalue_slot(slot)
+
+    def _slot_values(self, slot: int) -> tuple[float, float, float]:
+        position = int(self.position[slot])
+        qty = abs(position)
+        yes_price = self.yes_price[slot]
+        my_prob = self.my_prob[slot]
+        if np.isnan(yes_price):
+            value = float(self.exposure[slot])
+            market_payout = value
+        else:
+            held = yes_price if position > 0 else 100 - yes_price
+            value = market_payout = qty * held
+        if np.isnan(my_prob):
+            my_payout = market_payout
+        else:
+            my_payout = qty * 100 * (my_prob if position > 0 else 1 - my_prob)
+        return value, market_payout, my_payout
+
+    def _revalue_slot(self, slot: int) -> None:
+        """Recompute one slot and move the totals by its change."""
+        value, market_payout, my_payout = self._slot_values(slot)
+        self.total_value += value - self.value[slot]
+        self.total_market_payout += market_payout - self.market_payout[slot]
+        self.total_my_payout += my_payout - self.my_payout[slot]
+        self.value[slot] = value
+        self.market_payout[slot] = market_payout
+        self.my_payout[slot] = my_payout
+
+    def revalue(self) -> None:
+        """Recompute every slot and the totals from scratch, vectorized."""
+        n = len(self.tickers)
+        position = self.position[:n]
+        qty = np.abs(position)
+        is_yes = position > 0
+        exposure = self.exposure[:n].astype(float)
+
+        held = np.where(is_yes, self.yes_price[:n], 100 - self.yes_price[:n])
+        value = np.where(np.isnan(held), exposure, qty * held)
+        my_held = np.where(is_yes, self.my_prob[:n], 1 - self.my_prob[:n])
+        my_payout = np.where(np.isnan(my_held), value, qty * 100 * my_held)
+
+        self.value[:n] = value
+        self.market_payout[:n] = value
+        self.my_payout[:n] = my_payout
+        self.total_value = float(value.sum())
+        self.total_market_payout = float(value.sum())
+        self.total_my_payout = float(my_payout.sum())
+        self.total_exposure = int(self.exposure[:n].sum())
+        self.total_realized = int(self.realized[:n].sum())
+
+    # results
+
+    @property
+    def unrealized_pnl(self) -> float:
+        """Mark-to-market value minus cost of the open positions, in cents."""
+        return self.total_value - self.total_exposure
+
+    def expected_profit(self, *, mine: bool = False) -> float:
+        """Return the expected payout at settlement minus cost, in cents.
+
+        Uses the market's prices as probabilities, or with ``mine`` our own
+        probabilities where they are set.
+        """
+        payout = self.total_my_payout if mine else self.total_market_payout
+        return payout - self.total_exposure
+
+    def wager_inputs(
+        self,
+        *,
+        mine: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the probabilities, costs and quantities of the open positions.
+
+        These are the ``compute_wager_expectations`` inputs, with costs in
+        dollars as in ``merge_bets_into_postions``.
+        """
+        n = len(self.tickers)
+        qty = np.abs(self.position[:n])
+        open_ = qty > 0
+        payout = (self.my_payout if mine else self.market_payout)[:n]
+        return (
+            payout[open_] / (100 * qty[open_]),
+            self.exposure[:n][open_] / 100,
+            qty[open_],
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the positions with their marks and P&L in dollars."""
+        n = len(self.tickers)
+        return pd.DataFrame(
+            {
+                "ticker": self.tickers,
+                "position": self.position[:n],
+                "yes_price": self.yes_price[:n] / 100,
+                "my_prob": self.my_prob[:n],
+                "exposure": self.exposure[:n] / 100,
+                "value": self.value[:n] / 100,
+                "unrealized_pnl": (self.value[:n] - self.exposure[:n]) / 100,
+                "realized_pnl": self.realized[:n] / 100,
+            },
+        )
+
+
+def _mark_price(market: dict[str, Any]) -> float | None:
+    """Price a market at its last trade, or at its mid if it never traded."""
+    if market["last_price"]:
+        return market["last_price"]
+    if market["yes_bid"] and market["yes_ask"]:
+        return (market["yes_bid"] + market["yes_ask"]) / 2
+    return None
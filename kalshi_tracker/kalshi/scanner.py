@@ -0,0 +1,151 @@
+"""Scan every open market for bets with an edge over the asks.
+
+The scan runs in two passes. The first joins a prediction table, e.g.
+``LatestBets.latest()``, to the top of book of every open market and
+computes the edge of buying each side at its ask in one vectorized pass.
+Buying a contract at ``ask`` that pays a dollar with probability ``p`` has
+the expected value ``p * (1 - ask) - (1 - p) * ask``, i.e. ``p - ask``.
+
+The second pass fetches orderbooks concurrently, only for the markets with
+an edge of more than ``min_edge``, and walks each book up to the highest
+price that still keeps that edge. That gives the fillable size, its average
+price and the expected profit of taking all of it.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .columns import build_frame
+from .orderbook import OrderBook
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pandas as pd
+
+    from .client.exchange_client import ExchangeClient
+
+DEFAULT_MIN_EDGE = 0.04
+DEFAULT_BOOK_WORKERS = 8
+# the most markets the exchange answers per page
+MARKETS_PAGE_SIZE = 1000
+
+
+def get_open_markets(client: ExchangeClient) -> pd.DataFrame:
+    """Get every open market, with prices in dollars."""
+    return build_frame(
+        client.iter_markets(page_size=MARKETS_PAGE_SIZE, status="open"),
+        "markets",
+    )
+
+
+def find_edges(
+    markets: pd.DataFrame,
+    predictions: pd.DataFrame,
+    min_edge: float = DEFAULT_MIN_EDGE,
+) -> pd.DataFrame:
+    """Find the markets where buying one side at its ask has an edge.
+
+    ``predictions`` holds our yes probability ``myBet`` in dollars per
+    ``symbol``, the market ticker; its other columns are kept. Each market
+    gets the side with the larger edge, ``side``, our probability of it,
+    ``myp``, its ask, ``mktp``, and ``expected_value`` per contract. Only
+    markets with an expected value over ``min_edge`` are returned, best first.
+    """
+    bets = predictions.merge(markets, left_on="symbol", right_on="ticker")
+    my_bet = bets["myBet"].to_numpy(dtype=float)
+    yes_ask = bets["yes_ask"].to_numpy(dtype=float)
+    no_ask = bets["no_ask"].to_numpy(dtype=float)
+
+    # an ask of 0 or a dollar means nothing is offered on that side
+    yes_edge = np.where((yes_ask > 0) & (yes_ask < 1), my_bet - yes_ask, -np.inf)
+    no_edge = np.where((no_ask > 0) & (no_ask < 1), 1 - my_bet - no_ask, -np.inf)
+    buy_yes = yes_edge >= no_edge
+
+    bets["side"] = np.where(buy_yes, "yes", "no")
+    bets["myp"] = np.where(buy_yes, my_bet, 1 - my_bet)
+    bets["mktp"] = np.where(buy_yes, yes_ask, no_ask)
+    bets["expected_value"] = np.where(buy_yes, yes_edge, no_edge)
+
+    edges = bets[bets["expected_value"] > min_edge]
+    return edges.sort_values("expected_value", ascending=False, ignore_index=True)
+
+
+def get_orderbooks(
+    client: ExchangeClient,
+    tickers: Iterable[str],
+    max_workers: int = DEFAULT_BOOK_WORKERS,
+) -> dict[str, OrderBook]:
+    """Get the orderbooks of ``tickers`` concurrently."""
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    def fetch(ticker: str) -> OrderBook:
+        return OrderBook.from_response(client.get_orderbook(ticker), ticker)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+        return dict(zip(tickers, pool.map(fetch, tickers), strict=True))
+
+
+def add_depth(
+    edges: pd.DataFrame,
+    books: dict[str, OrderBook],
+    min_edge: float = DEFAULT_MIN_EDGE,
+    max_size: int | None = None,
+) -> pd.DataFrame:
+    """Add what can be taken from each book while keeping ``min_edge``.
+
+    ``limit`` is the highest price in dollars with an edge over
+    ``min_edge``, ``fillable`` the contracts offered at or below it, and
+    ``size`` those capped at ``max_size``. ``fill_price`` is the average price
+    of buying ``size``, ``depth_value`` the expected value per contract at that
+    price and ``expected_profit`` the expected value of the whole fill.
+    """
+    edges = edges.copy()
+    # prices in whole cents strictly below ``myp - min_edge``
+    limits = np.ceil(np.round((edges["myp"].to_numpy() - min_edge) * 100, 6)) - 1
+    fillable = np.zeros(len(edges), dtype=np.int64)
+    size = np.zeros(len(edges), dtype=np.int64)
+    fill_price = np.full(len(edges), np.nan)
+
+    rows = zip(edges["ticker"], edges["side"], limits.astype(int), strict=True)
+    for i, (ticker, side, limit) in enumerate(rows):
+        book = books.get(ticker)
+        if book is None or limit < 1:
+            continue
+        fillable[i] = book.fillable(side, limit)
+        wanted = fillable[i] if max_size is None else min(fillable[i], max_size)
+        price, size[i] = book.buy_vwap(side, wanted)
+        if price is not None:
+            fill_price[i] = price / 100
+
+    edges["limit"] = limits / 100
+    edges["fillable"] = fillable
+    edges["size"] = size
+    edges["fill_price"] = fill_price
+    edges["depth_value"] = edges["myp"] - fill_price
+    edges["expected_profit"] = np.nan_to_num(edges["depth_value"] * size)
+    return edges
+
+
+def scan(
+    client: ExchangeClient,
+    predictions: pd.DataFrame,
+    min_edge: float = DEFAULT_MIN_EDGE,
+    max_size: int | None = None,
+    max_workers: int = DEFAULT_BOOK_WORKERS,
+) -> pd.DataFrame:
+    """Scan every open market against ``predictions``.
+
+    Returns the markets with an edge over ``min_edge`` at the ask, with
+    their depth, ordered by expected profit.
+    """
+    edges = find_edges(get_open_markets(client), predictions, min_edge)
+    books = get_orderbooks(client, edges["ticker"], max_workers)
+    scanned = add_depth(edges, books, min_edge, max_size)
+    return scanned.sort_values("expected_profit", ascending=False, ignore_index=True)
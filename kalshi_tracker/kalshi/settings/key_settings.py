@@ -10,4 +10,22 @@ class KalshiKeySettings(BaseModel):
 
     key: str
     key_file: str
+    # the account's name in a ClientPool, the key id if not set
+    name: str | None = None
     host: str = "https://api.elections.kalshi.com/trade-api/v2"
+
+    # HTTP connection pool and (connect, read) timeouts in seconds
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    connect_timeout: float = 3.05
+    read_timeout: float = 30.0
+
+    # token-bucket budgets in requests per second, shared by clients of this key
+    read_rate: float = 20.0
+    write_rate: float = 10.0
+    read_burst: float | None = None
+    write_burst: float | None = None
+
+    # record or replay responses in this store file, see client.transport
+    transport_store: str | None = None
+    transport_mode: str = "replay"
@@ -0,0 +1,5 @@
+"""Local stand-ins for the Kalshi services, for tests and benchmarks."""
+
+from .fake_exchange import FakeExchange
+
+__all__ = ["FakeExchange"]
@@ -0,0 +1,532 @@
+"""A local stand-in for the Kalshi exchange REST API."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+API_PREFIX = "/trade-api/v2"
+
+Route = tuple[str, "re.Pattern[str]", "Callable[..., tuple[int, Any]]"]
+
+
+# trades are spread one minute apart starting here
+TRADES_START_TS = 1_700_000_000
+# most orders one batched create or cancel request may carry
+MAX_BATCH_ORDERS = 20
+TOO_MANY_REQUESTS = 429
+
+
+def make_trade(i: int, ticker: str) -> dict[str, Any]:
+    """Build the ``i``-th trade record shaped like the exchange's."""
+    ts = TRADES_START_TS + 60 * i
+    yes_price = 30 + i % 40
+    return {
+        "trade_id": f"trade-{i:08d}",
+        "ticker": ticker,
+        "count": 1 + i % 10,
+        "yes_price": yes_price,
+        "no_price": 100 - yes_price,
+        "taker_side": "yes" if i % 2 else "no",
+        "created_time": datetime.fromtimestamp(ts, tz=timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%SZ",
+        ),
+    }
+
+
+def make_market(ticker: str) -> dict[str, Any]:
+    """Build a market record shaped like the exchange's."""
+    return {
+        "ticker": ticker,
+        "event_ticker": ticker.rsplit("-", 1)[0],
+        "status": "open",
+        "yes_bid": 40,
+        "yes_ask": 42,
+        "no_bid": 58,
+        "no_ask": 60,
+        "last_price": 41,
+        "volume": 1000,
+        "open_interest": 500,
+        "close_time": "2030-01-01T00:00:00Z",
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Dispatches requests to the routes of the owning ``FakeExchange``."""
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, which stalls keep-alive
+    # connections on delayed ACKs unless Nagle's algorithm is off
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.exchange.count_connection()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, ANN401
+        """Keep the test output quiet."""
+
+    def _dispatch(self) -> None:
+        exchange = self.server.exchange
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, payload = exchange.handle(
+            self.command,
+            url.path,
+            {k: v[-1] for k, v in parse_qs(url.query).items()},
+            json.loads(body) if body else None,
+        )
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if status == TOO_MANY_REQUESTS:
+            self.send_header("Retry-After", str(exchange.retry_after))
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_DELETE = _dispatch  # noqa: N815
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # concurrent clients open many connections at once
+    request_queue_size = 128
+    exchange: FakeExchange
+
+
+class FakeExchange:
+    """An in-process HTTP server that answers like the Kalshi exchange.
+
+    Use it as a context manager; ``url`` is the API base to give a client.
+    ``latency`` seconds are added to every response. With ``rate_limit`` set,
+    requests beyond that many per second (counted per whole second) are
+    answered 429 with a ``Retry-After`` of ``retry_after`` seconds. Markets
+    are generated as ``FAKE-EVENT-<n>`` tickers, with ``n_trades`` trades one
+    minute apart dealt round-robin across them. The user holds a position in
+    every market.
+    """
+
+    def __init__(
+        self,
+        n_markets: int = 1000,
+        n_trades: int = 1000,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate_limit: int | None = None,
+        retry_after: int = 1,
+    ) -> None:
+        """Initialize the exchange without starting it."""
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.throttled = 0
+        # the current one second window and the requests counted in it
+        self._window = (0, 0)
+        self.markets = [make_market(f"FAKE-EVENT-{i:05d}") for i in range(n_markets)]
+        self.market_index = {m["ticker"]: m for m in self.markets}
+        self.trades = [
+            make_trade(i, self.markets[i % n_markets]["ticker"])
+            for i in range(n_trades if n_markets else 0)
+        ]
+        self.trade_ts = [TRADES_START_TS + 60 * i for i in range(len(self.trades))]
+        self.positions = [
+            {
+                "ticker": m["ticker"],
+                "position": 10,
+                "market_exposure": 400,
+                "realized_pnl": 0,
+                "total_traded": 400,
+                "resting_orders_count": 0,
+            }
+            for m in self.markets
+        ]
+        # the user's orders by id, and their ids by client order id
+        self.orders: dict[str, dict[str, Any]] = {}
+        self.client_order_ids: dict[str, str] = {}
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler)
+        self._server.exchange = self
+        self._thread: threading.Thread | None = None
+        self.routes: list[Route] = []
+        self.add_route("GET", r"/exchange/status", self.exchange_status)
+        self.add_route("POST", r"/logout", lambda **_: (200, {}))
+        self.add_route("GET", r"/markets", self.get_markets)
+        self.add_route("GET", r"/markets/(?P<ticker>[^/]+)", self.get_market)
+        self.add_route(
+            "GET",
+            r"/markets/(?P<ticker>[^/]+)/orderbook",
+            self.get_orderbook,
+        )
+        self.add_route("GET", r"/markets/trades", self.get_trades)
+        self.add_route(
+            "GET",
+            r"/markets/(?P<ticker>[^/]+)/history",
+            self.get_market_history,
+        )
+        self.add_route("GET", r"/events/(?P<ticker>[^/]+)", self.get_event)
+        self.add_route("GET", r"/series/(?P<ticker>[^/]+)", self.get_series)
+        self.add_route("GET", r"/portfolio/balance", self.get_balance)
+        self.add_route("GET", r"/portfolio/positions", self.get_positions)
+        self.add_route("GET", r"/portfolio/fills", self.get_fills)
+        self.add_route("GET", r"/portfolio/settlements", self.get_settlements)
+        self.add_route("GET", r"/portfolio/orders", self.get_orders)
+        self.add_route("GET", r"/portfolio/orders/(?P<order_id>[^/]+)", self.get_order)
+        self.add_route(
+            "DELETE",
+            r"/portfolio/orders/(?P<order_id>[^/]+)/cancel",
+            self.delete_order,
+        )
+        self.add_route(
+            "POST",
+            r"/portfolio/orders/(?P<order_id>[^/]+)/decrease",
+            self.decrease_order,
+        )
+        self.add_route("POST", r"/portfolio/orders", self.create_order)
+        self.add_route("POST", r"/portfolio/orders/batched", self.batch_create_orders)
+        self.add_route(
+            "DELETE",
+            r"/portfolio/orders/batched",
+            self.batch_cancel_orders,
+        )
+
+    @property
+    def url(self) -> str:
+        """Base URL of the API, like ``KalshiKeySettings.host``."""
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def add_route(
+        self,
+        method: str,
+        pattern: str,
+        handler: Callable[..., tuple[int, Any]],
+    ) -> None:
+        """Answer ``method`` requests whose path matches ``pattern``.
+
+        The handler gets the query parameters, the decoded JSON body and the
+        named groups of the pattern as keyword arguments and returns a status
+        code and a JSON payload. Later routes take precedence.
+        """
+        self.routes.insert(0, (method, re.compile(pattern + "$"), handler))
+
+    def count_connection(self) -> None:
+        """Record that a client opened a new connection."""
+        with self._lock:
+            self.connections += 1
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        body: Any,  # noqa: ANN401
+    ) -> tuple[int, Any]:
+        """Route one request and return its status and payload."""
+        with self._lock:
+            self.requests += 1
+            throttled = self._over_rate_limit()
+        if self.latency:
+            time.sleep(self.latency)
+        if throttled:
+            return TOO_MANY_REQUESTS, {
+                "error": {"code": "too_many_requests", "message": path},
+            }
+
+        path = path.removeprefix(API_PREFIX)
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return handler(query=query, body=body, **match.groupdict())
+        return 404, {"error": {"code": "not_found", "message": path}}
+
+    def _over_rate_limit(self) -> bool:
+        """Count a request against the rate limit; call with the lock held."""
+        if self.rate_limit is None:
+            return False
+        window = int(time.monotonic())
+        start, count = self._window
+        count = count + 1 if window == start else 1
+        self._window = (window, count)
+        if count > self.rate_limit:
+            self.throttled += 1
+            return True
+        return False
+
+    # endpoints
+
+    def exchange_status(self, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer the exchange status endpoint."""
+        return 200, {"exchange_active": True, "trading_active": True}
+
+    def get_markets(self, query: dict[str, str], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a page of markets, honoring the ``tickers`` filter."""
+        markets = self.markets
+        if "tickers" in query:
+            tickers = query["tickers"].split(",")
+            markets = [self.market_index[t] for t in tickers if t in self.market_index]
+        return 200, self.paginate(markets, "markets", query)
+
+    def get_market(self, ticker: str, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a single market."""
+        if ticker not in self.market_index:
+            return 404, {"error": {"code": "not_found", "message": ticker}}
+        return 200, {"market": self.market_index[ticker]}
+
+    def get_orderbook(self, ticker: str, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a market's orderbook as yes and no bid levels."""
+        if ticker not in self.market_index:
+            return 404, {"error": {"code": "not_found", "message": ticker}}
+        return 200, {
+            "orderbook": {
+                "yes": [[price, 100] for price in range(30, 41)],
+                "no": [[price, 100] for price in range(48, 59)],
+            },
+        }
+
+    def get_trades(self, query: dict[str, str], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a page of trades, newest first like the exchange.
+
+        Honors the ticker and time filters.
+        """
+        min_ts = int(query.get("min_ts", 0))
+        max_ts = int(query.get("max_ts", 2**62))
+        trades = [
+            trade
+            for ts, trade in zip(self.trade_ts[::-1], self.trades[::-1], strict=True)
+            if min_ts <= ts <= max_ts
+            and query.get("ticker", trade["ticker"]) == trade["ticker"]
+        ]
+        return 200, self.paginate(trades, "trades", query)
+
+    def get_market_history(
+        self,
+        ticker: str,
+        query: dict[str, str],
+        **_: Any,  # noqa: ANN401
+    ) -> tuple[int, Any]:
+        """Answer a page of hourly price history derived from the trades."""
+        if ticker not in self.market_index:
+            return 404, {"error": {"code": "not_found", "message": ticker}}
+        min_ts = int(query.get("min_ts", 0))
+        max_ts = int(query.get("max_ts", 2**62))
+        history = [
+            {
+                "ts": ts,
+                "yes_price": trade["yes_price"],
+                "yes_bid": trade["yes_price"] - 1,
+                "yes_ask": trade["yes_price"] + 1,
+                "volume": trade["count"],
+                "open_interest": 100,
+            }
+            for ts, trade in zip(self.trade_ts, self.trades, strict=True)
+            if trade["ticker"] == ticker and min_ts <= ts <= max_ts
+        ]
+        return 200, self.paginate(history, "history", query)
+
+    def get_event(self, ticker: str, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer an event with its markets."""
+        markets = [m for m in self.markets if m["event_ticker"] == ticker]
+        if not markets:
+            return 404, {"error": {"code": "not_found", "message": ticker}}
+        return 200, {"event": {"event_ticker": ticker}, "markets": markets}
+
+    def get_series(self, ticker: str, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a series."""
+        return 200, {"series": {"ticker": ticker, "title": ticker}}
+
+    def get_balance(self, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer the user's balance in cents."""
+        return 200, {"balance": 100_000}
+
+    def get_fills(self, query: dict[str, str], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a page of the user's fills, of which there are none."""
+        return 200, self.paginate([], "fills", query)
+
+    def get_settlements(self, query: dict[str, str], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a page of the user's settlements, of which there are none."""
+        return 200, self.paginate([], "settlements", query)
+
+    def get_orders(self, query: dict[str, str], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a page of the user's orders."""
+        with self._lock:
+            orders = list(self.orders.values())
+        if "ticker" in query:
+            orders = [o for o in orders if o["ticker"] == query["ticker"]]
+        return 200, self.paginate(orders, "orders", query)
+
+    def get_order(self, order_id: str, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer one of the user's orders."""
+        order = self.orders.get(order_id)
+        if order is None:
+            return 404, {"error": {"code": "not_found", "message": order_id}}
+        return 200, {"order": order}
+
+    def delete_order(self, order_id: str, **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a single cancel."""
+        result = self.cancel_order(order_id)
+        if result["error"] is not None:
+            return 404, {"error": result["error"]}
+        return 200, {"order": result["order"], "reduced_by": result["reduced_by"]}
+
+    def decrease_order(
+        self,
+        order_id: str,
+        body: dict[str, Any],
+        **_: Any,  # noqa: ANN401
+    ) -> tuple[int, Any]:
+        """Answer a decrease of a resting order."""
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None or order["status"] != "resting":
+                return 404, {"error": {"code": "not_found", "message": order_id}}
+            remaining = max(order["remaining_count"] - body["reduce_by"], 0)
+            order["remaining_count"] = remaining
+            if not remaining:
+                order["status"] = "canceled"
+        return 200, {"order": order}
+
+    def get_positions(self, query: dict[str, str], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a page of the user's market positions."""
+        positions = self.positions
+        if "ticker" in query:
+            positions = [p for p in positions if p["ticker"] == query["ticker"]]
+        page = self.paginate(positions, "market_positions", query)
+        page["event_positions"] = []
+        return 200, page
+
+    def create_order(self, body: dict[str, Any], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        """Answer a single order, rejecting a reused client order id."""
+        result = self.place_order(body)
+        if result["error"] is not None:
+            return 409, {"error": result["error"]}
+        return 201, {"order": result["order"]}
+
+    def batch_create_orders(
+        self,
+        body: dict[str, Any],
+        **_: Any,  # noqa: ANN401
+    ) -> tuple[int, Any]:
+        """Answer a batch of orders with one result per order."""
+        orders = body["orders"]
+        if len(orders) > MAX_BATCH_ORDERS:
+            return 400, {"error": {"code": "too_many_orders", "message": "batch"}}
+        return 201, {"orders": [self.place_order(order) for order in orders]}
+
+    def batch_cancel_orders(
+        self,
+        body: dict[str, Any],
+        **_: Any,  # noqa: ANN401
+    ) -> tuple[int, Any]:
+        """Answer a batch of cancels with one result per order id."""
+        ids = body["ids"]
+        if len(ids) > MAX_BATCH_ORDERS:
+            return 400, {"error": {"code": "too_many_orders", "message": "batch"}}
+        return 200, {"orders": [self.cancel_order(order_id) for order_id in ids]}
+
+    def place_order(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Rest an order and return its batch result."""
+        client_order_id = request.get("client_order_id")
+        with self._lock:
+            if client_order_id in self.client_order_ids:
+                return {
+                    "client_order_id": client_order_id,
+                    "order": None,
+                    "error": {
+                        "code": "order_already_exists",
+                        "message": client_order_id,
+                    },
+                }
+            order_id = f"order-{len(self.orders):08d}"
+            order = {
+                "order_id": order_id,
+                "client_order_id": client_order_id,
+                "ticker": request["ticker"],
+                "side": request["side"],
+                "action": request["action"],
+                "type": request.get("type", "limit"),
+                "status": "resting",
+                "yes_price": request.get("yes_price"),
+                "no_price": request.get("no_price"),
+                "remaining_count": request["count"],
+            }
+            self.orders[order_id] = order
+            if client_order_id is not None:
+                self.client_order_ids[client_order_id] = order_id
+        return {"client_order_id": client_order_id, "order": order, "error": None}
+
+    def cancel_order(self, order_id: str) -> dict[str, Any]:
+        """Cancel a resting order and return its batch result."""
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None or order["status"] != "resting":
+                return {
+                    "order_id": order_id,
+                    "order": None,
+                    "reduced_by": 0,
+                    "error": {"code": "not_found", "message": order_id},
+                }
+            reduced_by = order["remaining_count"]
+            order.update(status="canceled", remaining_count=0)
+        return {
+            "order_id": order_id,
+            "order": order,
+            "reduced_by": reduced_by,
+            "error": None,
+        }
+
+    @staticmethod
+    def paginate(
+        records: list[Any],
+        key: str,
+        query: dict[str, str],
+        default_limit: int = 100,
+    ) -> dict[str, Any]:
+        """Slice ``records`` into the page selected by ``limit`` and ``cursor``."""
+        start = int(query.get("cursor") or 0)
+        limit = int(query.get("limit") or default_limit)
+        end = start + limit
+        return {
+            key: records[start:end],
+            "cursor": str(end) if end < len(records) else "",
+        }
+
+    # lifecycle
+
+    def start(self) -> Self:
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        """Start the exchange."""
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop the exchange."""
+        self.stop()
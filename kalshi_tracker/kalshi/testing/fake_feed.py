@@ -0,0 +1,238 @@
+"""A local stand-in for the Kalshi websocket market-data feed."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Self
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+if TYPE_CHECKING:
+    from websockets.asyncio.server import Server, ServerConnection
+    from websockets.http11 import Request, Response
+
+WS_PATH = "/trade-api/ws/v2"
+AUTH_HEADERS = (
+    "KALSHI-ACCESS-KEY",
+    "KALSHI-ACCESS-SIGNATURE",
+    "KALSHI-ACCESS-TIMESTAMP",
+)
+STARTUP_TIMEOUT = 10.0
+
+
+class FakeFeed:
+    """An in-process websocket server that streams like the Kalshi feed.
+
+    Every subscribed ticker gets an ``orderbook_snapshot`` and then the feed
+    cycles through ``orderbook_delta`` and ``trade`` messages for the
+    subscribed tickers, ``messages_per_second`` of them (as fast as possible
+    when ``None``). Handshakes without the Kalshi auth headers are rejected
+    with 401. With ``disconnect_after`` set, each connection is dropped after
+    sending that many messages, to exercise reconnects.
+
+    The server runs on its own event loop thread, so it can be used from
+    synchronous tests and benchmarks alike.
+    """
+
+    def __init__(
+        self,
+        messages_per_second: float | None = None,
+        disconnect_after: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the feed without starting it."""
+        self.messages_per_second = messages_per_second
+        self.disconnect_after = disconnect_after
+        self.host = host
+        self.port = port
+        self.connections = 0
+        self.rejected = 0
+        self.subscriptions: list[dict[str, Any]] = []
+        self.messages_sent = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: Server | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        """Websocket URL of the feed."""
+        return f"ws://{self.host}:{self.port}{WS_PATH}"
+
+    # protocol
+
+    def _check_auth(
+        self,
+        connection: ServerConnection,
+        request: Request,
+    ) -> Response | None:
+        if all(request.headers.get(h) for h in AUTH_HEADERS):
+            return None
+        self.rejected += 1
+        return connection.respond(HTTPStatus.UNAUTHORIZED, "missing auth headers\n")
+
+    async def _handle(self, ws: ServerConnection) -> None:
+        self.connections += 1
+        commands: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+        async def read_commands() -> None:
+            async for raw in ws:
+                await commands.put(json.loads(raw))
+
+        reader = asyncio.create_task(read_commands())
+        try:
+            await self._stream(ws, commands)
+        except ConnectionClosed:
+            pass
+        finally:
+            reader.cancel()
+
+    async def _stream(
+        self,
+        ws: ServerConnection,
+        commands: asyncio.Queue[dict[str, Any]],
+    ) -> None:
+        """Send every message of one connection, in order, from one task."""
+        tickers: list[str] = []
+        book_sid, trade_sid = 1, 2
+        seq = 0
+        sent = 0
+        # alternate each book's deltas so its quantity never runs out
+        raise_next: dict[str, bool] = {}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal sent
+            await ws.send(json.dumps(message))
+            self.messages_sent += 1
+            sent += 1
+
+        while True:
+            command = await commands.get() if not tickers else None
+            if command is None and not commands.empty():
+                command = commands.get_nowait()
+
+            if command is not None:
+                if command.get("cmd") != "subscribe":
+                    continue
+                self.subscriptions.append(command)
+                new = command["params"]["market_tickers"]
+                for channel, sid in (
+                    ("orderbook_delta", book_sid),
+                    ("trade", trade_sid),
+                ):
+                    await send(
+                        {
+                            "id": command["id"],
+                            "type": "subscribed",
+                            "msg": {"channel": channel, "sid": sid},
+                        },
+                    )
+                for ticker in new:
+                    seq += 1
+                    await send(
+                        {
+                            "type": "orderbook_snapshot",
+                            "sid": book_sid,
+                            "seq": seq,
+                            "msg": {
+                                "market_ticker": ticker,
+                                "yes": [[p, 100] for p in range(30, 41)],
+                                "no": [[p, 100] for p in range(55, 66)],
+                            },
+                        },
+                    )
+                tickers.extend(new)
+                continue
+
+            ticker = tickers[sent % len(tickers)]
+            if self.disconnect_after and sent >= self.disconnect_after:
+                await ws.close()
+                return
+            if sent % 2:
+                seq += 1
+                raise_next[ticker] = not raise_next.get(ticker, False)
+                await send(
+                    {
+                        "type": "orderbook_delta",
+                        "sid": book_sid,
+                        "seq": seq,
+                        "msg": {
+                            "market_ticker": ticker,
+                            "price": 40,
+                            "delta": 1 if raise_next[ticker] else -1,
+                            "side": "yes",
+                        },
+                    },
+                )
+            else:
+                await send(
+                    {
+                        "type": "trade",
+                        "sid": trade_sid,
+                        "msg": {
+                            "market_ticker": ticker,
+                            "yes_price": 41,
+                            "no_price": 59,
+                            "count": 1,
+                            "taker_side": "yes",
+                            "ts": int(time.time()),
+                        },
+                    },
+                )
+            await asyncio.sleep(
+                1 / self.messages_per_second if self.messages_per_second else 0,
+            )
+
+    # lifecycle
+
+    def _serve(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        async def main() -> None:
+            self._server = await serve(
+                self._handle,
+                self.host,
+                self.port,
+                process_request=self._check_auth,
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._server.serve_forever()
+
+        try:
+            self._loop.run_until_complete(main())
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._loop.close()
+
+    def start(self) -> FakeFeed:
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=STARTUP_TIMEOUT):
+            raise RuntimeError("Fake feed did not start.")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        """Start the feed."""
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop the feed."""
+        self.stop()
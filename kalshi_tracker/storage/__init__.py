@@ -0,0 +1,5 @@
+"""Local on-disk stores for Kalshi market data.
+
+The Parquet ``archive`` needs ``pyarrow``; the memory-mapped ``tick_store``
+only needs NumPy.
+"""
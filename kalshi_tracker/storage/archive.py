@@ -0,0 +1,351 @@
+"""Incremental Parquet archive of Kalshi trades and market history.
+
+Rows are stored as a hive-partitioned Parquet dataset per kind of record::
+
+    <root>/trades/series=<SERIES>/date=<YYYY-MM-DD>/part-<uuid>.parquet
+    <root>/history/series=<SERIES>/date=<YYYY-MM-DD>/part-<uuid>.parquet
+
+A ``checkpoints.json`` file keeps a high-water mark per ticker, so a sync only
+asks the exchange for rows newer than what is already archived. A ticker's mark
+only moves once all of its new rows are written; a ticker whose rows were
+partly written when a sync stopped is listed as partial, and the next sync
+skips the rows of it already in the archive. Reads filter on the partition
+columns first, so loading one ticker or a date range only opens the files of
+that series and those dates.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .records import HISTORY, TRADES, series_of, trade_ts
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    import pandas as pd
+
+    from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+
+CHECKPOINT_FILE = "checkpoints.json"
+# key of the tickers partly written by an unfinished sync, per kind
+PARTIAL = "partial"
+
+# rows buffered in memory before a flush to Parquet
+DEFAULT_BATCH_ROWS = 100_000
+DEFAULT_PAGE_SIZE = 1000
+SECONDS_PER_DAY = 86_400
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("series", pa.string()), ("date", pa.string())]),
+    flavor="hive",
+)
+
+SCHEMAS = {
+    TRADES: pa.schema(
+        [
+            ("ticker", pa.string()),
+            ("trade_id", pa.string()),
+            ("ts", pa.int64()),
+            ("count", pa.int64()),
+            ("yes_price", pa.int64()),
+            ("no_price", pa.int64()),
+            ("taker_side", pa.string()),
+        ],
+    ),
+    HISTORY: pa.schema(
+        [
+            ("ticker", pa.string()),
+            ("ts", pa.int64()),
+            ("yes_price", pa.int64()),
+            ("yes_bid", pa.int64()),
+            ("yes_ask", pa.int64()),
+            ("volume", pa.int64()),
+            ("open_interest", pa.int64()),
+        ],
+    ),
+}
+
+
+def _date_of(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _to_ts(
+    value: datetime | date | int | None,
+    *,
+    end: bool = False,
+) -> int | None:
+    """Convert a bound to epoch seconds; a date ``end`` covers its whole day."""
+    if value is None or isinstance(value, int):
+        return value
+    if not isinstance(value, datetime):
+        day = datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+        return int(day.timestamp()) + (SECONDS_PER_DAY - 1 if end else 0)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+class TradeArchive:
+    """Partitioned Parquet archive of trades and market history with resume."""
+
+    def __init__(self, root: str | Path, batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        """Open (or start) the archive under ``root``."""
+        self.root = Path(root)
+        self.batch_rows = batch_rows
+        self.checkpoints: dict[str, dict[str, dict[str, Any]]] = {
+            TRADES: {},
+            HISTORY: {},
+        }
+        self.partial: dict[str, list[str]] = {TRADES: [], HISTORY: []}
+        checkpoint_path = self.root / CHECKPOINT_FILE
+        if checkpoint_path.exists():
+            saved = json.loads(checkpoint_path.read_text())
+            self.partial.update(saved.pop(PARTIAL, {}))
+            self.checkpoints.update(saved)
+
+    # syncing
+
+    def sync_trades(
+        self,
+        client: ExchangeClient,
+        tickers: Iterable[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> dict[str, int]:
+        """Archive the trades of ``tickers`` newer than their checkpoints.
+
+        Returns the number of new rows per ticker.
+        """
+        return self._sync(
+            TRADES,
+            tickers,
+            lambda t: self._new_trades(client, t, page_size),
+        )
+
+    def sync_market_history(
+        self,
+        client: ExchangeClient,
+        tickers: Iterable[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> dict[str, int]:
+        """Archive the price history of ``tickers`` newer than their checkpoints.
+
+        Returns the number of new rows per ticker.
+        """
+        return self._sync(
+            HISTORY,
+            tickers,
+            lambda t: self._new_history(client, t, page_size),
+        )
+
+    def _new_trades(
+        self,
+        client: ExchangeClient,
+        ticker: str,
+        page_size: int,
+    ) -> Iterator[dict[str, Any]]:
+        checkpoint = self.checkpoints[TRADES].get(ticker)
+        # trades sharing the high-water second may have arrived after the last
+        # sync, so that second is fetched again and known ids are skipped
+        min_ts = checkpoint["ts"] if checkpoint else None
+        seen = set(checkpoint["ids"]) if checkpoint else set()
+        if ticker in self.partial[TRADES]:
+            archived = self.read(TRADES, ticker, start=min_ts, columns=["trade_id"])
+            seen.update(archived["trade_id"].to_pylist())
+        trades = client.iter_trades(ticker=ticker, page_size=page_size, min_ts=min_ts)
+        for trade in trades:
+            if trade["trade_id"] in seen:
+                continue
+            yield {**trade, "ticker": ticker, "ts": trade_ts(trade)}
+
+    def _new_history(
+        self,
+        client: ExchangeClient,
+        ticker: str,
+        page_size: int,
+    ) -> Iterator[dict[str, Any]]:
+        checkpoint = self.checkpoints[HISTORY].get(ticker)
+        min_ts = checkpoint["ts"] + 1 if checkpoint else None
+        seen: set[int] = set()
+        if ticker in self.partial[HISTORY]:
+            archived = self.read(HISTORY, ticker, start=min_ts, columns=["ts"])
+            seen.update(archived["ts"].to_pylist())
+        history = client.iter_market_history(ticker, page_size=page_size, min_ts=min_ts)
+        for row in history:
+            if row["ts"] not in seen:
+                yield {**row, "ticker": ticker}
+
+    def _sync(
+        self,
+        kind: str,
+        tickers: Iterable[str],
+        new_rows: Callable[[str], Iterator[dict[str, Any]]],
+    ) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        buffer: list[dict[str, Any]] = []
+        marks: dict[str, dict[str, Any]] = {}
+        # tickers synced in full since the last flush
+        done: list[str] = []
+
+        for ticker in tickers:
+            counts[ticker] = 0
+            if ticker in self.partial[kind]:
+                marks[ticker] = self._archived_mark(kind, ticker)
+            for row in new_rows(ticker):
+                buffer.append(row)
+                counts[ticker] += 1
+                self._advance(marks, kind, row)
+                if len(buffer) >= self.batch_rows:
+                    self._flush(kind, buffer, marks, done, partial=ticker)
+                    # the exchange sends trades newest first, so the ticker's
+                    # mark only moves once all of its rows are written
+                    buffer, marks, done = [], {ticker: marks[ticker]}, []
+            done.append(ticker)
+        self._flush(kind, buffer, marks, done)
+        return counts
+
+    def _advance(self, marks: dict[str, dict[str, Any]], kind: str, row: dict) -> None:
+        """Move a ticker's pending high-water mark past ``row``."""
+        ticker = row["ticker"]
+        mark = marks.get(ticker) or dict(
+            self.checkpoints[kind].get(ticker) or {"ts": -1, "ids": []},
+        )
+        if row["ts"] > mark["ts"]:
+            mark = {"ts": row["ts"], "ids": []}
+        if kind == TRADES and row["ts"] == mark["ts"]:
+            mark["ids"] = [*mark["ids"], row["trade_id"]]
+        marks[ticker] = mark
+
+    def _archived_mark(self, kind: str, ticker: str) -> dict[str, Any]:
+        """Get the high-water mark of the rows of ``ticker`` in the archive."""
+        checkpoint = self.checkpoints[kind].get(ticker)
+        marks = {ticker: dict(checkpoint or {"ts": -1, "ids": []})}
+        columns = ["ts", "trade_id"] if kind == TRADES else ["ts"]
+        start = checkpoint["ts"] if checkpoint else None
+        for row in self.read(kind, ticker, start=start, columns=columns).to_pylist():
+            self._advance(marks, kind, {**row, "ticker": ticker})
+        return marks[ticker]
+
+    def _flush(
+        self,
+        kind: str,
+        rows: list[dict[str, Any]],
+        marks: dict[str, dict[str, Any]],
+        done: list[str],
+        partial: str | None = None,
+    ) -> None:
+        """Write buffered rows, then commit the checkpoints of ``done`` tickers.
+
+        ``partial`` is the ticker still being synced; it is flagged rather than
+        given its new mark.
+        """
+        schema = SCHEMAS[kind]
+        partitions: dict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            partitions[series_of(row["ticker"]), _date_of(row["ts"])].append(row)
+
+        for (series, day), part in partitions.items():
+            directory = self.root / kind / f"series={series}" / f"date={day}"
+            directory.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_pydict(
+                {name: [row.get(name) for row in part] for name in schema.names},
+                schema=schema,
+            )
+            pq.write_table(table, directory / f"part-{uuid.uuid4().hex}.parquet")
+
+        pending = [t for t in self.partial[kind] if t not in done]
+        if partial is not None and partial not in pending:
+            pending.append(partial)
+        committed = {t: mark for t, mark in marks.items() if t in done}
+        if committed or pending != self.partial[kind]:
+            self.checkpoints[kind].update(committed)
+            self.partial[kind] = pending
+            self._save_checkpoints()
+
+    def _save_checkpoints(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / CHECKPOINT_FILE
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({**self.checkpoints, PARTIAL: self.partial}))
+        tmp.replace(path)
+
+    # reading
+
+    def read_trades(
+        self,
+        ticker: str | None = None,
+        start: datetime | date | int | None = None,
+        end: datetime | date | int | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Load archived trades for one ticker and/or a time range.
+
+        ``start`` and ``end`` are inclusive datetimes, dates or epoch seconds;
+        naive datetimes are taken as UTC.
+        """
+        return self.read(TRADES, ticker, start, end, columns).to_pandas()
+
+    def read_market_history(
+        self,
+        ticker: str | None = None,
+        start: datetime | date | int | None = None,
+        end: datetime | date | int | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Load archived price history for one ticker and/or a time range."""
+        return self.read(HISTORY, ticker, start, end, columns).to_pandas()
+
+    def read(
+        self,
+        kind: str,
+        ticker: str | None = None,
+        start: datetime | date | int | None = None,
+        end: datetime | date | int | None = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Load archived rows as an Arrow table, pruning partitions first."""
+        directory = self.root / kind
+        if not directory.exists():
+            return SCHEMAS[kind].empty_table()
+
+        dataset = ds.dataset(directory, format="parquet", partitioning=PARTITIONING)
+        start_ts, end_ts = _to_ts(start), _to_ts(end, end=True)
+
+        conditions = []
+        if ticker is not None:
+            conditions += [
+                ds.field("series") == series_of(ticker),
+                ds.field("ticker") == ticker,
+            ]
+        if start_ts is not None:
+            conditions += [
+                ds.field("date") >= _date_of(start_ts),
+                ds.field("ts") >= start_ts,
+            ]
+        if end_ts is not None:
+            conditions += [
+                ds.field("date") <= _date_of(end_ts),
+                ds.field("ts") <= end_ts,
+            ]
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        table = dataset.to_table(
+            columns=columns or SCHEMAS[kind].names,
+            filter=expression,
+        )
+        if columns is None or "ts" in columns:
+            table = table.sort_by("ts")
+        return table
@@ -0,0 +1,21 @@
+"""Helpers shared by the stores for reading exchange records."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+TRADES = "trades"
+HISTORY = "history"
+
+
+def series_of(ticker: str) -> str:
+    """Get the series ticker a market ticker belongs to."""
+    return ticker.split("-", 1)[0]
+
+
+def trade_ts(trade: dict[str, Any]) -> int:
+    """Get a trade's time in epoch seconds."""
+    if "ts" in trade:
+        return int(trade["ts"])
+    return int(datetime.fromisoformat(trade["created_time"]).timestamp())
@@ -0,0 +1,240 @@
+"""Append-only, memory-mapped tick files per ticker.
+
+Each ticker gets one flat file per kind of record holding a NumPy structured
+array with a fixed record layout and no header::
+
+    <root>/trades/<TICKER>.ticks
+    <root>/history/<TICKER>.ticks
+
+Records are kept in timestamp order, so a time range is found with a binary
+search on the ``ts`` field. Trade records carry a 64-bit hash of their trade
+id, so a resync can tell which trades of the last stored second it already
+has. Reads map the file read-only instead of loading
+it, which means only the pages a slice touches are read from disk and every
+process reading the same file shares them through the OS page cache.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .records import HISTORY, TRADES, trade_ts
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+
+SUFFIX = ".ticks"
+
+DTYPES = {
+    TRADES: np.dtype(
+        [
+            ("ts", "<i8"),
+            ("id_hash", "<u8"),
+            ("price", "<i2"),
+            ("count", "<i4"),
+            ("taker_yes", "?"),
+        ],
+    ),
+    HISTORY: np.dtype(
+        [
+            ("ts", "<i8"),
+            ("yes_bid", "<i2"),
+            ("yes_ask", "<i2"),
+            ("price", "<i2"),
+            ("volume", "<i8"),
+            ("open_interest", "<i8"),
+        ],
+    ),
+}
+
+
+def id_hash(trade_id: str) -> int:
+    """Hash a trade id to the 64 bits stored with its tick."""
+    digest = hashlib.blake2b(trade_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def trades_to_ticks(trades: Iterable[dict[str, Any]]) -> np.ndarray:
+    """Pack ``get_trades`` records into trade ticks, sorted by time."""
+    ticks = np.array(
+        [
+            (
+                trade_ts(t),
+                id_hash(t["trade_id"]),
+                t["yes_price"],
+                t["count"],
+                t["taker_side"] == "yes",
+            )
+            for t in trades
+        ],
+        dtype=DTYPES[TRADES],
+    )
+    return ticks[np.argsort(ticks["ts"], kind="stable")]
+
+
+def history_to_ticks(history: Iterable[dict[str, Any]]) -> np.ndarray:
+    """Pack ``get_market_history`` records into history ticks, sorted by time."""
+    ticks = np.array(
+        [
+            (
+                h["ts"],
+                h.get("yes_bid") or 0,
+                h.get("yes_ask") or 0,
+                h.get("yes_price") or 0,
+                h.get("volume") or 0,
+                h.get("open_interest") or 0,
+            )
+            for h in history
+        ],
+        dtype=DTYPES[HISTORY],
+    )
+    return ticks[np.argsort(ticks["ts"], kind="stable")]
+
+
+class TickStore:
+    """Fixed-width tick files with zero-copy, time-indexed reads."""
+
+    def __init__(self, root: str | Path) -> None:
+        """Open (or start) the store under ``root``."""
+        self.root = Path(root)
+        # open maps by file, reused until the file grows
+        self._maps: dict[Path, np.memmap] = {}
+
+    def path(self, kind: str, ticker: str) -> Path:
+        """Get the tick file of ``ticker``."""
+        return self.root / kind / f"{ticker}{SUFFIX}"
+
+    def tickers(self, kind: str) -> list[str]:
+        """List the tickers with a tick file of ``kind``."""
+        return sorted(p.stem for p in (self.root / kind).glob(f"*{SUFFIX}"))
+
+    # writing
+
+    def append(self, kind: str, ticker: str, ticks: np.ndarray) -> int:
+        """Append time-sorted ticks to the end of a ticker's file.
+
+        Ticks older than the last stored one are rejected, since they would
+        break the ordering the reads rely on. A partial record left at the end
+        of the file by an interrupted append is cut off first. Returns the
+        number appended.
+        """
+        if ticks.dtype != DTYPES[kind]:
+            msg = f"Expected {kind} ticks, got dtype {ticks.dtype}."
+            raise ValueError(msg)
+        if not len(ticks):
+            return 0
+        if np.any(np.diff(ticks["ts"]) < 0):
+            raise ValueError("Ticks must be sorted by ts.")
+        last = self.last(kind, ticker)
+        if last is not None and ticks["ts"][0] < last["ts"]:
+            msg = f"Ticks from {ticks['ts'][0]} are older than the stored {last['ts']}."
+            raise ValueError(msg)
+
+        path = self.path(kind, ticker)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as file:
+            size = file.tell()
+            whole = size - size % ticks.dtype.itemsize
+            if whole != size:
+                file.truncate(whole)
+            file.write(ticks.tobytes())
+        return len(ticks)
+
+    def sync_trades(
+        self,
+        client: ExchangeClient,
+        tickers: Iterable[str],
+        page_size: int | None = None,
+    ) -> dict[str, int]:
+        """Append the trades of ``tickers`` newer than their last stored tick.
+
+        The last stored second is fetched again because more trades may have
+        printed in it; the trades of it already stored are skipped by id.
+        Returns the number of new ticks per ticker.
+        """
+        counts = {}
+        for ticker in tickers:
+            last = self.last(TRADES, ticker)
+            min_ts = int(last["ts"]) if last is not None else None
+            ticks = trades_to_ticks(
+                client.iter_trades(ticker=ticker, page_size=page_size, min_ts=min_ts),
+            )
+            if min_ts is not None:
+                stored = self.read(TRADES, ticker, start=min_ts)["id_hash"]
+                new = (ticks["ts"] > min_ts) | ~np.isin(ticks["id_hash"], stored)
+                ticks = ticks[new & (ticks["ts"] >= min_ts)]
+            counts[ticker] = self.append(TRADES, ticker, ticks)
+        return counts
+
+    def sync_market_history(
+        self,
+        client: ExchangeClient,
+        tickers: Iterable[str],
+        page_size: int | None = None,
+    ) -> dict[str, int]:
+        """Append the price history of ``tickers`` after their last stored tick.
+
+        Returns the number of new ticks per ticker.
+        """
+        counts = {}
+        for ticker in tickers:
+            last = self.last(HISTORY, ticker)
+            min_ts = int(last["ts"]) + 1 if last is not None else None
+            ticks = history_to_ticks(
+                client.iter_market_history(ticker, page_size=page_size, min_ts=min_ts),
+            )
+            counts[ticker] = self.append(HISTORY, ticker, ticks)
+        return counts
+
+    # reading
+
+    def open(self, kind: str, ticker: str) -> np.ndarray:
+        """Map a ticker's whole tick file read-only."""
+        path = self.path(kind, ticker)
+        dtype = DTYPES[kind]
+        size = path.stat().st_size if path.exists() else 0
+        length = size // dtype.itemsize
+        if not length:
+            return np.empty(0, dtype=dtype)
+
+        ticks = self._maps.get(path)
+        if ticks is None or len(ticks) != length:
+            # a partially written trailing record is left out of the map,
+            # and cut off by the next append
+            ticks = np.memmap(path, dtype=dtype, mode="r", shape=(length,))
+            self._maps[path] = ticks
+        return ticks
+
+    def read(
+        self,
+        kind: str,
+        ticker: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> np.ndarray:
+        """Get the ticks with ``start <= ts <= end`` as a view of the map.
+
+        The bounds are found by bisecting the ``ts`` field in place, which
+        touches O(log n) records instead of copying the column.
+        """
+        ticks = self.open(kind, ticker)
+        ts = ticks["ts"]
+        lo = 0 if start is None else bisect.bisect_left(ts, start)
+        hi = len(ts) if end is None else bisect.bisect_right(ts, end)
+        return ticks[lo:hi]
+
+    def last(self, kind: str, ticker: str) -> np.void | None:
+        """Get the most recent tick of a ticker."""
+        ticks = self.open(kind, ticker)
+        return ticks[-1] if len(ticks) else None
+
+    def close(self) -> None:
+        """Drop the store's references to its maps."""
+        self._maps.clear()
@@ -1,36 +1,187 @@
 #!/usr/bin/env python
 
+from __future__ import annotations
+
+import io
 import itertools
+import json
+import mmap
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+PRICE_COLUMNS = ["yesPrice", "noPrice", "myBet"]
+TIMEZONE = "US/Eastern"
+DEFAULT_CHUNK_SIZE = 100_000
+# schema metadata key of the read position in a saved ``LatestBets`` state
+STATE_KEY = b"latest_bets"
+
 
-def prep_prices_csv(p):
-    p[["yesPrice", "noPrice", "myBet"]] = p[["yesPrice", "noPrice", "myBet"]] / 100
+def prep_prices_columns(p: pd.DataFrame) -> pd.DataFrame:
+    """Scale prices to dollars and parse symbols and dates, in place."""
+    p[PRICE_COLUMNS] = p[PRICE_COLUMNS] / 100
     p["symbol"] = p["symbol"].str.upper()
-    p.date = pd.to_datetime(p.date, format="%Y%m%d").dt.tz_localize(tz="US/Eastern")
-    p["age"] = pd.Timestamp.now(tz="US/Eastern") - p.date
+    p["date"] = pd.to_datetime(p["date"], format="%Y%m%d").dt.tz_localize(
+        tz=TIMEZONE,
+    )
+    return p
 
-    p_bet = p[~p.myBet.isna()]
-    idx = p_bet.groupby(["symbol"])["date"].transform(max) == p_bet["date"]
-    latest_p = p_bet[idx]
 
-    latest_p["buyYes"] = latest_p.myBet > latest_p.yesPrice
+def select_latest_bets(p: pd.DataFrame) -> pd.DataFrame:
+    """Rows with a bet on the latest date of their symbol, in file order."""
+    p_bet = p[p["myBet"].notna()]
+    idx = p_bet.groupby("symbol")["date"].transform("max") == p_bet["date"]
+    return p_bet[idx]
 
-    def get_probs(row):
-        if row.buyYes:
-            return [row.yesPrice, row.myBet]
-        return [row.noPrice, 1 - row.myBet]
 
-    latest_p[["mktp", "myp"]] = latest_p.apply(get_probs, axis=1, result_type="expand")
-    latest_p[["mktq", "myq"]] = 1 - latest_p[["mktp", "myp"]]
+def add_bet_expectations(latest_p: pd.DataFrame) -> pd.DataFrame:
+    """Add the side to buy, both probabilities and the expected value."""
+    latest_p = latest_p.copy()
+    buy_yes = (latest_p["myBet"] > latest_p["yesPrice"]).to_numpy()
+    my_bet = latest_p["myBet"].to_numpy(dtype=float)
+
+    latest_p["buyYes"] = buy_yes
+    latest_p["mktp"] = np.where(buy_yes, latest_p["yesPrice"], latest_p["noPrice"])
+    latest_p["myp"] = np.where(buy_yes, my_bet, 1 - my_bet)
+    latest_p["mktq"] = 1 - latest_p["mktp"]
+    latest_p["myq"] = 1 - latest_p["myp"]
 
     latest_p["expected_value"] = (latest_p.myp * latest_p.mktq) - (
         latest_p.myq * latest_p.mktp
     )
+    return latest_p
+
+
+def prep_prices_csv(p: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Prepare a whole prediction log; returns it and its latest bets table."""
+    prep_prices_columns(p)
+    p["age"] = pd.Timestamp.now(tz=TIMEZONE) - p.date
+
+    return p, add_bet_expectations(select_latest_bets(p))
+
+
+class LatestBets:
+    """The latest bet per symbol of a prediction log, updated incrementally.
+
+    Feeds the log in chunks and keeps only the rows that can still be the
+    latest bet of their symbol, so memory is bounded by the number of symbols
+    rather than the length of the log. ``read_csv`` remembers how far into the
+    file it has read; with ``save`` and ``load`` later runs parse only the rows
+    appended since. ``latest`` returns the same table as the second output of
+    ``prep_prices_csv`` on the whole log.
+    """
+
+    def __init__(self) -> None:
+        """Start with nothing read."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything read so far."""
+        self.candidates: pd.DataFrame | None = None
+        self.columns: list[str] | None = None
+        self.rows_read = 0
+        self.offset = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add the next rows of the log, indexed by their row number."""
+        bets = select_latest_bets(prep_prices_columns(chunk.copy()))
+        if self.candidates is not None:
+            bets = select_latest_bets(pd.concat([self.candidates, bets]))
+        self.candidates = bets
+        self.rows_read += len(chunk)
+
+    def read_csv(
+        self,
+        path: str | Path,
+        chunksize: int = DEFAULT_CHUNK_SIZE,
+    ) -> LatestBets:
+        """Read the rows of a CSV log appended since the last read; returns self.
+
+        Only whole lines are read: a last line still being written is left for
+        the next read. A file that shrank is taken to be a new log and is read
+        from the start.
+        """
+        path = Path(path)
+        size = path.stat().st_size
+        if size < self.offset:
+            self.reset()
+        if not size:
+            return self
+
+        with path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as whole:
+                end = whole.rfind(b"\n") + 1
+                if self.columns is None and end:
+                    header_end = whole.find(b"\n") + 1
+                    header = pd.read_csv(io.BytesIO(whole[:header_end]), nrows=0)
+                    self.columns = list(header.columns)
+                    self.offset = header_end
+            if end <= self.offset:
+                return self
+
+            # map the complete lines only, so the parser stops at the last one
+            with mmap.mmap(f.fileno(), end, access=mmap.ACCESS_READ) as lines:
+                lines.seek(self.offset)
+                chunks = pd.read_csv(
+                    lines,
+                    header=None,
+                    names=self.columns,
+                    chunksize=chunksize,
+                )
+                # chunks are numbered on from 0, rows of earlier reads come first
+                start = self.rows_read
+                for chunk in chunks:
+                    chunk.index += start
+                    self.update(chunk)
+        self.offset = end
+        return self
 
-    return p, latest_p
+    def latest(self) -> pd.DataFrame:
+        """Build the latest bets table with ages as of now."""
+        if self.candidates is None:
+            raise ValueError("No rows have been read yet.")
+        latest_p = self.candidates.sort_index()
+        latest_p["age"] = pd.Timestamp.now(tz=TIMEZONE) - latest_p.date
+        return add_bet_expectations(latest_p)
+
+    def save(self, path: str | Path) -> None:
+        """Store the state to resume from in a later run.
+
+        The candidate rows go to a Parquet file, which keeps their dtypes and
+        row numbers; the read position goes to its schema metadata.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.candidates is None:
+            table = pa.table({})
+        else:
+            table = pa.Table.from_pandas(self.candidates)
+        position = {
+            "columns": self.columns,
+            "rows_read": self.rows_read,
+            "offset": self.offset,
+        }
+        metadata = {**(table.schema.metadata or {}), STATE_KEY: json.dumps(position)}
+        pq.write_table(table.replace_schema_metadata(metadata), path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> LatestBets:
+        """Load a saved state, or start a new one when there is none."""
+        import pyarrow.parquet as pq
+
+        state = cls()
+        if not Path(path).exists():
+            return state
+        table = pq.read_table(path)
+        if table.num_columns:
+            state.candidates = table.to_pandas()
+        position = json.loads(table.schema.metadata[STATE_KEY])
+        state.columns = position["columns"]
+        state.rows_read = position["rows_read"]
+        state.offset = position["offset"]
+        return state
 
 
 def compute_situation_expectations(ps, qs, prices, pays, n_hits):
@@ -53,30 +204,56 @@ def compute_situation_expectations(ps, qs, prices, pays, n_hits):
     return situation_p, situation_exp
 
 
+def compute_hit_distribution(ps, prices, pays):
+    """Exact hit-count distribution via a Poisson-binomial recurrence.
+
+    Returns ``(hits_p, hits_exp)`` where ``hits_p[k]`` is the probability of
+    exactly ``k`` hits and ``hits_exp[k]`` is the expected payout given ``k``
+    hits. Runs in O(n^2) time and O(n) memory instead of enumerating all 2^n
+    outcomes like ``compute_situation_expectations``.
+    """
+    ps = np.asarray(ps, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    pays = np.asarray(pays, dtype=float)
+    n = len(ps)
+
+    # hit_p[k]: P(k hits so far), pay_mass[k]: E[payout; k hits so far]
+    hit_p = np.zeros(n + 1)
+    pay_mass = np.zeros(n + 1)
+    hit_p[0] = 1.0
+
+    for i in range(n):
+        p, q = ps[i], 1 - ps[i]
+        prev_p = hit_p[: i + 1].copy()
+        prev_mass = pay_mass[: i + 1].copy()
+
+        # position i misses: shift nothing, pay the price
+        hit_p[: i + 1] = prev_p * q
+        pay_mass[: i + 1] = (prev_mass - prices[i] * prev_p) * q
+        # position i hits: shift up one hit, collect the payout
+        hit_p[1 : i + 2] += prev_p * p
+        pay_mass[1 : i + 2] += (prev_mass + pays[i] * prev_p) * p
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hits_exp = pay_mass / hit_p
+
+    return hit_p, hits_exp
+
+
 def compute_wager_expectations(proababilities, prices, qtys):
-    qs = 1 - proababilities
-    payouts = qtys - prices
-
-    situations = []
-
-    for i in range(len(proababilities) + 1):
-        situation_p, situation_exp = compute_situation_expectations(
-            proababilities,
-            qs,
-            prices,
-            payouts,
-            i,
-        )
-        situations.append(
-            {
-                "hits": i,
-                "hit_percent": i / len(proababilities),
-                "hits_p": situation_p,
-                "hits_exp": situation_exp,
-            },
-        )
-
-    situations = pd.DataFrame.from_records(situations)
+    payouts = np.asarray(qtys, dtype=float) - np.asarray(prices, dtype=float)
+
+    hits_p, hits_exp = compute_hit_distribution(proababilities, prices, payouts)
+    hits = np.arange(len(hits_p))
+
+    situations = pd.DataFrame(
+        {
+            "hits": hits,
+            "hit_percent": hits / len(proababilities),
+            "hits_p": hits_p,
+            "hits_exp": hits_exp,
+        },
+    )
 
     expected_value = (situations.hits_p * situations.hits_exp).sum()
 
@@ -31,7 +31,7 @@ def prep_market_columns(markets):
         "previous_yes_ask",
         "previous_price",
     ]
-    markets[price_col] = markets[price_col] / 100
+    markets[price_col] = markets[price_col].to_numpy(dtype=float) / 100
     markets["no_ask"] = 1 - markets.yes_bid
 
     date_col = [
@@ -41,7 +41,8 @@ def prep_market_columns(markets):
         "close_date",
         "expiration_date",
     ]
-    markets[date_col] = markets[date_col].apply(pd.to_datetime)
+    for col in date_col:
+        markets[col] = pd.to_datetime(markets[col], format="ISO8601")
 
     return markets
 
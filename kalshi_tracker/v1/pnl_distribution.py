@@ -0,0 +1,195 @@
+"""Full dollar P&L distribution for a book of binary positions.
+
+Positions are discretized to whole cents. Positions that share an event key are
+treated as bets on mutually exclusive markets of one Kalshi event (at most one
+market in the event resolves yes) and are combined exactly. Events are assumed
+independent of each other and are convolved together with FFTs.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+# below this many grid points on the shorter side a direct convolution is
+# cheaper than the FFT
+DIRECT_CONVOLVE_MAX = 64
+
+# tolerance for event market probabilities summing to slightly more than one
+PROBABILITY_TOLERANCE = 1e-9
+
+
+class PnLDistribution:
+    """Probability mass over P&L outcomes on a regular grid of cents."""
+
+    def __init__(self, offset_cents: int, step_cents: int, pmf: np.ndarray) -> None:
+        """Initialize the distribution.
+
+        ``pmf[i]`` is the probability of a P&L of
+        ``offset_cents + i * step_cents`` cents.
+        """
+        self.offset_cents = offset_cents
+        self.step_cents = step_cents
+        self.pmf = pmf
+
+    @property
+    def values(self) -> np.ndarray:
+        """P&L in dollars for every grid point."""
+        return (self.offset_cents + self.step_cents * np.arange(len(self.pmf))) / 100
+
+    @property
+    def cdf(self) -> np.ndarray:
+        """Cumulative probability for every grid point."""
+        return np.cumsum(self.pmf)
+
+    def mean(self) -> float:
+        """Get the expected P&L in dollars."""
+        return float(self.pmf @ self.values)
+
+    def std(self) -> float:
+        """Get the standard deviation of the P&L in dollars."""
+        values = self.values
+        mean = self.pmf @ values
+        return float(math.sqrt(max(self.pmf @ (values - mean) ** 2, 0)))
+
+    def prob_loss(self) -> float:
+        """Probability that the P&L is negative."""
+        return float(self.pmf[self.values < 0].sum())
+
+    def quantile(self, q: float) -> float:
+        """Smallest P&L in dollars whose cumulative probability reaches ``q``."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+        ix = int(np.searchsorted(self.cdf, q - PROBABILITY_TOLERANCE))
+        return float(self.values[min(ix, len(self.pmf) - 1)])
+
+    def value_at_risk(self, confidence: float = 0.95) -> float:
+        """Loss in dollars that is not exceeded with the given confidence."""
+        return -self.quantile(1 - confidence)
+
+    def to_frame(self, min_p: float = 0.0) -> pd.DataFrame:
+        """Return the outcomes with probability above ``min_p`` as a DataFrame."""
+        mask = self.pmf > min_p
+        return pd.DataFrame(
+            {
+                "pnl": self.values[mask],
+                "p": self.pmf[mask],
+                "cdf": self.cdf[mask],
+            },
+        )
+
+
+def _event_outcomes(
+    probabilities: np.ndarray,
+    price_cents: np.ndarray,
+    qty_cents: np.ndarray,
+    is_yes: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Enumerate the outcomes of one event.
+
+    Returns the P&L in cents and the probability of every way the event can
+    resolve: each of its markets winning, then none of them winning.
+    """
+    market_yes_p = np.where(is_yes, probabilities, 1 - probabilities)
+    none_p = 1 - market_yes_p.sum()
+    if none_p < -PROBABILITY_TOLERANCE:
+        raise ValueError(
+            "Probabilities of mutually exclusive markets in an event sum to more "
+            "than one.",
+        )
+
+    # nobody wins: yes positions lose their price, no positions collect
+    base = np.where(is_yes, -price_cents, qty_cents - price_cents).sum()
+    # market j wins: position j flips from its base outcome
+    swing = np.where(is_yes, qty_cents, -qty_cents)
+
+    pnl = np.append(base + swing, base)
+    p = np.append(market_yes_p, max(none_p, 0.0))
+    return pnl, p
+
+
+def _convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Convolve two probability mass arrays."""
+    if min(len(a), len(b)) <= DIRECT_CONVOLVE_MAX:
+        return np.convolve(a, b)
+
+    size = len(a) + len(b) - 1
+    fft_size = 1 << (size - 1).bit_length()
+    out = np.fft.irfft(np.fft.rfft(a, fft_size) * np.fft.rfft(b, fft_size), fft_size)
+    # round-off can leave tiny negative masses
+    return np.clip(out[:size], 0, None)
+
+
+def compute_pnl_distribution(
+    probabilities: ArrayLike,
+    prices: ArrayLike,
+    qtys: ArrayLike,
+    events: ArrayLike,
+    is_yes: ArrayLike | None = None,
+) -> PnLDistribution:
+    """Compute the full P&L distribution of a book of positions.
+
+    ``probabilities``, ``prices`` and ``qtys`` are the same arrays
+    ``compute_wager_expectations`` takes: the probability each position pays
+    out, its total cost in dollars and its number of contracts. ``events``
+    holds the event key of every position; each position is assumed to be on a
+    different market of its event. ``is_yes`` marks yes positions (the default)
+    versus no positions, whose probability is that their market resolves no.
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    price_cents = np.rint(np.asarray(prices, dtype=float) * 100).astype(np.int64)
+    qty_cents = np.rint(np.asarray(qtys, dtype=float) * 100).astype(np.int64)
+    is_yes = (
+        np.ones(len(probabilities), dtype=bool)
+        if is_yes is None
+        else np.asarray(is_yes, dtype=bool)
+    )
+
+    if len(probabilities) == 0:
+        return PnLDistribution(0, 1, np.ones(1))
+
+    codes, _ = pd.factorize(np.asarray(events), sort=False)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1
+
+    outcomes = [
+        _event_outcomes(
+            probabilities[ix],
+            price_cents[ix],
+            qty_cents[ix],
+            is_yes[ix],
+        )
+        for ix in np.split(order, bounds)
+    ]
+
+    # coarsen the grid to the common step of every event's outcomes
+    step = int(np.gcd.reduce(np.concatenate([pnl - pnl.min() for pnl, _ in outcomes])))
+    step = max(step, 1)
+
+    offset = 0
+    heap: list[tuple[int, int, np.ndarray]] = []
+    for i, (pnl, p) in enumerate(outcomes):
+        low = int(pnl.min())
+        offset += low
+        pmf = np.bincount((pnl - low) // step, weights=p)
+        heap.append((len(pmf), i, pmf))
+
+    # combine the shortest distributions first to keep the FFTs small
+    heapq.heapify(heap)
+    counter = len(heap)
+    while len(heap) > 1:
+        _, _, a = heapq.heappop(heap)
+        _, _, b = heapq.heappop(heap)
+        combined = _convolve(a, b)
+        heapq.heappush(heap, (len(combined), counter, combined))
+        counter += 1
+
+    pmf = heap[0][2]
+    return PnLDistribution(offset, step, pmf / pmf.sum())
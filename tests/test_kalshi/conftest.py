@@ -0,0 +1,21 @@
+"""Shared fixtures for the Kalshi tests."""
+
+from collections.abc import Iterator
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+@pytest.fixture(scope="session")
+def private_key() -> rsa.RSAPrivateKey:
+    """Create an RSA key to sign requests with."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def fake_exchange() -> Iterator[FakeExchange]:
+    """Run a local stand-in exchange for the duration of a test."""
+    with FakeExchange(n_markets=250) as exchange:
+        yield exchange
@@ -0,0 +1,92 @@
+"""Tests for the streaming candle aggregator."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kalshi_tracker.kalshi.candles import CandleAggregator
+from kalshi_tracker.kalshi.testing.fake_exchange import make_trade
+
+
+@pytest.fixture
+def trades() -> list[dict]:
+    """Trades one minute apart across two tickers."""
+    return [make_trade(i, f"FAKE-EVENT-{i % 2}") for i in range(600)]
+
+
+def test_add_trades__minute_and_hour_bars__match_resample(trades: list[dict]) -> None:
+    """Test that finished bars agree with a pandas resample of the trades."""
+    aggregator = CandleAggregator(intervals=["1m", "1h"])
+    aggregator.add_trades(trades)
+
+    frame = pd.DataFrame([t for t in trades if t["ticker"] == "FAKE-EVENT-0"])
+    frame.index = pd.to_datetime(frame["created_time"])
+    frame["notional"] = frame["yes_price"] * frame["count"]
+    hourly = frame.resample("1h").agg(
+        {
+            "yes_price": ["first", "max", "min", "last"],
+            "count": "sum",
+            "notional": "sum",
+        },
+    )
+
+    bars = aggregator.bars("FAKE-EVENT-0", "1h", include_current=True)
+    assert len(bars) == len(hourly)
+    np.testing.assert_array_equal(bars["open"], hourly["yes_price", "first"])
+    np.testing.assert_array_equal(bars["high"], hourly["yes_price", "max"])
+    np.testing.assert_array_equal(bars["low"], hourly["yes_price", "min"])
+    np.testing.assert_array_equal(bars["close"], hourly["yes_price", "last"])
+    np.testing.assert_array_equal(bars["volume"], hourly["count", "sum"])
+    np.testing.assert_allclose(
+        bars["vwap"],
+        hourly["notional", "sum"] / hourly["count", "sum"],
+    )
+    assert bars["start"][0] == hourly.index[0].timestamp()
+
+    # every other minute has a trade of this ticker, and the last one is open
+    assert len(aggregator.bars("FAKE-EVENT-0", "1m")) == 299
+
+
+def test_flush__bounded_ring__hands_over_new_bars(trades: list[dict]) -> None:
+    """Test flushing finished bars and losing unflushed ones past capacity."""
+    aggregator = CandleAggregator(intervals=["1m"], capacity=100)
+    flushed: list[np.ndarray] = []
+
+    def sink(_ticker: str, _interval: str, bars: np.ndarray) -> None:
+        flushed.append(bars)
+
+    aggregator.add_trades(trades[:100])
+    assert aggregator.flush(sink) == 98
+    aggregator.add_trades(trades[100:])
+    assert aggregator.flush(sink, finish=True) == 200
+    # each ticker finished 251 bars into a ring of 100 since the first flush
+    assert aggregator.lost == 2 * 151
+
+    starts = np.concatenate([b["start"] for b in flushed])
+    assert len(starts) == len(np.unique(starts)) == 298
+    assert len(aggregator.bars("FAKE-EVENT-1", "1m")) == 100
+    assert aggregator.flush(sink) == 0
+
+
+def test_update__late_and_quiet__handled() -> None:
+    """Test that late trades are dropped and advance closes quiet bars."""
+    aggregator = CandleAggregator(intervals=["1s", "1m"])
+    aggregator.update("T", 120, 40, 2)
+    aggregator.update("T", 125, 50, 1)
+    aggregator.update("T", 121, 45, 1)
+    assert aggregator.late == 1
+
+    aggregator.advance(130)
+    assert aggregator.bars("T", "1s")["close"].tolist() == [40, 50]
+    assert len(aggregator.bars("T", "1m")) == 0
+    aggregator.update("T", 125, 45, 1)
+    assert aggregator.late == 2
+
+    aggregator.advance(180)
+    (minute,) = aggregator.bars("T", "1m")
+    assert minute.tolist() == (120, 40, 50, 40, 50, 3, 130 / 3)
+
+    with pytest.raises(ValueError, match="Unknown"):
+        CandleAggregator(intervals=["5m"])
@@ -0,0 +1,80 @@
+"""Tests for the asyncio exchange client."""
+
+import asyncio
+import time
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.async_exchange_client import AsyncExchangeClient
+from kalshi_tracker.kalshi.client.http_error import HttpError
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def test_get_orderbooks__many_tickers__fetched_concurrently(
+    private_key: rsa.RSAPrivateKey,
+) -> None:
+    """Test that a sweep is bounded by concurrency rather than latency."""
+    tickers = [f"FAKE-EVENT-{i:05d}" for i in range(40)]
+
+    async def sweep(url: str) -> dict:
+        async with AsyncExchangeClient(
+            url,
+            "key",
+            private_key,
+            rate_limit_threshold=0,
+            max_concurrency=20,
+            http2=False,
+        ) as client:
+            return await client.get_orderbooks(tickers)
+
+    with FakeExchange(n_markets=40, latency=0.05) as exchange:
+        start = time.perf_counter()
+        books = asyncio.run(sweep(exchange.url))
+        elapsed = time.perf_counter() - start
+
+    assert list(books) == tickers
+    assert books[tickers[0]]["orderbook"]["yes"][0] == [30, 100]
+    # serially this takes 40 * 50ms
+    assert elapsed < 1
+
+
+def test_get_markets__filters__sent_as_query(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that filters reach the server and None filters are dropped."""
+
+    async def fetch() -> dict:
+        async with AsyncExchangeClient(
+            fake_exchange.url,
+            "key",
+            private_key,
+            http2=False,
+        ) as client:
+            return await client.get_markets(limit=5, tickers="FAKE-EVENT-00003")
+
+    page = asyncio.run(fetch())
+
+    assert [m["ticker"] for m in page["markets"]] == ["FAKE-EVENT-00003"]
+
+
+def test_get_market__missing__raises_http_error(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that a 404 becomes an HttpError."""
+
+    async def fetch() -> dict:
+        async with AsyncExchangeClient(
+            fake_exchange.url,
+            "key",
+            private_key,
+            http2=False,
+        ) as client:
+            return await client.get_market("MISSING")
+
+    with pytest.raises(HttpError) as error:
+        asyncio.run(fetch())
+
+    assert error.value.status == 404
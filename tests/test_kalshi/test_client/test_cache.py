@@ -0,0 +1,137 @@
+"""Tests for the response cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.cache import ResponseCache
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_get_or_fetch__within_ttl__hits() -> None:
+    """Test that a fresh entry is served and a stale one refetched."""
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"market": 5}, clock=clock)
+    calls = []
+
+    def fetch() -> dict:
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert cache.get_or_fetch("market", "/markets/A", fetch) == {"n": 1}
+    assert cache.get_or_fetch("market", "/markets/A", fetch) == {"n": 1}
+    clock.now = 6
+    assert cache.get_or_fetch("market", "/markets/A", fetch) == {"n": 2}
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+    assert cache.stats.expirations == 1
+
+
+def test_put__over_max_entries__evicts_least_recently_used() -> None:
+    """Test LRU eviction by entry count."""
+    cache = ResponseCache(max_entries=2)
+    cache.put("market", "a", 1)
+    cache.put("market", "b", 2)
+    cache.get_or_fetch("market", "a", lambda: pytest.fail("should hit"))
+    cache.put("market", "c", 3)
+
+    assert cache.get_or_fetch("market", "a", lambda: None) == 1
+    assert cache.get_or_fetch("market", "b", lambda: "refetched") == "refetched"
+    assert cache.stats.evictions == 2
+
+
+def test_put__over_max_bytes__evicts() -> None:
+    """Test eviction by the encoded size of the entries."""
+    cache = ResponseCache(max_bytes=30)
+    cache.put("market", "a", {"payload": "x" * 10})
+    cache.put("market", "b", {"payload": "y" * 10})
+
+    assert len(cache) == 1
+    assert cache.size <= 30
+
+
+def test_invalidate__endpoint__drops_only_that_endpoint() -> None:
+    """Test explicit invalidation."""
+    cache = ResponseCache()
+    cache.put("market", "/markets/A", 1)
+    cache.put("event", "/events/E", 2)
+
+    assert cache.invalidate(endpoint="market") == 1
+    assert cache.invalidate(key="/events/E") == 1
+    assert len(cache) == 0
+
+
+def test_get_or_fetch__concurrent_misses__coalesced() -> None:
+    """Test that identical in-flight lookups share one fetch."""
+    cache = ResponseCache()
+    release = threading.Event()
+    calls = []
+
+    def fetch() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(cache.get_or_fetch, "market", "/markets/A", fetch)
+            for _ in range(8)
+        ]
+        while cache.stats.misses + cache.stats.coalesced < 8:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert cache.stats.coalesced == 7
+
+
+def test_get_or_fetch__fetch_fails__error_shared_and_not_cached() -> None:
+    """Test that a failed fetch is not cached."""
+    cache = ResponseCache()
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("market", "a", fail)
+    assert cache.get_or_fetch("market", "a", lambda: "ok") == "ok"
+
+
+def test_get_market__cache_enabled__one_request(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that repeated market lookups hit the cache."""
+    client = ExchangeClient(
+        fake_exchange.url,
+        "key",
+        private_key,
+        cache=ResponseCache(),
+    )
+    client.rate_limiter = None
+
+    for _ in range(5):
+        client.get_market("FAKE-EVENT-00001")
+
+    assert fake_exchange.requests == 1
+    assert client.cache is not None
+    assert client.cache.stats.hits == 4
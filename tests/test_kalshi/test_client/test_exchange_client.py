@@ -0,0 +1,71 @@
+"""Tests for the exchange client."""
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.cache import ResponseCache
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient, chunk_tickers
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def test_chunk_tickers__limits__respected() -> None:
+    """Test chunking by count and by joined length."""
+    tickers = [f"T{i:03d}" for i in range(10)]
+
+    assert chunk_tickers(tickers, max_count=4) == [
+        tickers[0:4],
+        tickers[4:8],
+        tickers[8:10],
+    ]
+    # each ticker is 4 characters, so two fit in 9 with their comma
+    assert [len(c) for c in chunk_tickers(tickers, max_length=9)] == [2] * 5
+    assert chunk_tickers(["A", "B", "A"]) == [["A", "B"]]
+    assert chunk_tickers([]) == []
+
+
+def test_get_markets_by_tickers__many_tickers__few_requests(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that 250 tickers resolve in a handful of requests."""
+    tickers = [m["ticker"] for m in fake_exchange.markets] + ["MISSING"]
+    client = ExchangeClient(
+        fake_exchange.url,
+        "key",
+        private_key,
+        cache=ResponseCache(),
+    )
+    client.rate_limiter = None
+
+    markets = client.get_markets_by_tickers(tickers)
+
+    assert set(markets) == set(tickers) - {"MISSING"}
+    assert markets["FAKE-EVENT-00042"]["ticker"] == "FAKE-EVENT-00042"
+    assert fake_exchange.requests == 3
+
+    client.get_market("FAKE-EVENT-00042")
+    assert fake_exchange.requests == 3
+
+
+def test_order_endpoints__fake_exchange__round_trip(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test creating, reading, decreasing and cancelling an order."""
+    client = ExchangeClient(fake_exchange.url, "key", private_key)
+    client.rate_limiter = None
+
+    order = client.create_order(
+        ticker="FAKE-EVENT-00001",
+        client_order_id="abc",
+        side="yes",
+        action="buy",
+        count=10,
+        order_type="limit",
+        yes_price=40,
+    )["order"]
+    client.decrease_order(order["order_id"], reduce_by=4)
+
+    assert client.get_order(order["order_id"])["order"]["remaining_count"] == 6
+    assert client.cancel_order(order["order_id"])["reduced_by"] == 6
+    assert [o["status"] for o in client.iter_orders()] == ["canceled"]
+    assert client.get_balance()["balance"] > 0
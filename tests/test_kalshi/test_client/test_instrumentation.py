@@ -0,0 +1,80 @@
+"""Tests for the request instrumentation."""
+
+import json
+import logging
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.http_error import HttpError
+from kalshi_tracker.kalshi.client.instrumentation import (
+    Histogram,
+    Instrumentation,
+    LogSink,
+    MemorySink,
+    PrometheusSink,
+)
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def test_histogram__observations__bucketed() -> None:
+    """Test bucket counts and quantile bounds."""
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 0.7, 5.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.8) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+    assert histogram.as_dict()["sum"] == pytest.approx(6.35)
+
+
+def test_request__sinks__receive_phases(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that every attempt reaches the memory, Prometheus and log sinks."""
+    memory, prometheus = MemorySink(), PrometheusSink()
+    client = ExchangeClient(
+        fake_exchange.url,
+        "key",
+        private_key,
+        instrumentation=Instrumentation(memory, prometheus, LogSink()),
+    )
+    client.rate_limiter = None
+
+    with caplog.at_level(logging.INFO):
+        client.get_market("FAKE-EVENT-00001")
+        client.get_market("FAKE-EVENT-00002")
+        with pytest.raises(HttpError):
+            client.get_market("MISSING")
+        client.get_markets(limit=5)
+
+    snapshot = memory.snapshot()
+    assert set(snapshot) == {"GET /markets/{id}", "GET /markets"}
+    market = snapshot["GET /markets/{id}"]
+    assert market["requests"] == 3
+    assert market["statuses"] == {"200": 2, "404": 1}
+    assert market["bytes_out"] == 0
+    assert market["bytes_in"] > 0
+    assert market["sign"]["count"] == 3
+    assert market["network"]["sum"] > 0
+    assert market["decode"]["sum"] > 0
+
+    text = prometheus.render()
+    assert (
+        'kalshi_client_responses_total{endpoint="GET /markets/{id}",status="404"} 1'
+        in text
+    )
+    assert (
+        'kalshi_client_request_phase_seconds_count{endpoint="GET /markets",'
+        'phase="network"} 1' in text
+    )
+
+    lines = [json.loads(r.message) for r in caplog.records]
+    assert [line["status"] for line in lines] == [200, 200, 404, 200]
+    assert set(lines[0]) >= {"endpoint", "rate_limit", "sign", "network", "decode"}
@@ -0,0 +1,56 @@
+"""Tests for the Kalshi client."""
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.http_error import HttpError
+from kalshi_tracker.kalshi.client.session import make_session
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def test_get__many_requests__reuses_one_connection(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that the client keeps its connection alive between calls."""
+    client = ExchangeClient(fake_exchange.url, "key", private_key)
+    client.rate_limiter = None
+
+    for _ in range(10):
+        assert client.get_exchange_status()["exchange_active"]
+
+    assert fake_exchange.requests == 10
+    assert fake_exchange.connections == 1
+
+
+def test_get__shared_session__clients_share_connections(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that clients given the same session share its pool."""
+    session = make_session()
+    clients = [
+        ExchangeClient(fake_exchange.url, key, private_key, session=session)
+        for key in ("a", "b")
+    ]
+
+    for client in clients:
+        client.rate_limiter = None
+        client.get_market("FAKE-EVENT-00001")
+
+    assert clients[0].session is clients[1].session
+    assert fake_exchange.connections == 1
+
+
+def test_get__missing_market__raises_http_error(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that a 404 becomes an HttpError."""
+    client = ExchangeClient(fake_exchange.url, "key", private_key)
+
+    with pytest.raises(HttpError) as error:
+        client.get_market("MISSING")
+
+    assert error.value.status == 404
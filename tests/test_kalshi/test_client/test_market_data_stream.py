@@ -0,0 +1,160 @@
+"""Tests for the websocket market-data stream."""
+
+import asyncio
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from websockets.asyncio.client import connect
+from websockets.exceptions import InvalidStatus
+
+from kalshi_tracker.kalshi.client.kalshi_client import KalshiClient
+from kalshi_tracker.kalshi.client.market_data_stream import (
+    OVERFLOW_DROP_OLDEST,
+    MarketDataStream,
+    apply_orderbook_message,
+    websocket_url,
+)
+from kalshi_tracker.kalshi.testing.fake_feed import FakeFeed
+
+if TYPE_CHECKING:
+    from kalshi_tracker.kalshi.orderbook import OrderBook
+
+TICKERS = ["FAKE-A", "FAKE-B", "FAKE-C", "FAKE-D"]
+
+
+class _CountingQueue(asyncio.Queue[dict[str, Any]]):
+    """A queue that sets ``done`` once ``taken`` messages were taken out of it."""
+
+    def __init__(self, maxsize: int, taken: int) -> None:
+        """Initialize the queue."""
+        super().__init__(maxsize)
+        self.taken = taken
+        self.done = asyncio.Event()
+
+    def get_nowait(self) -> dict[str, Any]:
+        """Take a message, counting it."""
+        self.taken -= 1
+        if self.taken <= 0:
+            self.done.set()
+        return super().get_nowait()
+
+
+@pytest.fixture
+def signer(private_key: rsa.RSAPrivateKey) -> KalshiClient:
+    """Create a client to sign the handshake with."""
+    return KalshiClient(
+        "https://api.elections.kalshi.com/trade-api/v2",
+        "key",
+        private_key,
+    )
+
+
+@pytest.fixture
+def fake_feed() -> Iterator[FakeFeed]:
+    """Run a local stand-in feed for the duration of a test."""
+    with FakeFeed() as feed:
+        yield feed
+
+
+async def _collect(stream: MarketDataStream, n: int) -> list[dict]:
+    async with stream:
+        return [await asyncio.wait_for(stream.get(), timeout=5) for _ in range(n)]
+
+
+def test_websocket_url__from_rest_host() -> None:
+    """Test the websocket URL derived from the REST base."""
+    assert (
+        websocket_url("https://api.elections.kalshi.com/trade-api/v2")
+        == "wss://api.elections.kalshi.com/trade-api/ws/v2"
+    )
+
+
+def test_apply_orderbook_message__no_ticker__skipped() -> None:
+    """Test that orderbook data naming no market changes no book."""
+    books: dict[str, OrderBook] = {}
+    message = {"type": "orderbook_snapshot", "msg": {"yes": [[40, 10]], "no": []}}
+
+    assert apply_orderbook_message(books, message) is None
+    assert books == {}
+
+
+def test_stream__subscribed__snapshots_then_deltas(
+    signer: KalshiClient,
+    fake_feed: FakeFeed,
+) -> None:
+    """Test that a signed stream gets snapshots and keeps books current."""
+    stream = MarketDataStream(signer, TICKERS, url=fake_feed.url)
+
+    messages = asyncio.run(_collect(stream, 200))
+
+    books: dict[str, OrderBook] = {}
+    for message in messages:
+        apply_orderbook_message(books, message)
+
+    assert fake_feed.rejected == 0
+    assert set(books) == set(TICKERS)
+    assert {m["type"] for m in messages} >= {
+        "subscribed",
+        "orderbook_snapshot",
+        "orderbook_delta",
+        "trade",
+    }
+    assert all(book.best_bid("yes") == 40 for book in books.values())
+    assert fake_feed.subscriptions[0]["params"]["market_tickers"] == TICKERS
+
+
+def test_stream__disconnected__reconnects_and_resubscribes(
+    signer: KalshiClient,
+) -> None:
+    """Test that a dropped connection is reopened with the same subscriptions."""
+    with FakeFeed(disconnect_after=20) as feed:
+        stream = MarketDataStream(
+            signer,
+            TICKERS,
+            url=feed.url,
+            min_reconnect_delay=0.01,
+        )
+        asyncio.run(_collect(stream, 60))
+
+    assert stream.stats.connects >= 3
+    assert feed.connections == stream.stats.connects
+    assert all(s["params"]["market_tickers"] == TICKERS for s in feed.subscriptions)
+    assert stream.stats.sequence_gaps == 0
+
+
+def test_stream__full_queue__drops_oldest(
+    signer: KalshiClient,
+    fake_feed: FakeFeed,
+) -> None:
+    """Test that a slow consumer loses old messages rather than stalling."""
+
+    async def run() -> MarketDataStream:
+        stream = MarketDataStream(
+            signer,
+            TICKERS,
+            url=fake_feed.url,
+            max_queue=10,
+            overflow=OVERFLOW_DROP_OLDEST,
+        )
+        queue = stream.queue = _CountingQueue(10, taken=50)
+        async with stream:
+            await queue.done.wait()
+        return stream
+
+    stream = asyncio.run(run())
+
+    assert stream.queue.qsize() == 10
+
+
+def test_stream__unsigned_handshake__rejected(fake_feed: FakeFeed) -> None:
+    """Test that the fake feed enforces the auth headers."""
+
+    async def run() -> None:
+        async with connect(fake_feed.url):
+            pass
+
+    with pytest.raises(InvalidStatus):
+        asyncio.run(run())
+    assert fake_feed.rejected == 1
@@ -0,0 +1,199 @@
+"""Tests for the batched order pipeline."""
+
+import time
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.order_pipeline import OrderPipeline
+from kalshi_tracker.kalshi.client.rate_limiter import RateLimiter
+from kalshi_tracker.kalshi.client.retry import RetryPolicy
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def _orders(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "ticker": f"FAKE-EVENT-{i % 250:05d}",
+            "client_order_id": f"order-{i}",
+            "side": "yes",
+            "action": "buy",
+            "count": 1 + i % 5,
+            "type": "limit",
+            "yes_price": 40,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def client(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> ExchangeClient:
+    """Create a client of the fake exchange without a rate limit or retries."""
+    client = ExchangeClient(
+        fake_exchange.url,
+        "key",
+        private_key,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    client.rate_limiter = None
+    return client
+
+
+def test_create_orders__many_orders__full_batches(
+    client: ExchangeClient,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that orders are split into full batches and deduplicated."""
+    orders = _orders(105)
+    orders.append(dict(orders[0]))
+
+    report = OrderPipeline(client).create_orders(orders)
+
+    assert len(report.results) == 105
+    assert all(result.ok for result in report.results)
+    keys = [o["client_order_id"] for o in orders[:-1]]
+    assert [r.key for r in report.results] == keys
+    assert report.requests == fake_exchange.requests == 6
+    assert len(fake_exchange.orders) == 105
+    assert report.summary()["batch_latency"]["count"] == 6
+
+
+def test_create_orders__failed_legs__only_they_are_retried(
+    client: ExchangeClient,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that transient leg and batch failures are retried alone."""
+    sent: list[list[str]] = []
+    failed: set[str] = set()
+
+    def flaky(body: dict[str, Any], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        sent.append([o["client_order_id"] for o in body["orders"]])
+        if len(sent) == 1:
+            return 503, {"error": {"code": "service_unavailable"}}
+        legs = []
+        for order in body["orders"]:
+            key = order["client_order_id"]
+            if key.endswith("3") and key not in failed:
+                failed.add(key)
+                error = {"code": "internal_server_error", "message": "flaky"}
+                legs.append({"client_order_id": key, "error": error})
+            else:
+                legs.append(fake_exchange.place_order(order))
+        return 201, {"orders": legs}
+
+    fake_exchange.add_route("POST", r"/portfolio/orders/batched", flaky)
+    pipeline = OrderPipeline(client, batch_size=10, max_workers=1, retry_delay=0)
+
+    report = pipeline.create_orders(_orders(30))
+
+    assert all(result.ok for result in report.results)
+    # the legs ending in 3 fail the first time the exchange reads them
+    assert sent[3:] == [sent[0], ["order-13", "order-23"], ["order-3"]]
+    assert report.retries == 12 + 1
+    assert report.results[3].attempts == 3
+    assert report.results[13].attempts == 2
+    assert len(fake_exchange.orders) == 30
+
+
+def test_create_orders__final_errors__reported_per_order(
+    client: ExchangeClient,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that rejected orders are not retried."""
+    # the same client order id on another market
+    fake_exchange.place_order({**_orders(1)[0], "ticker": "FAKE-EVENT-00001"})
+
+    report = OrderPipeline(client, retry_delay=0).create_orders(_orders(3))
+
+    assert [r.ok for r in report.results] == [False, True, True]
+    assert report.failed[0].error["code"] == "order_already_exists"
+    assert report.retries == 0
+
+
+def test_create_orders__batch_answer_lost__existing_orders_found(
+    client: ExchangeClient,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that orders placed by a batch whose answer was lost count as created."""
+    lost: list[int] = []
+
+    def lossy(body: dict[str, Any], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        legs = [fake_exchange.place_order(order) for order in body["orders"]]
+        if not lost:
+            lost.append(len(legs))
+            return 503, {"error": {"code": "service_unavailable"}}
+        return 201, {"orders": legs}
+
+    fake_exchange.add_route("POST", r"/portfolio/orders/batched", lossy)
+    pipeline = OrderPipeline(client, batch_size=10, max_workers=1, retry_delay=0)
+
+    report = pipeline.create_orders(_orders(30))
+
+    assert report.failed == []
+    assert len(fake_exchange.orders) == 30
+    orders = {o["client_order_id"]: o for o in fake_exchange.orders.values()}
+    assert [r.order for r in report.results[:10]] == [
+        orders[f"order-{i}"] for i in range(10)
+    ]
+    assert report.results[0].attempts == 2
+
+
+def test_cancel_orders__resting_orders__canceled(
+    client: ExchangeClient,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test cancelling orders created by the pipeline."""
+    pipeline = OrderPipeline(client)
+    created = pipeline.create_orders(_orders(50))
+    order_ids = [result.order["order_id"] for result in created.results]
+
+    report = pipeline.cancel_orders([*order_ids, "unknown"])
+
+    assert [r.ok for r in report.results] == [True] * 50 + [False]
+    assert {o["status"] for o in fake_exchange.orders.values()} == {"canceled"}
+
+
+def test_cancel_orders__batch_answer_lost__canceled_orders_found(
+    client: ExchangeClient,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that cancels done by a batch whose answer was lost count as done."""
+    pipeline = OrderPipeline(client, max_workers=1, retry_delay=0)
+    created = pipeline.create_orders(_orders(30))
+    order_ids = [result.order["order_id"] for result in created.results]
+    lost: list[int] = []
+
+    def lossy(body: dict[str, Any], **_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        legs = [fake_exchange.cancel_order(order_id) for order_id in body["ids"]]
+        if not lost:
+            lost.append(len(legs))
+            return 503, {"error": {"code": "service_unavailable"}}
+        return 200, {"orders": legs}
+
+    fake_exchange.add_route("DELETE", r"/portfolio/orders/batched", lossy)
+
+    report = pipeline.cancel_orders([*order_ids, "unknown"])
+
+    assert [r.ok for r in report.results] == [True] * 30 + [False]
+    assert report.results[0].attempts == 2
+    assert report.results[0].order["status"] == "canceled"
+    assert {o["status"] for o in fake_exchange.orders.values()} == {"canceled"}
+
+
+def test_create_orders__write_budget__respected(
+    client: ExchangeClient,
+) -> None:
+    """Test that batches wait for one write token per order."""
+    client.rate_limiter = RateLimiter(write_rate=1000, write_burst=20)
+
+    start = time.perf_counter()
+    report = OrderPipeline(client).create_orders(_orders(200))
+
+    assert not report.failed
+    # the first 20 orders ride the burst
+    assert time.perf_counter() - start >= 0.17
@@ -0,0 +1,95 @@
+"""Tests for the streaming pagination iterators."""
+
+import threading
+from collections.abc import Callable
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.pagination import iter_pages, iter_records
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def _pages(n_pages: int, calls: list) -> Callable[[str | None], dict]:
+    """Build a fetch function serving ``n_pages`` pages of two records."""
+
+    def fetch(cursor: str | None) -> dict:
+        calls.append(cursor)
+        page = int(cursor or 0)
+        return {
+            "records": [page * 2, page * 2 + 1],
+            "cursor": str(page + 1) if page + 1 < n_pages else "",
+        }
+
+    return fetch
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_records__many_pages__yields_every_record(prefetch: bool) -> None:
+    """Test that records from every page are streamed in order."""
+    calls: list = []
+
+    records = list(iter_records(_pages(4, calls), "records", prefetch=prefetch))
+
+    assert records == list(range(8))
+    assert calls == [None, "1", "2", "3"]
+
+
+def test_iter_pages__prefetch__requests_next_page_before_yield() -> None:
+    """Test that the next page is already requested while one is consumed."""
+    requested = threading.Event()
+    calls: list = []
+    fetch = _pages(2, calls)
+
+    def tracking_fetch(cursor: str | None) -> dict:
+        if cursor is not None:
+            requested.set()
+        return fetch(cursor)
+
+    pages = iter_pages(tracking_fetch)
+    next(pages)
+
+    assert requested.wait(timeout=1)
+    pages.close()
+
+
+def test_iter_pages__closed_early__stops_fetching() -> None:
+    """Test that abandoning the iterator does not walk the rest."""
+    calls: list = []
+
+    for record in iter_records(_pages(100, calls), "records"):
+        if record == 3:
+            break
+
+    assert len(calls) <= 3
+
+
+def test_iter_trades__filters__resent_on_every_page(
+    private_key: rsa.RSAPrivateKey,
+) -> None:
+    """Test a full sweep of a filtered endpoint against the fake exchange."""
+    with FakeExchange(n_markets=4, n_trades=100) as exchange:
+        client = ExchangeClient(exchange.url, "key", private_key)
+        client.rate_limiter = None
+
+        trades = list(client.iter_trades(ticker="FAKE-EVENT-00001", page_size=7))
+
+    assert len(trades) == 25
+    assert {t["ticker"] for t in trades} == {"FAKE-EVENT-00001"}
+    assert len({t["trade_id"] for t in trades}) == 25
+
+
+def test_iter_markets__all_pages__streams_every_market(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that every market is returned exactly once."""
+    client = ExchangeClient(fake_exchange.url, "key", private_key)
+    client.rate_limiter = None
+
+    markets = list(client.iter_markets(page_size=100))
+
+    assert [m["ticker"] for m in markets] == [
+        m["ticker"] for m in fake_exchange.markets
+    ]
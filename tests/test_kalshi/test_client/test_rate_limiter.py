@@ -0,0 +1,153 @@
+"""Tests for the token-bucket rate limiter."""
+
+import threading
+import time
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.http_error import HttpError
+from kalshi_tracker.kalshi.client.kalshi_client import KalshiClient
+from kalshi_tracker.kalshi.client.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    parse_retry_after,
+)
+from kalshi_tracker.kalshi.client.retry import RetryPolicy
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_token_bucket__burst__then_waits_for_refill() -> None:
+    """Test that the burst is free and later tokens wait for the rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=5, clock=clock)
+
+    waits = [bucket.reserve() for _ in range(7)]
+
+    assert waits[:5] == [0, 0, 0, 0, 0]
+    assert waits[5:] == pytest.approx([0.1, 0.2])
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+    assert bucket.tokens == pytest.approx(4)
+
+
+def test_token_bucket__throttled__backs_off_then_recovers() -> None:
+    """Test the adaptive rate after a 429."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=10, clock=clock)
+
+    bucket.throttled(retry_after=2)
+
+    assert bucket.rate == 5
+    assert bucket.reserve() == pytest.approx(2.2)
+
+    for _ in range(1000):
+        bucket.succeeded()
+    assert bucket.rate == 10
+
+
+def test_rate_limiter__reads_and_writes__separate_budgets() -> None:
+    """Test that writes do not use up the read budget."""
+    limiter = RateLimiter(read_rate=2, write_rate=1, clock=FakeClock())
+
+    assert limiter.bucket("get") is limiter.read
+    assert limiter.bucket("POST") is limiter.write
+    assert limiter.bucket("DELETE") is limiter.write
+
+    limiter.write.reserve()
+    assert limiter.read.reserve() == 0
+
+
+def test_token_bucket__threads__share_one_budget() -> None:
+    """Test that concurrent threads together respect the rate."""
+    bucket = TokenBucket(rate=200, capacity=1)
+
+    def worker() -> None:
+        for _ in range(10):
+            bucket.acquire()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # 40 tokens at 200/s with one free token
+    assert elapsed >= 39 / 200 * 0.95
+
+
+def test_get_rate_limiter__same_key__shared() -> None:
+    """Test that clients of one key share a limiter."""
+    assert get_rate_limiter("shared-key") is get_rate_limiter("shared-key")
+    assert get_rate_limiter("shared-key") is not get_rate_limiter("other-key")
+
+
+def test_parse_retry_after__seconds_and_dates() -> None:
+    """Test both Retry-After formats."""
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+def test_request__server_throttles__limiter_backs_off(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that a 429 from the server slows the limiter down."""
+    fake_exchange.add_route(
+        "GET",
+        r"/exchange/status",
+        lambda **_: (429, {"error": {"code": "too_many_requests"}}),
+    )
+    limiter = RateLimiter(read_rate=100)
+    client = ExchangeClient(
+        fake_exchange.url,
+        "key",
+        private_key,
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+    with pytest.raises(HttpError):
+        client.get_exchange_status()
+
+    assert limiter.read.rate == 50
+    assert limiter.write.rate == limiter.write.max_rate
+
+
+def test_init__threshold__honored(private_key: rsa.RSAPrivateKey) -> None:
+    """Test that the rate limit threshold argument is used."""
+    slow = KalshiClient(
+        "http://localhost",
+        "key",
+        private_key,
+        rate_limit_threshold=500,
+    )
+    unlimited = KalshiClient(
+        "http://localhost",
+        "key",
+        private_key,
+        rate_limit_threshold=0,
+    )
+
+    assert slow.rate_limiter is not None
+    assert slow.rate_limiter.read.rate == 2
+    assert unlimited.rate_limiter is None
@@ -0,0 +1,263 @@
+"""Tests for the retry policy and the circuit breaker."""
+
+import json
+import random
+from typing import Any
+
+import pytest
+import requests
+from cryptography.hazmat.primitives.asymmetric import rsa
+from pytest_mock import MockerFixture
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.http_error import HttpError
+from kalshi_tracker.kalshi.client.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_key,
+)
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def _failing(statuses: list[int]) -> Any:  # noqa: ANN401
+    """Make a route handler answering ``statuses`` in turn, then 200."""
+    answers = iter(statuses)
+
+    def handler(**_: Any) -> tuple[int, Any]:  # noqa: ANN401
+        status = next(answers, 200)
+        if status == 200:
+            return 200, {"exchange_active": True}
+        return status, {"error": {"code": "unavailable"}}
+
+    return handler
+
+
+def _client(url: str, private_key: rsa.RSAPrivateKey, **kwargs: Any) -> ExchangeClient:  # noqa: ANN401
+    client = ExchangeClient(
+        url,
+        "key",
+        private_key,
+        retry_policy=RetryPolicy(base_delay=0.001, rng=random.Random(0)),
+        **kwargs,
+    )
+    client.rate_limiter = None
+    return client
+
+
+def test_endpoint_key__ids__templated() -> None:
+    """Test that tickers and ids are grouped under one endpoint."""
+    assert endpoint_key("get", "/markets/KX-1/orderbook?depth=5") == (
+        "GET /markets/{id}/orderbook"
+    )
+    assert endpoint_key("GET", "/markets?limit=5") == "GET /markets"
+    assert endpoint_key("DELETE", "/portfolio/orders/ord-1/cancel") == (
+        "DELETE /portfolio/orders/{id}/cancel"
+    )
+
+
+def test_is_safe__methods_and_bodies__only_idempotent() -> None:
+    """Test which requests may be sent twice."""
+    policy = RetryPolicy()
+    order = {"ticker": "T", "client_order_id": "abc"}
+
+    assert policy.is_safe("GET")
+    assert policy.is_safe("POST", json.dumps(order))
+    assert policy.is_safe("POST", json.dumps({"orders": [order, order]}))
+    assert not policy.is_safe("POST", json.dumps({"orders": [order, {"ticker": "T"}]}))
+    assert not policy.is_safe("POST", json.dumps({"ticker": "T"}))
+    assert not policy.is_safe("POST", None)
+    assert not policy.is_safe("DELETE", json.dumps({"ids": ["a"]}))
+
+
+def test_delay__backoff__jittered_capped_and_floored() -> None:
+    """Test the full-jitter backoff bounds and the Retry-After floor."""
+    policy = RetryPolicy(base_delay=1, max_delay=4, rng=random.Random(0))
+
+    delays = [policy.delay(attempt) for attempt in (1, 2, 3, 4, 5) for _ in range(50)]
+
+    assert min(delays) >= 0
+    assert max(delays[:50]) <= 1
+    assert max(delays[200:]) <= 4
+    assert policy.delay(1, retry_after=3) >= 3
+    assert policy.delay(1, retry_after=100) <= 4
+    assert not policy.should_retry(4, 503)
+    assert not policy.should_retry(1, 400)
+    assert policy.should_retry(1, None)
+
+
+def test_request__transient_errors__retried(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that a GET survives a 503 and a 429."""
+    fake_exchange.add_route("GET", r"/exchange/status", _failing([503, 429]))
+    client = _client(fake_exchange.url, private_key)
+
+    assert client.get_exchange_status()["exchange_active"]
+
+    assert fake_exchange.requests == 3
+    metrics = client.retry_metrics.as_dict()
+    assert metrics["retries"] == {"503": 1, "429": 1}
+    assert metrics["time_lost"] > 0
+
+
+def test_request__299__is_success(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that every 2XX status counts as success."""
+    fake_exchange.add_route("GET", r"/exchange/status", lambda **_: (299, {"ok": 1}))
+    client = _client(fake_exchange.url, private_key)
+
+    assert client.get_exchange_status() == {"ok": 1}
+
+
+def test_request__unsafe_post__not_retried(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that orders are only retried with a client order id."""
+    fake_exchange.add_route("POST", r"/portfolio/orders", _failing([503, 503]))
+    client = _client(fake_exchange.url, private_key)
+
+    with pytest.raises(HttpError):
+        client.post("/portfolio/orders", json.dumps({"ticker": "T"}))
+    assert fake_exchange.requests == 1
+
+    client.post("/portfolio/orders", json.dumps({"client_order_id": "a"}))
+    assert fake_exchange.requests == 3
+
+
+def test_request__connection_refused__retried_then_raised(
+    private_key: rsa.RSAPrivateKey,
+) -> None:
+    """Test that connection errors are retried and finally re-raised."""
+    client = _client("http://127.0.0.1:1", private_key)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get_exchange_status()
+
+    metrics = client.retry_metrics.as_dict()
+    assert metrics["retries"] == {"ConnectionError": 3}
+    assert metrics["exhausted"] == 1
+
+
+def test_circuit_breaker__failures__open_trial_close() -> None:
+    """Test the breaker's closed, open and half-open states."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    endpoint = "GET /markets"
+
+    breaker.failed(endpoint)
+    breaker.check(endpoint)
+    breaker.failed(endpoint)
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.check(endpoint)
+    assert error.value.retry_in == 10
+    breaker.check("GET /events")
+
+    clock.now = 10
+    breaker.check(endpoint)
+    # only one trial request at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.check(endpoint)
+    breaker.failed(endpoint)
+    assert breaker.is_open(endpoint)
+
+    clock.now = 20
+    breaker.check(endpoint)
+    breaker.succeeded(endpoint)
+    assert not breaker.is_open(endpoint)
+
+
+def test_circuit_breaker__trial_released__next_request_is_trial() -> None:
+    """Test that a trial ending without an outcome lets another trial go."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    endpoint = "GET /markets"
+
+    breaker.failed(endpoint)
+    clock.now = 10
+    assert breaker.check(endpoint)
+    breaker.release(endpoint)
+
+    assert breaker.check(endpoint)
+    assert breaker.is_open(endpoint)
+
+
+def test_request__trial_raises__circuit_not_stuck(
+    mocker: MockerFixture,
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that a trial request failing with an unexpected error is released."""
+    fake_exchange.add_route("GET", r"/exchange/status", _failing([500]))
+    clock = FakeClock()
+    client = _client(
+        fake_exchange.url,
+        private_key,
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout=10,
+            clock=clock,
+        ),
+    )
+    client.retry_policy.max_attempts = 1
+    with pytest.raises(HttpError):
+        client.get_exchange_status()
+
+    clock.now = 10
+    cut = requests.exceptions.ChunkedEncodingError("cut")
+    send = mocker.patch.object(client.session, "request", side_effect=cut)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        client.get_exchange_status()
+    mocker.stop(send)
+
+    assert client.get_exchange_status()["exchange_active"]
+    assert not client.circuit_breaker.is_open("GET /exchange/status")
+
+
+def test_request__failing_endpoint__circuit_stops_requests(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that the client stops hammering an endpoint that keeps failing."""
+    fake_exchange.add_route("GET", r"/exchange/status", _failing([500] * 10))
+    client = _client(
+        fake_exchange.url,
+        private_key,
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client.get_exchange_status()
+
+    assert fake_exchange.requests == 2
+    assert client.retry_metrics.rejected == 1
+    # other endpoints are unaffected
+    client.get_market("FAKE-EVENT-00001")
+
+
+def test_request__throttling_exchange__recovers(private_key: rsa.RSAPrivateKey) -> None:
+    """Test that requests beyond the exchange's rate wait for Retry-After."""
+    with FakeExchange(n_markets=1, rate_limit=5, retry_after=1) as exchange:
+        client = _client(exchange.url, private_key)
+
+        for _ in range(8):
+            assert client.get_exchange_status()["exchange_active"]
+
+    assert exchange.throttled > 0
+    assert client.retry_metrics.retries["429"] == exchange.throttled
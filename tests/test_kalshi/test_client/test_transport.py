@@ -0,0 +1,98 @@
+"""Tests for the record/replay transport."""
+
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.client.http_error import HttpError
+from kalshi_tracker.kalshi.client.retry import RetryPolicy
+from kalshi_tracker.kalshi.client.session import make_session
+from kalshi_tracker.kalshi.client.transport import (
+    PASSTHROUGH,
+    RECORD,
+    REPLAY,
+    ReplayMissError,
+    ResponseStore,
+    mount_store,
+    request_key,
+)
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def _client(
+    url: str,
+    private_key: rsa.RSAPrivateKey,
+    store: Path,
+    mode: str,
+) -> ExchangeClient:
+    session = make_session()
+    mount_store(session, store, mode)
+    client = ExchangeClient(
+        url,
+        "key",
+        private_key,
+        session=session,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    client.rate_limiter = None
+    return client
+
+
+def test_request_key__equivalent_requests__same_key() -> None:
+    """Test that the host and query order do not change the key."""
+    key = request_key("get", "https://a.com/trade-api/v2/markets?limit=5&cursor=x")
+
+    assert key == "GET /trade-api/v2/markets?cursor=x&limit=5"
+    other_host = "http://127.0.0.1:9/trade-api/v2/markets?cursor=x&limit=5"
+    assert key == request_key("GET", other_host)
+    assert request_key("POST", "http://h/orders", b'{"a": 1}') != request_key(
+        "POST",
+        "http://h/orders",
+        b'{"a": 2}',
+    )
+
+
+def test_replay__recorded_session__served_offline(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+    tmp_path: Path,
+) -> None:
+    """Test that a recorded sweep replays with no exchange running."""
+    store = tmp_path / "kalshi.sqlite"
+    recorder = _client(fake_exchange.url, private_key, store, RECORD)
+    markets = list(recorder.iter_markets(page_size=100))
+    positions = list(recorder.iter_positions())
+    with pytest.raises(HttpError):
+        recorder.get_market("MISSING")
+    requests = fake_exchange.requests
+
+    # nothing listens on port 9
+    offline = "http://127.0.0.1:9/trade-api/v2"
+    replayer = _client(offline, private_key, store, REPLAY)
+
+    assert list(replayer.iter_markets(page_size=100)) == markets
+    assert list(replayer.iter_positions()) == positions
+    with pytest.raises(HttpError) as error:
+        replayer.get_market("MISSING")
+    assert error.value.status == 404
+    with pytest.raises(ReplayMissError):
+        replayer.get_market("FAKE-EVENT-00001")
+    assert fake_exchange.requests == requests
+    assert len(ResponseStore(store)) == requests
+
+
+def test_passthrough__requests__not_recorded(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+    tmp_path: Path,
+) -> None:
+    """Test that passthrough mode only sends."""
+    store = tmp_path / "kalshi.sqlite"
+    client = _client(fake_exchange.url, private_key, store, PASSTHROUGH)
+
+    client.get_exchange_status()
+
+    assert fake_exchange.requests == 1
+    assert len(ResponseStore(store)) == 0
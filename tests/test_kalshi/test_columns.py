@@ -0,0 +1,74 @@
+"""Tests for the columnar page builder."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kalshi_tracker.kalshi.columns import ColumnBuilder, build_frame
+from kalshi_tracker.kalshi.testing.fake_exchange import make_market, make_trade
+
+
+def test_build_frame__trades__match_from_records() -> None:
+    """Test the typed frame against from_records and per-column cleanup."""
+    trades = [make_trade(i, f"FAKE-EVENT-{i % 3}") for i in range(2500)]
+
+    frame = build_frame(iter(trades), "trades")
+
+    expected = pd.DataFrame.from_records(trades)[list(frame.columns)]
+    expected[["yes_price", "no_price"]] = expected[["yes_price", "no_price"]] / 100
+    expected["created_time"] = pd.to_datetime(expected["created_time"]).dt.as_unit(
+        "ns",
+    )
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False)
+    assert frame["count"].dtype == np.int64
+    assert frame["created_time"].dt.tz is not None
+
+
+def test_add_page__missing_and_dollar_fields__typed() -> None:
+    """Test missing values and dollar strings across pages."""
+    builder = ColumnBuilder("markets")
+    builder.add_page({"markets": [make_market("A-1")], "cursor": "x"})
+    builder.add_page(
+        {
+            "markets": [
+                {"ticker": "A-2", "yes_bid_dollars": "0.3900", "volume": None},
+            ],
+        },
+    )
+
+    arrays = builder.to_numpy()
+
+    assert len(builder) == 2
+    np.testing.assert_allclose(arrays["yes_bid"], [0.40, 0.39])
+    assert np.isnan(arrays["yes_ask"][1])
+    assert arrays["volume"].dtype == np.float64
+    assert np.isnan(arrays["volume"][1])
+    assert arrays["close_time"].dtype == "datetime64[ns]"
+    assert np.isnat(arrays["close_time"][1])
+    assert arrays["ticker"].tolist() == ["A-1", "A-2"]
+
+
+def test_to_arrow__positions__typed_table() -> None:
+    """Test building an Arrow table of positions."""
+    builder = ColumnBuilder("market_positions")
+    builder.extend(
+        [{"ticker": "A", "position": 3, "market_exposure": 120, "fees_paid": 7}],
+    )
+
+    table = builder.to_arrow()
+
+    assert table.column("position").to_pylist() == [3]
+    assert table.column("market_exposure").to_pylist() == [1.2]
+    assert table.column("realized_pnl").to_pylist() == [None]
+    assert str(table.schema.field("ticker").type) == "string"
+
+
+def test_add_page__custom_columns_without_key__raises() -> None:
+    """Test that a page cannot be read without knowing where its records are."""
+    builder = ColumnBuilder({"ticker": "str"})
+    page = {"markets": [make_market("A-1")]}
+
+    with pytest.raises(ValueError, match="page key"):
+        builder.add_page(page)
+    builder.add_page(page, "markets")
+    assert len(builder) == 1
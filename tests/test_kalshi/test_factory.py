@@ -0,0 +1,128 @@
+"""Tests for the Kalshi client factory."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from pytest_mock import MockerFixture
+
+from kalshi_tracker.kalshi import factory
+from kalshi_tracker.kalshi.client.transport import RecordReplayAdapter
+from kalshi_tracker.kalshi.settings import KalshiKeySettings
+
+
+def test_get_kalshi_from_settings__pool_settings__applied(
+    mocker: MockerFixture,
+) -> None:
+    """Test that pool size and timeouts come from the settings."""
+    mocker.patch.object(
+        factory,
+        "load_private_key_from_file",
+        return_value=MagicMock(rsa.RSAPrivateKey),
+    )
+    settings = KalshiKeySettings(
+        key="test",
+        key_file="test",
+        pool_maxsize=32,
+        connect_timeout=1,
+        read_timeout=2,
+    )
+
+    client = factory.get_kalshi_from_settings(settings)
+
+    assert client.timeout == (1, 2)
+    assert (
+        client.session.get_adapter("https://").poolmanager.connection_pool_kw["maxsize"]
+        == 32
+    )
+
+
+def test_get_kalshi_from_settings__shared_session__reused(
+    mocker: MockerFixture,
+) -> None:
+    """Test that a given session is shared rather than replaced."""
+    mocker.patch.object(
+        factory,
+        "load_private_key_from_file",
+        return_value=MagicMock(rsa.RSAPrivateKey),
+    )
+    settings = KalshiKeySettings(key="test", key_file="test")
+    session = factory.get_session_from_settings(settings)
+
+    first = factory.get_kalshi_from_settings(settings, session=session)
+    second = factory.get_kalshi_from_settings(settings, session=session)
+
+    assert first.session is second.session is session
+
+
+def test_get_session_from_settings__transport_store__mounted(tmp_path: Path) -> None:
+    """Test that a transport store in the settings is mounted on the session."""
+    settings = KalshiKeySettings(
+        key="test",
+        key_file="test",
+        transport_store=str(tmp_path / "kalshi.sqlite"),
+        transport_mode="record",
+    )
+
+    session = factory.get_session_from_settings(settings)
+
+    adapter = session.get_adapter("https://")
+    assert isinstance(adapter, RecordReplayAdapter)
+    assert adapter.mode == "record"
+
+
+@pytest.fixture
+def key_file(tmp_path: Path, private_key: rsa.RSAPrivateKey) -> Iterator[Path]:
+    """Write the test key to a PEM file and clear the factory caches after."""
+    path = tmp_path / "key.pem"
+    path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+    )
+    yield path
+    factory.clear_cache()
+
+
+def test_get_private_key__same_file__parsed_once(
+    mocker: MockerFixture,
+    key_file: Path,
+) -> None:
+    """Test that a key is parsed again only when its file changes."""
+    load = mocker.spy(factory, "load_private_key_from_file")
+
+    first = factory.get_private_key(key_file)
+    assert factory.get_private_key(str(key_file)) is first
+    assert load.call_count == 1
+
+    stat = key_file.stat()
+    os.utime(key_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    factory.get_private_key(key_file)
+    assert load.call_count == 2
+    # only the latest version of the file is kept
+    assert list(factory._keys) == [str(key_file.resolve())]  # noqa: SLF001
+
+
+def test_get_kalshi__environment__client_memoized(
+    monkeypatch: pytest.MonkeyPatch,
+    key_file: Path,
+) -> None:
+    """Test that the environment's client is built once until cleared."""
+    monkeypatch.setenv("KALSHI_KEYS__KEY", "test")
+    monkeypatch.setenv("KALSHI_KEYS__KEY_FILE", str(key_file))
+
+    client = factory.get_kalshi()
+
+    assert factory.get_kalshi() is client
+    assert client.key_id == "test"
+
+    monkeypatch.setenv("KALSHI_KEYS__KEY", "other")
+    assert factory.get_kalshi() is client
+    factory.clear_cache()
+    assert factory.get_kalshi().key_id == "other"
@@ -0,0 +1,56 @@
+"""Tests that importing the package stays cheap."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("requests", "cryptography", "httpx", "pandas")
+
+
+def _loaded_after(statement: str) -> list[str]:
+    """Run ``statement`` in a fresh interpreter and list the heavy modules loaded."""
+    script = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    # the interpreter running the tests, on a script built from constants
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(out.stdout)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import kalshi_tracker.kalshi",
+        "import kalshi_tracker.config",
+        "from kalshi_tracker.kalshi.settings import KalshiKeySettings",
+    ],
+)
+def test_import__package__no_heavy_modules(statement: str) -> None:
+    """Test that the package imports without the HTTP and crypto libraries."""
+    assert _loaded_after(statement) == []
+
+
+def test_import__lazy_attribute__loaded_on_access() -> None:
+    """Test that the factory is imported when one of its functions is used."""
+    loaded = _loaded_after("from kalshi_tracker.kalshi import get_kalshi")
+
+    assert {"requests", "cryptography"} <= set(loaded)
+
+
+def test_getattr__unknown_name__raises() -> None:
+    """Test that unknown attributes still raise AttributeError."""
+    import kalshi_tracker.kalshi
+
+    with pytest.raises(AttributeError):
+        kalshi_tracker.kalshi.missing  # noqa: B018
+    assert "get_kalshi" in dir(kalshi_tracker.kalshi)
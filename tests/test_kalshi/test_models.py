@@ -0,0 +1,63 @@
+"""Tests for the typed API records."""
+
+import json
+
+from kalshi_tracker.kalshi.models import (
+    Market,
+    Position,
+    Trade,
+    decode_page,
+    iter_models,
+    to_cents,
+)
+from kalshi_tracker.kalshi.testing.fake_exchange import make_market, make_trade
+
+
+def test_to_cents__cents_and_dollars__converted() -> None:
+    """Test converting integer cents and dollar strings."""
+    assert to_cents(42) == 42
+    assert to_cents("0.4200") == 42
+    assert to_cents("1.00") == 100
+    assert to_cents("0.0350") == 4
+    assert to_cents("0.0450") == 4
+    assert to_cents(None) is None
+
+
+def test_to_cents__float_dollars__rounded() -> None:
+    """Test that dollars given as floats are not cut by their binary expansion."""
+    assert to_cents(0.29) == 29
+    assert to_cents(0.57) == 57
+    assert to_cents(1.005) == 100
+
+
+def test_decode_page__trades__typed_records() -> None:
+    """Test decoding a raw trades page into records with every field."""
+    trades = [make_trade(i, "FAKE-EVENT-00001") for i in range(3)]
+    raw = json.dumps({"trades": trades, "cursor": "abc"}).encode()
+
+    records = decode_page(raw, "trades")
+
+    assert [r.as_dict() for r in records] == trades
+    assert records[0] == Trade.from_dict(trades[0])
+    assert not hasattr(records[0], "__dict__")
+
+
+def test_from_dict__missing_and_dollar_fields__normalized() -> None:
+    """Test that missing fields are None and dollar prices become cents."""
+    market = make_market("FAKE-EVENT-00001")
+    del market["yes_bid"]
+    market["yes_bid_dollars"] = "0.3900"
+    market["unknown_field"] = "ignored"
+
+    (record,) = iter_models([market], Market)
+
+    assert record.yes_bid == 39
+    assert record.yes_ask == 42
+    assert record.title is None
+    assert record.previous_price is None
+
+    position = Position.from_dict(
+        {"ticker": "T", "position": -3, "market_exposure_dollars": "1.20"},
+    )
+    assert position.market_exposure == 120
+    assert position.position == -3
@@ -0,0 +1,98 @@
+"""Tests for the array-backed orderbook."""
+
+import numpy as np
+import pytest
+
+from kalshi_tracker.kalshi.orderbook import OrderBook
+
+
+@pytest.fixture
+def book() -> OrderBook:
+    """Build a book with yes bids at 38-40 and no bids at 55-57."""
+    return OrderBook.from_response(
+        {
+            "orderbook": {
+                "yes": [[38, 30], [39, 20], [40, 10]],
+                "no": [[55, 5], [56, 15], [57, 25]],
+            },
+        },
+        ticker="TEST",
+    )
+
+
+def test_from_response__top_of_book(book: OrderBook) -> None:
+    """Test best prices on both sides."""
+    assert book.best_bid("yes") == 40
+    assert book.best_ask("yes") == 43
+    assert book.best_bid("no") == 57
+    assert book.best_ask("no") == 60
+    assert book.spread == 3
+    assert book.mid == 41.5
+
+
+def test_from_response__empty_side__none() -> None:
+    """Test a book whose no side is missing."""
+    book = OrderBook.from_response({"orderbook": {"yes": [[10, 1]], "no": None}})
+
+    assert book.best_ask("yes") is None
+    assert book.spread is None
+
+
+def test_apply_delta__level_emptied__best_moves_down(book: OrderBook) -> None:
+    """Test that removing the best level exposes the next one."""
+    book.apply_delta("yes", 40, -10)
+    assert book.best_bid("yes") == 39
+
+    book.apply_delta("yes", 45, 3)
+    assert book.best_bid("yes") == 45
+    assert book.best_ask("no") == 55
+
+
+def test_apply_delta__negative_quantity__raises(book: OrderBook) -> None:
+    """Test that a delta cannot remove more than rests."""
+    with pytest.raises(ValueError, match="negative quantity"):
+        book.apply_delta("yes", 40, -11)
+    with pytest.raises(ValueError, match="outside 1-99 cents"):
+        book.apply_delta("yes", 100, 1)
+
+
+def test_depth__cumulative_from_best(book: OrderBook) -> None:
+    """Test cumulative depth by price."""
+    depth = book.depth("yes")
+
+    assert depth[40] == 10
+    assert depth[39] == 30
+    assert depth[1] == 60
+    assert depth[41] == 0
+
+
+def test_buy_vwap__walks_the_other_side(book: OrderBook) -> None:
+    """Test the average price of buying yes through the no bids."""
+    # yes asks: 43 x25, 44 x15, 45 x5
+    price, filled = book.buy_vwap("yes", 30)
+
+    assert filled == 30
+    assert price == pytest.approx((43 * 25 + 44 * 5) / 30)
+    assert book.buy_vwap("yes", 100) == (
+        pytest.approx((43 * 25 + 44 * 15 + 45 * 5) / 45),
+        45,
+    )
+    assert book.fillable("yes", 44) == 40
+
+
+def test_sell_vwap__walks_own_bids(book: OrderBook) -> None:
+    """Test the average price of selling yes into the yes bids."""
+    price, filled = book.sell_vwap("yes", 15)
+
+    assert filled == 15
+    assert price == pytest.approx((40 * 10 + 39 * 5) / 15)
+    assert OrderBook().sell_vwap("yes", 1) == (None, 0)
+
+
+def test_apply_snapshot__replaces_book(book: OrderBook) -> None:
+    """Test that a snapshot clears previous levels."""
+    book.apply_snapshot([[20, 1]], [])
+
+    assert book.to_dict() == {"yes": [[20, 1]], "no": []}
+    assert book.best_bid("no") is None
+    assert np.count_nonzero(book.levels["no"]) == 0
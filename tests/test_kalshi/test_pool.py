@@ -0,0 +1,110 @@
+"""Tests for the multi-account client pool."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi import factory
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.pool import ClientPool
+from kalshi_tracker.kalshi.settings import KalshiKeySettings
+from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+@pytest.fixture
+def key_file(tmp_path: Path, private_key: rsa.RSAPrivateKey) -> Iterator[Path]:
+    """Write the test key to a PEM file and clear the factory caches after."""
+    path = tmp_path / "key.pem"
+    path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+    )
+    yield path
+    factory.clear_cache()
+
+
+@pytest.fixture
+def pool(fake_exchange: FakeExchange, private_key: rsa.RSAPrivateKey) -> ClientPool:
+    """Get a pool of three accounts on the fake exchange."""
+    clients = {}
+    for name in ("alpha", "beta", "gamma"):
+        client = ExchangeClient(fake_exchange.url, name, private_key)
+        client.rate_limiter = None
+        clients[name] = client
+    return ClientPool(clients)
+
+
+def test_from_settings__several_keys__shared_session_own_budgets(
+    key_file: Path,
+) -> None:
+    """Test that the accounts share a session but not a rate limiter."""
+    settings = [
+        KalshiKeySettings(key="pool-a", key_file=str(key_file), pool_maxsize=4),
+        KalshiKeySettings(
+            key="pool-b",
+            key_file=str(key_file),
+            name="hedge",
+            pool_maxsize=16,
+        ),
+    ]
+
+    pool = ClientPool.from_settings(settings)
+
+    assert list(pool) == ["pool-a", "hedge"]
+    first, second = pool["pool-a"], pool["hedge"]
+    assert first.session is second.session
+    assert first.rate_limiter is not second.rate_limiter
+    assert (
+        first.session.get_adapter("https://").poolmanager.connection_pool_kw["maxsize"]
+        == 16
+    )
+
+
+def test_from_settings__duplicate_names__raises(key_file: Path) -> None:
+    """Test that two accounts cannot share a name."""
+    settings = [
+        KalshiKeySettings(key="pool-a", key_file=str(key_file), name="main"),
+        KalshiKeySettings(key="pool-b", key_file=str(key_file), name="main"),
+    ]
+
+    with pytest.raises(ValueError, match="main"):
+        ClientPool.from_settings(settings)
+
+
+def test_get_balance__accounts__keyed_by_account(pool: ClientPool) -> None:
+    """Test that balances are collected per account."""
+    assert pool.get_balance() == {"alpha": 100_000, "beta": 100_000, "gamma": 100_000}
+
+
+def test_get_positions__accounts__merged_and_tagged(
+    pool: ClientPool,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that every account's positions are merged and tagged."""
+    positions = pool.get_positions()
+
+    assert len(positions) == 3 * len(fake_exchange.positions)
+    assert [p["account"] for p in positions[:: len(fake_exchange.positions)]] == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+    assert "account" not in fake_exchange.positions[0]
+
+
+def test_map__one_account_fails__raises(pool: ClientPool) -> None:
+    """Test that a failure in any account is raised."""
+
+    def fail_beta(client: ExchangeClient) -> str:
+        if client.key_id == "beta":
+            raise RuntimeError("beta failed")
+        return client.key_id
+
+    with pytest.raises(RuntimeError, match="beta failed"):
+        pool.map(fail_beta)
@@ -0,0 +1,156 @@
+"""Tests for the portfolio valuator."""
+
+import time
+
+import numpy as np
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.portfolio import PortfolioValuator
+from kalshi_tracker.kalshi.testing import FakeExchange
+from kalshi_tracker.v1.expected_value import compute_wager_expectations
+
+
+def _random_book(n: int, seed: int = 0) -> PortfolioValuator:
+    rng = np.random.default_rng(seed)
+    valuator = PortfolioValuator(capacity=16)
+    valuator.load_positions(
+        {
+            "ticker": f"T-{i}",
+            "position": int(rng.choice([-1, 1]) * rng.integers(1, 50)),
+            "market_exposure": int(rng.integers(100, 2000)),
+            "realized_pnl": 0,
+        }
+        for i in range(n)
+    )
+    for i in range(n):
+        valuator.update_price(f"T-{i}", int(rng.integers(1, 99)))
+        valuator.update_probability(f"T-{i}", float(rng.uniform(0.05, 0.95)))
+    return valuator
+
+
+def test_update_price__incremental_totals__match_revalue() -> None:
+    """Test that per-tick totals agree with a full revaluation."""
+    valuator = _random_book(1000)
+    rng = np.random.default_rng(1)
+    for _ in range(5000):
+        valuator.update_price(f"T-{rng.integers(1000)}", int(rng.integers(1, 99)))
+
+    totals = (
+        valuator.total_value,
+        valuator.total_market_payout,
+        valuator.total_my_payout,
+        valuator.total_exposure,
+    )
+    valuator.revalue()
+
+    assert totals == pytest.approx(
+        (
+            valuator.total_value,
+            valuator.total_market_payout,
+            valuator.total_my_payout,
+            valuator.total_exposure,
+        ),
+    )
+    assert len(valuator) == 1000
+
+
+def test_update_price__thousand_positions__microseconds() -> None:
+    """Test that one tick on a 1,000 position book is cheap."""
+    valuator = _random_book(1000)
+    n = 10_000
+
+    start = time.perf_counter()
+    for i in range(n):
+        valuator.update_price(f"T-{i % 1000}", 1 + i % 98)
+    per_tick = (time.perf_counter() - start) / n
+
+    assert per_tick < 100e-6
+
+
+def test_apply_fill__buys_and_sells__average_cost() -> None:
+    """Test fills opening, reducing and flipping a position."""
+    valuator = PortfolioValuator()
+    fill = {"ticker": "T", "count": 10, "side": "yes", "action": "buy"}
+    valuator.apply_fill({**fill, "yes_price": 40, "no_price": 60})
+    valuator.apply_fill({**fill, "yes_price": 50, "no_price": 50})
+    assert valuator.position[0] == 20
+    assert valuator.total_exposure == 900
+
+    # sell 5 yes at 60 against an average cost of 45
+    valuator.apply_fill({**fill, "count": 5, "action": "sell", "yes_price": 60})
+    assert valuator.position[0] == 15
+    assert valuator.total_exposure == 675
+    assert valuator.total_realized == 75
+
+    # buying 20 no closes the 15 yes at 100 - 30 and opens 5 no at 30
+    valuator.apply_fill({**fill, "count": 20, "side": "no", "no_price": 30})
+    assert valuator.position[0] == -5
+    assert valuator.total_exposure == 150
+    assert valuator.total_realized == 75 + 15 * 70 - 675
+
+    valuator.update_price("T", 60)
+    assert valuator.total_value == 5 * 40
+    assert valuator.unrealized_pnl == 200 - 150
+
+
+def test_wager_inputs__open_positions__feed_expectations() -> None:
+    """Test the compute_wager_expectations inputs and expected profit."""
+    valuator = _random_book(50)
+    valuator.load_positions([{"ticker": "T-0", "position": 0, "market_exposure": 0}])
+
+    ps, prices, qtys = valuator.wager_inputs(mine=True)
+    expected_value, _ = compute_wager_expectations(ps, prices, qtys)
+
+    assert len(ps) == 49
+    assert expected_value == pytest.approx(valuator.expected_profit(mine=True) / 100)
+    frame = valuator.to_frame()
+    assert frame.unrealized_pnl.sum() == pytest.approx(valuator.unrealized_pnl / 100)
+
+
+def test_from_client__fake_exchange__loads_book(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test loading positions and prices from the exchange."""
+    client = ExchangeClient(fake_exchange.url, "key", private_key)
+    client.rate_limiter = None
+
+    valuator = PortfolioValuator.from_client(client)
+
+    assert len(valuator) == len(fake_exchange.markets)
+    # 10 yes contracts marked at a last price of 41 each
+    assert valuator.total_value == 10 * 41 * len(fake_exchange.markets)
+    assert valuator.total_exposure == 400 * len(fake_exchange.markets)
+
+
+def test_from_client__never_traded__marked_at_mid(
+    private_key: rsa.RSAPrivateKey,
+    fake_exchange: FakeExchange,
+) -> None:
+    """Test that a market without a last price is marked at its bid/ask mid."""
+    fake_exchange.markets[0]["last_price"] = 0
+    client = ExchangeClient(fake_exchange.url, "key", private_key)
+    client.rate_limiter = None
+
+    valuator = PortfolioValuator.from_client(client)
+
+    ticker = fake_exchange.markets[0]["ticker"]
+    assert valuator.yes_price[valuator.slot(ticker)] == 41
+    fake_exchange.markets[1]["last_price"] = 0
+    fake_exchange.markets[1]["yes_bid"] = 30
+    valuator = PortfolioValuator.from_client(client)
+    assert valuator.yes_price[valuator.slot(fake_exchange.markets[1]["ticker"])] == 36
+
+
+def test_slot__zero_capacity__grows() -> None:
+    """Test that tickers can be added to a portfolio made with no capacity."""
+    valuator = PortfolioValuator(capacity=0)
+
+    slots = [valuator.slot(f"T-{i}") for i in range(3)]
+    valuator.update_price("T-2", 40)
+
+    assert slots == [0, 1, 2]
+    assert len(valuator.position) == 4
+    assert np.isnan(valuator.yes_price[3])
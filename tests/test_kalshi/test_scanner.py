@@ -0,0 +1,90 @@
+"""Tests for the +EV market scanner."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+
+from kalshi_tracker.kalshi import scanner
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.columns import build_frame
+from kalshi_tracker.kalshi.orderbook import OrderBook
+from kalshi_tracker.kalshi.testing.fake_exchange import make_market
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from pytest_mock import MockerFixture
+
+    from kalshi_tracker.kalshi.testing import FakeExchange
+
+
+def predictions(bets: dict[str, float]) -> pd.DataFrame:
+    """Build a prediction table of yes probabilities by ticker."""
+    return pd.DataFrame({"symbol": list(bets), "myBet": list(bets.values())})
+
+
+def test_find_edges__both_sides__best_side_over_min_edge() -> None:
+    """Test that each market gets its better side and small edges are dropped."""
+    markets = build_frame([make_market(t) for t in ("A-1", "B-1", "C-1")], "markets")
+
+    edges = scanner.find_edges(
+        markets,
+        predictions({"A-1": 0.5, "B-1": 0.3, "C-1": 0.44, "D-1": 0.9}),
+    )
+
+    assert edges["ticker"].tolist() == ["B-1", "A-1"]
+    assert edges["side"].tolist() == ["no", "yes"]
+    assert edges["mktp"].tolist() == pytest.approx([0.6, 0.42])
+    assert edges["expected_value"].tolist() == pytest.approx([0.1, 0.08])
+
+
+def test_find_edges__no_offers__skipped() -> None:
+    """Test that a side with nothing offered has no edge."""
+    market = {**make_market("A-1"), "yes_ask": 100, "no_ask": 0}
+    markets = build_frame([market], "markets")
+
+    assert scanner.find_edges(markets, predictions({"A-1": 0.99})).empty
+
+
+def test_add_depth__book__fill_within_limit() -> None:
+    """Test that only the levels keeping the edge are taken."""
+    edges = pd.DataFrame({"ticker": ["A-1"], "side": ["yes"], "myp": [0.5]})
+    book = OrderBook.from_response(
+        {"orderbook": {"yes": [], "no": [[p, 100] for p in range(48, 59)]}},
+    )
+
+    depth = scanner.add_depth(edges, {"A-1": book})
+    capped = scanner.add_depth(edges, {"A-1": book}, max_size=150)
+
+    # yes asks 42 to 45 cents are below 50 - 4
+    assert depth.loc[0, "limit"] == pytest.approx(0.45)
+    assert depth.loc[0, "fillable"] == 400
+    assert depth.loc[0, "fill_price"] == pytest.approx(0.435)
+    assert depth.loc[0, "expected_profit"] == pytest.approx(26.0)
+    assert capped.loc[0, "size"] == 150
+    assert capped.loc[0, "fill_price"] == pytest.approx((42 * 100 + 43 * 50) / 15000)
+
+
+def test_scan__fake_exchange__books_fetched_for_candidates_only(
+    mocker: MockerFixture,
+    fake_exchange: FakeExchange,
+    private_key: rsa.RSAPrivateKey,
+) -> None:
+    """Test that the scan walks the books of the candidates only."""
+    client = ExchangeClient(fake_exchange.url, "test", private_key)
+    client.rate_limiter = None
+    tickers = [m["ticker"] for m in fake_exchange.markets]
+    get_orderbook = mocker.spy(client, "get_orderbook")
+
+    result = scanner.scan(
+        client,
+        predictions({tickers[0]: 0.5, tickers[1]: 0.3, tickers[2]: 0.45}),
+    )
+
+    assert get_orderbook.call_count == 2
+    assert result["ticker"].tolist() == [tickers[1], tickers[0]]
+    # no asks 60 to 65 cents are below 70 - 4
+    assert result.loc[0, "fillable"] == 600
+    assert result.loc[0, "expected_profit"] == pytest.approx(600 * (0.7 - 0.625))
@@ -0,0 +1,149 @@
+"""Tests for the Parquet trade archive."""
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.testing import FakeExchange
+from kalshi_tracker.kalshi.testing.fake_exchange import TRADES_START_TS, make_trade
+from kalshi_tracker.storage.archive import TradeArchive
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    """Create an RSA key to sign requests with."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def exchange() -> Iterator[FakeExchange]:
+    """Run a small local exchange with trades spanning two days."""
+    with FakeExchange(n_markets=4, n_trades=2000) as exchange:
+        yield exchange
+
+
+@pytest.fixture
+def client(exchange: FakeExchange, private_key: rsa.RSAPrivateKey) -> ExchangeClient:
+    """Create a client for the local exchange without rate limiting."""
+    client = ExchangeClient(exchange.url, "key", private_key)
+    client.rate_limiter = None
+    return client
+
+
+def add_trades(exchange: FakeExchange, n: int) -> None:
+    """Append ``n`` new trades to the exchange."""
+    start = len(exchange.trades)
+    for i in range(start, start + n):
+        ticker = exchange.markets[i % len(exchange.markets)]["ticker"]
+        exchange.trades.append(make_trade(i, ticker))
+        exchange.trade_ts.append(TRADES_START_TS + 60 * i)
+
+
+def test_sync_trades__resync__only_new_rows(
+    tmp_path: Path,
+    exchange: FakeExchange,
+    client: ExchangeClient,
+) -> None:
+    """Test that a second sync resumes from the checkpoints."""
+    tickers = [m["ticker"] for m in exchange.markets]
+    archive = TradeArchive(tmp_path)
+
+    assert sum(archive.sync_trades(client, tickers, page_size=200).values()) == 2000
+
+    add_trades(exchange, 40)
+    # a fresh archive object resumes from the checkpoint file
+    archive = TradeArchive(tmp_path)
+    requests_before = exchange.requests
+    assert archive.sync_trades(client, tickers) == dict.fromkeys(tickers, 10)
+    assert exchange.requests - requests_before == len(tickers)
+
+    trades = archive.read_trades()
+    assert len(trades) == 2040
+    assert trades["trade_id"].is_unique
+    assert trades["ts"].is_monotonic_increasing
+    assert {p.name for p in (tmp_path / "trades" / "series=FAKE").iterdir()} == {
+        "date=2023-11-14",
+        "date=2023-11-15",
+        "date=2023-11-16",
+    }
+
+
+def test_sync_trades__stopped_after_flush__resume_archives_rest(
+    tmp_path: Path,
+    private_key: rsa.RSAPrivateKey,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a sync stopped mid-ticker loses and repeats no trades."""
+    with FakeExchange(n_markets=1, n_trades=50) as exchange:
+        client = ExchangeClient(exchange.url, "key", private_key)
+        client.rate_limiter = None
+        ticker = exchange.markets[0]["ticker"]
+        iter_trades = client.iter_trades
+
+        def stopping(**kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+            for i, trade in enumerate(iter_trades(**kwargs)):
+                if i == 25:
+                    raise KeyboardInterrupt
+                yield trade
+
+        monkeypatch.setattr(client, "iter_trades", stopping)
+        with pytest.raises(KeyboardInterrupt):
+            TradeArchive(tmp_path, batch_rows=20).sync_trades(client, [ticker])
+        monkeypatch.undo()
+
+        archive = TradeArchive(tmp_path, batch_rows=20)
+        assert len(archive.read_trades()) == 20
+        assert archive.sync_trades(client, [ticker]) == {ticker: 30}
+        assert archive.sync_trades(client, [ticker]) == {ticker: 0}
+
+    trades = archive.read_trades()
+    assert len(trades) == 50
+    assert trades["trade_id"].is_unique
+
+
+def test_sync_market_history__resync__only_new_rows(
+    tmp_path: Path,
+    exchange: FakeExchange,
+    client: ExchangeClient,
+) -> None:
+    """Test that history resumes after the last archived timestamp."""
+    ticker = exchange.markets[0]["ticker"]
+    archive = TradeArchive(tmp_path, batch_rows=100)
+
+    assert archive.sync_market_history(client, [ticker]) == {ticker: 500}
+    add_trades(exchange, 8)
+    assert archive.sync_market_history(client, [ticker]) == {ticker: 2}
+    assert archive.sync_market_history(client, [ticker]) == {ticker: 0}
+
+    history = archive.read_market_history(ticker)
+    assert len(history) == 502
+    assert history["ts"].is_unique
+
+
+def test_read_trades__filters__pushed_down(
+    tmp_path: Path,
+    exchange: FakeExchange,
+    client: ExchangeClient,
+) -> None:
+    """Test reading one ticker over a date range and a column subset."""
+    ticker = exchange.markets[1]["ticker"]
+    archive = TradeArchive(tmp_path)
+    archive.sync_trades(client, [m["ticker"] for m in exchange.markets])
+
+    day = date(2023, 11, 15)
+    trades = archive.read_trades(ticker, start=day, end=day)
+    assert set(trades["ticker"]) == {ticker}
+    assert len(trades) == 360
+    assert trades["ts"].between(1_700_006_400, 1_700_092_800).all()
+
+    prices = archive.read_trades(ticker, columns=["ts", "yes_price"])
+    assert list(prices.columns) == ["ts", "yes_price"]
+    assert len(prices) == 500
+
+    assert archive.read_trades("OTHER-MARKET").empty
+    assert TradeArchive(tmp_path / "empty").read_trades().empty
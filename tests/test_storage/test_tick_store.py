@@ -0,0 +1,120 @@
+"""Tests for the memory-mapped tick store."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from kalshi_tracker.kalshi.client.exchange_client import ExchangeClient
+from kalshi_tracker.kalshi.testing import FakeExchange
+from kalshi_tracker.kalshi.testing.fake_exchange import TRADES_START_TS, make_trade
+from kalshi_tracker.storage.tick_store import DTYPES, TickStore, id_hash
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    """Create an RSA key to sign requests with."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def exchange() -> Iterator[FakeExchange]:
+    """Run a small local exchange."""
+    with FakeExchange(n_markets=2, n_trades=1000) as exchange:
+        yield exchange
+
+
+@pytest.fixture
+def client(exchange: FakeExchange, private_key: rsa.RSAPrivateKey) -> ExchangeClient:
+    """Create a client for the local exchange without rate limiting."""
+    client = ExchangeClient(exchange.url, "key", private_key)
+    client.rate_limiter = None
+    return client
+
+
+def test_sync_trades__resync__appends_new_ticks(
+    tmp_path: Path,
+    exchange: FakeExchange,
+    client: ExchangeClient,
+) -> None:
+    """Test that a resync appends only trades after the last tick."""
+    ticker = exchange.markets[0]["ticker"]
+    store = TickStore(tmp_path)
+
+    assert store.sync_trades(client, [ticker], page_size=100) == {ticker: 500}
+
+    # another trade prints in the last stored second, plus a later one
+    assert store.last("trades", ticker)["ts"] == TRADES_START_TS + 60 * 998
+    late = {**make_trade(998, ticker), "trade_id": "late"}
+    exchange.trades.append(late)
+    exchange.trade_ts.append(TRADES_START_TS + 60 * 998)
+    exchange.trades.append(make_trade(1000, ticker))
+    exchange.trade_ts.append(TRADES_START_TS + 60 * 1000)
+
+    assert store.sync_trades(client, [ticker]) == {ticker: 2}
+    assert store.sync_trades(client, [ticker]) == {ticker: 0}
+
+    ticks = store.read("trades", ticker)
+    assert len(ticks) == 502
+    assert len(np.unique(ticks["id_hash"])) == 502
+    assert id_hash("late") in ticks["id_hash"]
+    assert np.all(np.diff(ticks["ts"]) >= 0)
+    assert store.tickers("trades") == [ticker]
+
+
+def test_read__time_range__zero_copy_slice(
+    tmp_path: Path,
+    exchange: FakeExchange,
+    client: ExchangeClient,
+) -> None:
+    """Test that range reads are views of the mapped file."""
+    ticker = exchange.markets[1]["ticker"]
+    store = TickStore(tmp_path)
+    store.sync_market_history(client, [ticker])
+
+    start, end = TRADES_START_TS + 60 * 101, TRADES_START_TS + 60 * 201
+    ticks = store.read("history", ticker, start=start, end=end)
+
+    assert ticks["ts"][0] == start
+    assert ticks["ts"][-1] == end
+    assert len(ticks) == 51
+    assert isinstance(ticks, np.memmap)
+    assert not ticks.flags.writeable
+    assert len(store.read("history", ticker, start=end + 10**6)) == 0
+    assert len(store.read("history", "MISSING")) == 0
+
+
+def test_append__out_of_order__rejected(tmp_path: Path) -> None:
+    """Test that ticks older than the stored ones are refused."""
+    store = TickStore(tmp_path)
+    ticks = np.zeros(3, dtype=DTYPES["trades"])
+    ticks["ts"] = [10, 20, 30]
+    store.append("trades", "T", ticks)
+
+    with pytest.raises(ValueError, match="older"):
+        store.append("trades", "T", ticks[:1])
+    with pytest.raises(ValueError, match="sorted"):
+        store.append("trades", "T", ticks[::-1])
+    with pytest.raises(ValueError, match="dtype"):
+        store.append("trades", "T", np.zeros(1, dtype=DTYPES["history"]))
+    assert len(store.read("trades", "T")) == 3
+
+
+def test_append__partial_trailing_record__cut_off(tmp_path: Path) -> None:
+    """Test that an interrupted append does not shift later records."""
+    store = TickStore(tmp_path)
+    ticks = np.zeros(3, dtype=DTYPES["trades"])
+    ticks["ts"] = [10, 20, 30]
+    ticks["price"] = [41, 42, 43]
+    store.append("trades", "T", ticks[:2])
+    with store.path("trades", "T").open("ab") as file:
+        file.write(ticks[2:].tobytes()[:5])
+
+    assert len(store.read("trades", "T")) == 2
+    store.append("trades", "T", ticks[2:])
+
+    stored = store.read("trades", "T")
+    assert stored["ts"].tolist() == [10, 20, 30]
+    assert stored["price"].tolist() == [41, 42, 43]
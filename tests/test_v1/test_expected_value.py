@@ -0,0 +1,169 @@
+"""Tests for the expected value calculations."""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kalshi_tracker.v1.expected_value import (
+    LatestBets,
+    compute_situation_expectations,
+    compute_wager_expectations,
+    prep_prices_csv,
+)
+
+
+def _enumerated_situations(ps, prices, qtys):
+    """Build the situations table by enumerating every outcome."""
+    qs = 1 - ps
+    pays = qtys - prices
+    rows = []
+    for i in range(len(ps) + 1):
+        situation_p, situation_exp = compute_situation_expectations(
+            ps,
+            qs,
+            prices,
+            pays,
+            i,
+        )
+        rows.append(
+            {
+                "hits": i,
+                "hit_percent": i / len(ps),
+                "hits_p": situation_p,
+                "hits_exp": situation_exp,
+            },
+        )
+    return pd.DataFrame.from_records(rows)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 9])
+def test_compute_wager_expectations__small_book__matches_enumeration(n: int) -> None:
+    """Test the recurrence against brute force enumeration."""
+    rng = np.random.default_rng(n)
+    ps = rng.uniform(0.05, 0.95, n)
+    qtys = rng.integers(1, 20, n).astype(float)
+    prices = qtys * rng.uniform(0.05, 0.95, n)
+
+    expected_value, situations = compute_wager_expectations(ps, prices, qtys)
+    expected = _enumerated_situations(ps, prices, qtys)
+
+    pd.testing.assert_frame_equal(situations, expected, check_dtype=False)
+    assert expected_value == pytest.approx(
+        (expected.hits_p * expected.hits_exp).sum(),
+    )
+
+
+def test_compute_wager_expectations__series_input__accepted() -> None:
+    """Test that pandas series inputs work like arrays."""
+    ps = pd.Series([0.2, 0.7, 0.5])
+    prices = pd.Series([0.4, 1.2, 2.5])
+    qtys = pd.Series([2, 2, 5])
+
+    expected_value, situations = compute_wager_expectations(ps, prices, qtys)
+
+    assert situations.hits_p.sum() == pytest.approx(1)
+    assert expected_value == pytest.approx((ps * qtys - prices).sum())
+
+
+def test_compute_wager_expectations__large_book__is_fast() -> None:
+    """Test that a 500 position book is valued quickly."""
+    rng = np.random.default_rng(0)
+    n = 500
+    ps = rng.uniform(0.05, 0.95, n)
+    qtys = rng.integers(1, 20, n).astype(float)
+    prices = qtys * rng.uniform(0.05, 0.95, n)
+
+    start = time.perf_counter()
+    expected_value, situations = compute_wager_expectations(ps, prices, qtys)
+    elapsed = time.perf_counter() - start
+
+    assert len(situations) == n + 1
+    assert situations.hits_p.sum() == pytest.approx(1)
+    assert expected_value == pytest.approx((ps * qtys - prices).sum())
+    assert elapsed < 1
+
+
+def _prediction_log(n: int, seed: int = 0) -> pd.DataFrame:
+    """Build a prediction log like ``predsnprices.csv``."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "symbol": rng.choice([f"sym{i}" for i in range(40)], n),
+            "date": rng.choice([20240101 + i for i in range(20)], n),
+            "yesPrice": rng.integers(1, 99, n),
+            "noPrice": rng.integers(1, 99, n),
+            "myBet": np.where(rng.random(n) < 0.3, np.nan, rng.integers(1, 99, n)),
+        },
+    )
+
+
+def test_prep_prices_csv__latest_bets__sides_and_values() -> None:
+    """Test the latest bet per symbol and its expected value."""
+    p = pd.DataFrame(
+        {
+            "symbol": ["abc", "abc", "abc", "xyz"],
+            "date": [20240101, 20240102, 20240103, 20240102],
+            "yesPrice": [40, 45, 50, 70],
+            "noPrice": [62, 57, 52, 32],
+            "myBet": [60, 55, np.nan, 20],
+        },
+    )
+
+    p, latest_p = prep_prices_csv(p)
+
+    assert p.symbol.tolist() == ["ABC", "ABC", "ABC", "XYZ"]
+    assert latest_p.index.tolist() == [1, 3]
+    assert latest_p.buyYes.tolist() == [True, False]
+    np.testing.assert_allclose(latest_p.mktp, [0.45, 0.32])
+    np.testing.assert_allclose(latest_p.myp, [0.55, 0.80])
+    np.testing.assert_allclose(
+        latest_p.expected_value,
+        [0.55 * 0.55 - 0.45 * 0.45, 0.80 * 0.68 - 0.20 * 0.32],
+    )
+
+
+def test_latest_bets__chunked_and_appended__match_prep_prices_csv(
+    tmp_path: Path,
+) -> None:
+    """Test that incremental reads build the same table as a full read."""
+    log = _prediction_log(5000)
+    path, state_path = tmp_path / "preds.csv", tmp_path / "state.parquet"
+    _, expected = prep_prices_csv(log.copy())
+
+    log[:1800].to_csv(path, index=False)
+    LatestBets.load(state_path).read_csv(path, chunksize=500).save(state_path)
+    log[1800:].to_csv(path, mode="a", header=False, index=False)
+    state = LatestBets.load(state_path).read_csv(path, chunksize=500)
+
+    assert state.rows_read == 5000
+    pd.testing.assert_frame_equal(
+        state.latest().drop(columns="age"),
+        expected.drop(columns="age"),
+    )
+    # nothing new to read
+    assert state.read_csv(path).rows_read == 5000
+
+
+def test_latest_bets__partial_last_line__read_once_complete(tmp_path: Path) -> None:
+    """Test that a line still being written is read only once it is complete."""
+    log = _prediction_log(10)
+    path = tmp_path / "preds.csv"
+    text = log.to_csv(index=False)
+    cut = text.rfind(",") + 1
+
+    path.write_text(text[:cut])
+    state = LatestBets().read_csv(path)
+    assert state.rows_read == 9
+    with path.open("a") as f:
+        f.write(text[cut:])
+    state.read_csv(path)
+
+    _, expected = prep_prices_csv(log.copy())
+    assert state.rows_read == 10
+    pd.testing.assert_frame_equal(
+        state.latest().drop(columns="age"),
+        expected.drop(columns="age"),
+    )
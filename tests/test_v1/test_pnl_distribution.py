@@ -0,0 +1,116 @@
+"""Tests for the P&L distribution engine."""
+
+from __future__ import annotations
+
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from kalshi_tracker.v1.expected_value import compute_wager_expectations
+from kalshi_tracker.v1.pnl_distribution import compute_pnl_distribution
+
+
+def _independent_pmf(
+    ps: np.ndarray,
+    prices: np.ndarray,
+    qtys: np.ndarray,
+) -> dict[int, float]:
+    """Enumerate the P&L of independent positions in cents."""
+    pmf: dict[int, float] = {}
+    for hits in itertools.product([False, True], repeat=len(ps)):
+        p = np.prod([pi if h else 1 - pi for pi, h in zip(ps, hits)])
+        pnl = sum(
+            round((q - c) * 100) if h else -round(c * 100)
+            for q, c, h in zip(qtys, prices, hits)
+        )
+        pmf[pnl] = pmf.get(pnl, 0) + p
+    return pmf
+
+
+def test_compute_pnl_distribution__independent_events__matches_enumeration() -> None:
+    """Test separate events against brute force enumeration."""
+    rng = np.random.default_rng(1)
+    n = 8
+    ps = rng.uniform(0.05, 0.95, n)
+    qtys = rng.integers(1, 20, n).astype(float)
+    prices = np.round(qtys * rng.uniform(0.05, 0.95, n), 2)
+
+    dist = compute_pnl_distribution(ps, prices, qtys, events=np.arange(n))
+    frame = dist.to_frame()
+    expected = _independent_pmf(ps, prices, qtys)
+
+    got = dict(zip(np.rint(frame.pnl * 100).astype(int), frame.p))
+    assert got.keys() == expected.keys()
+    for pnl, p in expected.items():
+        assert got[pnl] == pytest.approx(p, abs=1e-12)
+
+
+def test_compute_pnl_distribution__independent_events__matches_wager_ev() -> None:
+    """Test the mean against compute_wager_expectations."""
+    rng = np.random.default_rng(2)
+    n = 200
+    ps = rng.uniform(0.05, 0.95, n)
+    qtys = rng.integers(1, 20, n).astype(float)
+    prices = np.round(qtys * rng.uniform(0.05, 0.95, n), 2)
+
+    dist = compute_pnl_distribution(ps, prices, qtys, events=np.arange(n))
+    expected_value, _ = compute_wager_expectations(ps, prices, qtys)
+
+    assert dist.pmf.sum() == pytest.approx(1)
+    assert dist.mean() == pytest.approx(expected_value)
+
+
+def test_compute_pnl_distribution__mutually_exclusive_event__at_most_one_hit() -> None:
+    """Test that positions in one event never pay out together."""
+    ps = [0.5, 0.3]
+    prices = [0.4, 0.2]
+    qtys = [1, 2]
+
+    dist = compute_pnl_distribution(ps, prices, qtys, events=["EV", "EV"])
+    got = dict(zip(np.rint(dist.to_frame().pnl * 100).astype(int), dist.to_frame().p))
+
+    assert got == pytest.approx({40: 0.5, 140: 0.3, -60: 0.2})
+    assert dist.prob_loss() == pytest.approx(0.2)
+    assert dist.value_at_risk(0.9) == pytest.approx(0.6)
+    assert dist.quantile(0.5) == pytest.approx(0.4)
+
+
+def test_compute_pnl_distribution__no_position__hits_unless_market_wins() -> None:
+    """Test a no position inside a mutually exclusive event."""
+    # yes on market A (p=0.5), no on market B (B resolves yes with p=0.3)
+    dist = compute_pnl_distribution(
+        [0.5, 0.7],
+        [0.4, 0.6],
+        [1, 1],
+        events=["EV", "EV"],
+        is_yes=[True, False],
+    )
+    got = dict(zip(np.rint(dist.to_frame().pnl * 100).astype(int), dist.to_frame().p))
+
+    assert got == pytest.approx({100: 0.5, -100: 0.3, -0: 0.2})
+
+
+def test_compute_pnl_distribution__impossible_event__raises_value_error() -> None:
+    """Test exclusive markets with probabilities summing above one."""
+    with pytest.raises(ValueError, match="sum to more than one"):
+        compute_pnl_distribution([0.6, 0.6], [0.5, 0.5], [1, 1], events=["EV", "EV"])
+
+
+def test_compute_pnl_distribution__large_book__is_fast() -> None:
+    """Test that thousands of positions are combined quickly."""
+    rng = np.random.default_rng(3)
+    n = 5000
+    events = rng.integers(0, 2000, n)
+    qtys = rng.integers(1, 100, n).astype(float)
+    ps = rng.uniform(0.01, 0.08, n)
+    prices = np.round(qtys * rng.uniform(0.01, 0.2, n), 2)
+
+    start = time.perf_counter()
+    dist = compute_pnl_distribution(ps, prices, qtys, events)
+    elapsed = time.perf_counter() - start
+
+    assert dist.pmf.sum() == pytest.approx(1)
+    assert dist.mean() == pytest.approx((ps * qtys - prices).sum(), rel=1e-6)
+    assert elapsed < 1